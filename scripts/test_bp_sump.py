@@ -165,22 +165,22 @@ def test_sump_protocol(binary_port: str) -> bool:
         print(f"\n[+] Capture complete!")
         print(f"    Channels: {capture.channels}")
         print(f"    Sample rate: {capture.sample_rate/1e6:.1f}MHz")
-        print(f"    Samples: {len(capture.samples[0]) if capture.samples else 0}")
+        print(f"    Samples: {capture.samples.shape[-1]}")
         print(f"    Raw data: {len(capture.raw_data)} bytes")
 
-        if capture.samples and len(capture.samples[0]) > 0:
+        if capture.samples.shape[-1] > 0:
             # Show first few samples per channel
             print("\n    First 20 samples per channel:")
             for ch in range(min(4, capture.channels)):
-                samples = capture.samples[ch][:20]
+                samples = (capture.samples[:20] >> ch) & 1
                 pattern = ''.join(['█' if s else '░' for s in samples])
                 print(f"    CH{ch}: {pattern}")
 
             # Check for any activity
             print("\n    Channel activity:")
             for ch in range(capture.channels):
-                samples = capture.samples[ch]
-                ones = sum(samples)
+                samples = (capture.samples >> ch) & 1
+                ones = int(samples.sum())
                 total = len(samples)
                 if ones == 0:
                     print(f"    CH{ch}: LOW (always 0)")
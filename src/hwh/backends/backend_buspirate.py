@@ -2167,7 +2167,10 @@ class BusPirateBackend(BusBackend, GPIOBackend):
         channels: int = 8,
         trigger_channel: int | None = None,
         trigger_edge: str = "rising",
-        timeout: float = 10.0
+        timeout: float = 10.0,
+        out: Any = None,
+        stop_event: Any = None,
+        progress: Any = None
     ) -> dict | None:
         """
         Capture logic analyzer data using SUMP protocol.
@@ -2183,15 +2186,23 @@ class BusPirateBackend(BusBackend, GPIOBackend):
             trigger_channel: Channel to trigger on (None for immediate)
             trigger_edge: "rising" or "falling"
             timeout: Capture timeout in seconds
+            out: Optional writable uint8 buffer of at least sample_count
+                bytes (8 channels). The device data is read straight into
+                it and 'samples' is returned as a view over it, so no
+                buffer is allocated during the capture.
+            stop_event: Optional threading.Event; when set the capture is
+                abandoned and None is returned (with out=)
+            progress: Optional callable invoked with the running byte count
+                after each chunk lands in out (called from this thread)
 
         Returns:
             Dictionary with capture data or None on error:
             {
                 'channels': int,
                 'sample_rate': int,
-                'samples': List[List[int]],  # Per-channel sample lists
+                'samples': np.ndarray,  # Packed samples, bit N = channel N
                 'trigger_position': int,
-                'raw_data': bytes
+                'raw_data': bytes  # Not included with out=, to avoid a copy
             }
         """
         import serial
@@ -2212,61 +2223,75 @@ class BusPirateBackend(BusBackend, GPIOBackend):
 
             # Open BINARY port for SUMP protocol (not console!)
             print(f"[BusPirate] Opening SUMP connection: {binary_port}")
-            sump_serial = serial.Serial(binary_port, 115200, timeout=2)
+            with serial.Serial(binary_port, 115200, timeout=2) as sump_serial:
+                # Import and use SUMP client
+                from .sump import SUMPClient, SUMPConfig
 
-            # Import and use SUMP client
-            from .sump import SUMPClient, SUMPConfig
+                client = SUMPClient(sump_serial, debug=True)
 
-            client = SUMPClient(sump_serial, debug=True)
+                # Reset
+                client.reset()
 
-            # Reset
-            client.reset()
-
-            # Check device
-            success, device_id = client.identify()
-            if not success:
-                print(f"[BusPirate] SUMP not responding: {device_id}")
-                sump_serial.close()
-                return None
-
-            print(f"[BusPirate] SUMP device: {device_id}")
-
-            # Get metadata
-            metadata = client.get_metadata()
-            if metadata:
-                print(f"[BusPirate] SUMP metadata: {metadata}")
-
-            # Configure capture
-            config = SUMPConfig(
-                sample_rate=sample_rate,
-                sample_count=sample_count,
-                channels=channels,
-                base_clock=62_500_000,  # Bus Pirate 5/6 base clock
-            )
-
-            # Set trigger
-            if trigger_channel is not None and 0 <= trigger_channel < channels:
-                config.trigger_mask = 1 << trigger_channel
-                config.trigger_value = (1 << trigger_channel) if trigger_edge == "rising" else 0
+                # Check device
+                success, device_id = client.identify()
+                if not success:
+                    print(f"[BusPirate] SUMP not responding: {device_id}")
+                    return None
 
-            client.configure(config)
+                print(f"[BusPirate] SUMP device: {device_id}")
 
-            # Capture
-            print(f"[BusPirate] Starting capture...")
-            capture = client.capture(timeout=timeout)
+                # Get metadata
+                metadata = client.get_metadata()
+                if metadata:
+                    print(f"[BusPirate] SUMP metadata: {metadata}")
 
-            sump_serial.close()
+                # Configure capture
+                config = SUMPConfig(
+                    sample_rate=sample_rate,
+                    sample_count=sample_count,
+                    channels=channels,
+                    base_clock=62_500_000,  # Bus Pirate 5/6 base clock
+                )
 
-            if capture:
-                return {
-                    'channels': capture.channels,
-                    'sample_rate': capture.sample_rate,
-                    'samples': capture.samples,
-                    'trigger_position': capture.trigger_position,
-                    'raw_data': capture.raw_data
-                }
-            else:
-                return None
+                # Set trigger
+                if trigger_channel is not None and 0 <= trigger_channel < channels:
+                    config.trigger_mask = 1 << trigger_channel
+                    config.trigger_value = (1 << trigger_channel) if trigger_edge == "rising" else 0
+
+                client.configure(config)
+
+                # Capture
+                print(f"[BusPirate] Starting capture...")
+                if out is not None and channels <= 8:
+                    received = 0
+                    for received in client.capture_into(out, timeout=timeout, stop_event=stop_event):
+                        if progress is not None:
+                            progress(received)
+
+                    if not received or (stop_event is not None and stop_event.is_set()):
+                        return None
+
+                    # SUMP sends newest sample first; reverse as a view
+                    samples = out[:received][::-1]
+                    return {
+                        'channels': channels,
+                        'sample_rate': sample_rate,
+                        'samples': samples,
+                        'trigger_position': client.find_trigger(samples),
+                    }
+
+                capture = client.capture(timeout=timeout)
+
+                if capture:
+                    return {
+                        'channels': capture.channels,
+                        'sample_rate': capture.sample_rate,
+                        'samples': capture.samples,
+                        'trigger_position': capture.trigger_position,
+                        'raw_data': capture.raw_data
+                    }
+                else:
+                    return None
 
         except ImportError:
             print("[BusPirate] pyserial not installed")
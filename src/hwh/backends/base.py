@@ -33,7 +33,7 @@ class TriggerEdge(Enum):
     EITHER = auto()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SPIConfig:
     """SPI bus configuration."""
     speed_hz: int = 1_000_000
@@ -42,14 +42,14 @@ class SPIConfig:
     cs_active_low: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class I2CConfig:
     """I2C bus configuration."""
     speed_hz: int = 400_000
     address_bits: int = 7
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UARTConfig:
     """UART configuration."""
     baudrate: int = 115200
@@ -21,10 +21,15 @@ Commands:
 
 import time
 import struct
-from typing import Optional, List, Tuple
+import threading
+from typing import Iterator, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import IntEnum
 
+import numpy as np
+
+from ..logic_kernels import HAS_NUMBA, find_edge_compiled, unpack8
+
 
 class SUMPCommand(IntEnum):
     """SUMP protocol commands"""
@@ -71,12 +76,13 @@ class SUMPConfig:
     base_clock: int = 100_000_000     # Device's base clock frequency
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class SUMPCapture:
     """Captured logic data from SUMP device"""
     channels: int = 8
     sample_rate: int = 1_000_000
-    samples: List[List[int]] = field(default_factory=list)  # Per-channel sample lists
+    # Packed samples in capture order, bit c = channel c (uint8 for <= 8 channels)
+    samples: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.uint8))
     trigger_position: int = 0
     raw_data: bytes = b''
 
@@ -94,7 +100,13 @@ class SUMPClient:
 
     SUMP_ID = b'1ALS'  # Standard SUMP identification response
 
-    def __init__(self, serial_port, timeout: float = 2.0, debug: bool = False):
+    def __init__(
+        self,
+        serial_port,
+        timeout: float = 2.0,
+        debug: bool = False,
+        read_chunk_size: int = 4096,
+    ):
         """
         Initialize SUMP client.
 
@@ -102,10 +114,14 @@ class SUMPClient:
             serial_port: pyserial Serial instance (already opened)
             timeout: Communication timeout in seconds
             debug: Enable debug output
+            read_chunk_size: Bytes requested per read while draining a capture
+                (a multiple of the USB bulk endpoint size drains whole packets)
         """
         self._serial = serial_port
         self._timeout = timeout
         self._debug = debug
+        self.read_chunk_size = read_chunk_size
+        self._cmd_buf = bytearray()  # Queued commands, sent by flush_commands()
         self._config = SUMPConfig()
         self._metadata = {}
 
@@ -114,16 +130,24 @@ class SUMPClient:
         if self._debug:
             print(f"[SUMP] {msg}")
 
+    def queue_command(self, cmd: int, data: bytes = b'') -> None:
+        """Queue a SUMP command to go out with the next flush_commands()"""
+        # Short commands are 1 byte, long commands 5 bytes (cmd + 4 data)
+        self._cmd_buf.append(cmd)
+        self._cmd_buf += data
+        if self._debug:
+            self._log(f"TX: {cmd:02X} {data.hex()}" if data else f"TX: {cmd:02X}")
+
+    def flush_commands(self) -> None:
+        """Write all queued commands in a single transfer"""
+        if self._cmd_buf:
+            self._serial.write(bytes(self._cmd_buf))
+            self._cmd_buf.clear()
+
     def _send_command(self, cmd: int, data: bytes = b'') -> None:
         """Send a SUMP command"""
-        if data:
-            # Long command (5 bytes total)
-            self._serial.write(bytes([cmd]) + data)
-            self._log(f"TX: {cmd:02X} {data.hex()}")
-        else:
-            # Short command (1 byte)
-            self._serial.write(bytes([cmd]))
-            self._log(f"TX: {cmd:02X}")
+        self.queue_command(cmd, data)
+        self.flush_commands()
 
     def _read_response(self, length: int, timeout: Optional[float] = None) -> bytes:
         """Read response from device"""
@@ -144,7 +168,8 @@ class SUMPClient:
         """Reset the SUMP device"""
         # Send reset command 5 times (per SUMP spec)
         for _ in range(5):
-            self._send_command(SUMPCommand.RESET)
+            self.queue_command(SUMPCommand.RESET)
+        self.flush_commands()
         time.sleep(0.1)
 
         # Flush input buffer
@@ -197,13 +222,8 @@ class SUMPClient:
                 token_type = token[0]
 
                 if token_type & 0x80:
-                    # String token
-                    string_data = b''
-                    while True:
-                        char = self._serial.read(1)
-                        if not char or char == b'\x00':
-                            break
-                        string_data += char
+                    # String token (NUL terminated) - one read instead of per byte
+                    string_data = self._serial.read_until(b'\x00').rstrip(b'\x00')
 
                     if token_type == 0x01:
                         metadata['device_name'] = string_data.decode('ascii', errors='ignore')
@@ -262,11 +282,11 @@ class SUMPClient:
 
         # Set clock divider (24-bit)
         divider_data = struct.pack('<I', divider)[:3] + b'\x00'
-        self._send_command(SUMPCommand.SET_DIVIDER, divider_data)
+        self.queue_command(SUMPCommand.SET_DIVIDER, divider_data)
 
         # Set read and delay count
         count_data = struct.pack('<HH', read_count & 0xFFFF, delay_count & 0xFFFF)
-        self._send_command(SUMPCommand.SET_READ_DELAY_COUNT, count_data)
+        self.queue_command(SUMPCommand.SET_READ_DELAY_COUNT, count_data)
 
         # Set flags
         flags = 0
@@ -282,46 +302,56 @@ class SUMPClient:
             flags |= SUMPFlags.CHANNEL_GROUP_3
 
         flags_data = struct.pack('<I', flags)
-        self._send_command(SUMPCommand.SET_FLAGS, flags_data)
+        self.queue_command(SUMPCommand.SET_FLAGS, flags_data)
 
         # Set trigger (stage 0 only for simple trigger)
         if config.trigger_mask:
             # Trigger mask - which bits to check
             mask_data = struct.pack('<I', config.trigger_mask)
-            self._send_command(SUMPCommand.SET_TRIGGER_MASK_0, mask_data)
+            self.queue_command(SUMPCommand.SET_TRIGGER_MASK_0, mask_data)
 
             # Trigger value - expected values
             value_data = struct.pack('<I', config.trigger_value)
-            self._send_command(SUMPCommand.SET_TRIGGER_VALUE_0, value_data)
+            self.queue_command(SUMPCommand.SET_TRIGGER_VALUE_0, value_data)
 
             # Trigger config - enable trigger
             # Bits: [31:28] delay, [27:24] level, [23:16] channel, [15:8] serial, [3] start, [2:0] serial config
             trig_config = 0x08  # Start capture on trigger (bit 3)
             config_data = struct.pack('<I', trig_config)
-            self._send_command(SUMPCommand.SET_TRIGGER_CONFIG_0, config_data)
+            self.queue_command(SUMPCommand.SET_TRIGGER_CONFIG_0, config_data)
         else:
             # No trigger - immediate capture
             config_data = struct.pack('<I', 0)
-            self._send_command(SUMPCommand.SET_TRIGGER_CONFIG_0, config_data)
+            self.queue_command(SUMPCommand.SET_TRIGGER_CONFIG_0, config_data)
 
+        # Send the whole configuration in one write
+        self.flush_commands()
         return True
 
-    def capture(self, timeout: Optional[float] = None) -> Optional[SUMPCapture]:
+    def capture_into(
+        self,
+        buffer,
+        timeout: Optional[float] = None,
+        stop_event: Optional[threading.Event] = None,
+    ) -> Iterator[int]:
         """
-        Start capture and wait for data.
+        Start capture and read sample data straight into a caller's buffer.
+
+        Data lands in SUMP wire order (newest sample first). Yields the
+        running byte count after each read. The generator ends when the
+        buffer or the configured sample count is full, on timeout, or when
+        stop_event is set.
 
         Args:
+            buffer: Writable buffer (bytearray, uint8 ndarray, ...)
             timeout: Max time to wait for capture (includes trigger wait)
-
-        Returns:
-            SUMPCapture with sample data, or None on error
+            stop_event: Checked between reads; when set the capture is abandoned
         """
         if timeout is None:
             timeout = 10.0  # Default 10 second timeout
 
-        # Calculate expected data size
-        bytes_per_sample = (self._config.channels + 7) // 8
-        expected_bytes = self._config.sample_count * bytes_per_sample
+        view = memoryview(buffer).cast("B")
+        expected_bytes = min(self.expected_bytes, len(view))
 
         self._log(f"Starting capture: {expected_bytes} bytes expected")
 
@@ -333,72 +363,89 @@ class SUMPClient:
 
         # Read sample data
         start_time = time.time()
-        raw_data = b''
+        received = 0
+
+        while received < expected_bytes:
+            if stop_event is not None and stop_event.is_set():
+                self._log("Capture aborted")
+                return
 
-        while len(raw_data) < expected_bytes:
             if time.time() - start_time > timeout:
-                self._log(f"Capture timeout ({len(raw_data)}/{expected_bytes} bytes)")
-                if len(raw_data) == 0:
-                    return None
-                break
+                self._log(f"Capture timeout ({received}/{expected_bytes} bytes)")
+                return
+
+            size = min(self.read_chunk_size, expected_bytes - received)
+            count = self._serial.readinto(view[received:received + size])
+            if count:
+                received += count
+                if self._debug:
+                    self._log(f"Read {count} bytes, total {received}/{expected_bytes}")
+                yield received
+
+        self._log(f"Capture complete: {received} bytes")
+
+    def capture(
+        self,
+        timeout: Optional[float] = None,
+        stop_event: Optional[threading.Event] = None,
+    ) -> Optional[SUMPCapture]:
+        """
+        Start capture and wait for data.
+
+        Args:
+            timeout: Max time to wait for capture (includes trigger wait)
+            stop_event: Checked between reads; when set the capture is abandoned
 
-            chunk = self._serial.read(min(4096, expected_bytes - len(raw_data)))
-            if chunk:
-                raw_data += chunk
-                self._log(f"Read {len(chunk)} bytes, total {len(raw_data)}/{expected_bytes}")
+        Returns:
+            SUMPCapture with sample data, or None on error
+        """
+        buffer = bytearray(self.expected_bytes)
+        received = 0
+        for received in self.capture_into(buffer, timeout=timeout, stop_event=stop_event):
+            pass
 
-        self._log(f"Capture complete: {len(raw_data)} bytes")
+        if not received or (stop_event is not None and stop_event.is_set()):
+            return None
 
         # Parse raw data into channels
-        return self._parse_capture(raw_data)
+        return self._parse_capture(bytes(buffer[:received]))
+
+    @property
+    def expected_bytes(self) -> int:
+        """Bytes the device sends for the configured capture"""
+        bytes_per_sample = (self._config.channels + 7) // 8
+        return self._config.sample_count * bytes_per_sample
+
+    def find_trigger(self, samples: np.ndarray) -> int:
+        """
+        Index of the first packed sample matching the trigger pattern (0 if none).
+
+        A single-channel trigger on an 8-channel capture stands for an edge
+        (high for rising, low for falling), so the first transition into
+        that level is preferred over a line that simply starts there.
+        """
+        mask = self._config.trigger_mask
+        if not mask:
+            return 0
+
+        if samples.dtype == np.uint8 and mask & (mask - 1) == 0:
+            edge = find_edge(samples, mask, rising=bool(self._config.trigger_value & mask))
+            if edge >= 0:
+                return edge
+
+        hits = np.flatnonzero((samples & mask) == self._config.trigger_value)
+        return int(hits[0]) if hits.size else 0
 
     def _parse_capture(self, raw_data: bytes) -> SUMPCapture:
         """Parse raw SUMP data into channel samples"""
         channels = self._config.channels
-        bytes_per_sample = (channels + 7) // 8
-
-        # Initialize channel arrays
-        channel_samples = [[] for _ in range(channels)]
-
-        # SUMP data is in reverse order (newest first)
-        # and samples are packed LSB first
-        sample_count = len(raw_data) // bytes_per_sample
-
-        for i in range(sample_count - 1, -1, -1):  # Reverse order
-            offset = i * bytes_per_sample
-            sample_bytes = raw_data[offset:offset + bytes_per_sample]
-
-            # Convert bytes to sample value
-            sample = 0
-            for j, b in enumerate(sample_bytes):
-                sample |= b << (j * 8)
-
-            # Extract each channel bit
-            for ch in range(channels):
-                bit = (sample >> ch) & 1
-                channel_samples[ch].append(bit)
-
-        # Find trigger position (look for trigger pattern)
-        trigger_pos = 0
-        if self._config.trigger_mask:
-            mask = self._config.trigger_mask
-            value = self._config.trigger_value
-
-            for i in range(min(len(channel_samples[0]), sample_count)):
-                sample = 0
-                for ch in range(min(channels, 8)):
-                    if i < len(channel_samples[ch]):
-                        sample |= channel_samples[ch][i] << ch
-
-                if (sample & mask) == value:
-                    trigger_pos = i
-                    break
+        samples = pack_samples(raw_data, channels)
 
         return SUMPCapture(
             channels=channels,
             sample_rate=self._config.sample_rate,
-            samples=channel_samples,
-            trigger_position=trigger_pos,
+            samples=samples,
+            trigger_position=self.find_trigger(samples),
             raw_data=raw_data
         )
 
@@ -407,6 +454,83 @@ class SUMPClient:
         self.reset()
 
 
+def pack_samples(raw_data: bytes, channels: int = 8) -> np.ndarray:
+    """
+    Convert raw SUMP data into a packed 1-D sample array in capture order.
+
+    Bit c of each element is channel c. SUMP already sends one little-endian
+    word per sample (newest first), so this is a reinterpret plus reverse;
+    8-channel captures stay one byte per sample.
+    """
+    bytes_per_sample = (channels + 7) // 8
+    width = 1 if bytes_per_sample == 1 else 2 if bytes_per_sample == 2 else 4
+    sample_count = len(raw_data) // bytes_per_sample
+    raw = np.frombuffer(raw_data, dtype=np.uint8, count=sample_count * bytes_per_sample)
+    raw = raw.reshape(sample_count, bytes_per_sample)
+    if width != bytes_per_sample:
+        raw = np.pad(raw, ((0, 0), (0, width - bytes_per_sample)))
+    words = np.ascontiguousarray(raw).view(f"<u{width}").reshape(-1)
+    return words[::-1].copy()
+
+
+def find_edge(samples: np.ndarray, mask: int, rising: bool = True) -> int:
+    """
+    Index of the first packed 8-channel sample where a bit of mask changes
+    to 1 (rising) or 0 (falling), or -1 if there is none.
+
+    Scans eight samples per step: the bytes are viewed as little-endian
+    uint64 words, each word shifted up one byte lane (carrying in the last
+    sample of the previous word) gives every lane its predecessor, and the
+    edge test runs on all lanes at once. Only the first hit word is
+    resolved down to a byte. With numba installed a compiled scan that
+    stops at the first edge is used instead.
+    """
+    if HAS_NUMBA:
+        return find_edge_compiled(samples, mask, rising)
+
+    samples = np.ascontiguousarray(samples, dtype=np.uint8)
+    n = samples.shape[0]
+    if n < 2:
+        return -1
+
+    pad = -n % 8
+    if pad:
+        # Repeat the last sample so the padding adds no edges
+        samples = np.concatenate((samples, np.full(pad, samples[-1], dtype=np.uint8)))
+    words = samples.view("<u8")
+
+    prev = words << np.uint64(8)
+    prev[1:] |= words[:-1] >> np.uint64(56)
+    prev[0] |= words[0] & np.uint64(0xFF)  # Sample 0 has no predecessor
+
+    edges = (~prev & words) if rising else (prev & ~words)
+    edges &= np.uint64((mask & 0xFF) * 0x0101010101010101)
+
+    hits = np.flatnonzero(edges)
+    if not hits.size:
+        return -1
+    word = int(edges[hits[0]])
+    return int(hits[0]) * 8 + ((word & -word).bit_length() - 1) // 8
+
+
+def unpack_samples(raw_data: bytes, channels: int = 8) -> np.ndarray:
+    """
+    Unpack raw SUMP data into a (channels, samples) uint8 array.
+
+    SUMP sends samples newest first with channel bits packed LSB first,
+    so the rows come back in capture order with one 0/1 byte per sample.
+    """
+    bytes_per_sample = (channels + 7) // 8
+    sample_count = len(raw_data) // bytes_per_sample
+    raw = np.frombuffer(raw_data, dtype=np.uint8, count=sample_count * bytes_per_sample)
+    if bytes_per_sample == 1:
+        # One byte per sample: the shared 8-channel kernel (numba if available)
+        return unpack8(raw[::-1])[:channels]
+    raw = raw.reshape(sample_count, bytes_per_sample)[::-1]
+    bits = np.unpackbits(raw, axis=1, bitorder="little")[:, :channels]
+    return np.ascontiguousarray(bits.T)
+
+
 def capture_logic(
     serial_port,
     sample_rate: int = 1_000_000,
@@ -398,7 +398,7 @@ class SecurityAnalyzer:
     async def _extract_strings(self, file_path: Path, min_length: int = 4) -> str:
         """Extract printable strings from a file using strings command"""
         try:
-            result = await asyncio.get_event_loop().run_in_executor(
+            result = await asyncio.get_running_loop().run_in_executor(
                 None,
                 lambda: subprocess.run(
                     ["strings", f"-n{min_length}", str(file_path)],
@@ -395,7 +395,7 @@ class AdvancedAnalyzer:
     async def _run_file_command(self, path: Path) -> str:
         """Run file command on binary"""
         try:
-            result = await asyncio.get_event_loop().run_in_executor(
+            result = await asyncio.get_running_loop().run_in_executor(
                 None,
                 lambda: subprocess.run(
                     ["file", str(path)],
@@ -412,7 +412,7 @@ class AdvancedAnalyzer:
         """Extract interesting strings from binary"""
         interesting = []
         try:
-            result = await asyncio.get_event_loop().run_in_executor(
+            result = await asyncio.get_running_loop().run_in_executor(
                 None,
                 lambda: subprocess.run(
                     ["strings", "-n", "6", str(binary_path)],
@@ -557,7 +557,7 @@ class AdvancedAnalyzer:
 
         # Check if nuclei is installed
         try:
-            result = await asyncio.get_event_loop().run_in_executor(
+            result = await asyncio.get_running_loop().run_in_executor(
                 None,
                 lambda: subprocess.run(
                     ["which", "nuclei"],
@@ -575,7 +575,7 @@ class AdvancedAnalyzer:
 
         # Run nuclei with file-based templates
         try:
-            result = await asyncio.get_event_loop().run_in_executor(
+            result = await asyncio.get_running_loop().run_in_executor(
                 None,
                 lambda: subprocess.run(
                     [
@@ -1104,7 +1104,7 @@ class AdvancedAnalyzer:
         """Use readelf to get detailed hardening info"""
         try:
             # Check for GNU_RELRO
-            result = await asyncio.get_event_loop().run_in_executor(
+            result = await asyncio.get_running_loop().run_in_executor(
                 None,
                 lambda: subprocess.run(
                     ['readelf', '-l', str(binary_path)],
@@ -1504,7 +1504,7 @@ class AdvancedAnalyzer:
         """Get certificate information using openssl"""
         try:
             # Get certificate subject and issuer
-            result = await asyncio.get_event_loop().run_in_executor(
+            result = await asyncio.get_running_loop().run_in_executor(
                 None,
                 lambda: subprocess.run(
                     ['openssl', 'x509', '-in', str(cert_file), '-noout',
@@ -1617,7 +1617,7 @@ class AdvancedAnalyzer:
             if key_file.exists():
                 try:
                     # Get key fingerprint
-                    result = await asyncio.get_event_loop().run_in_executor(
+                    result = await asyncio.get_running_loop().run_in_executor(
                         None,
                         lambda kf=key_file: subprocess.run(
                             ['ssh-keygen', '-lf', str(kf)],
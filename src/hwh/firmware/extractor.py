@@ -243,7 +243,7 @@ class FirmwareExtractor:
 
             self._debug(f"Running command: {' '.join(cmd)}")
 
-            result = await asyncio.get_event_loop().run_in_executor(
+            result = await asyncio.get_running_loop().run_in_executor(
                 None,
                 lambda: subprocess.run(
                     cmd,
@@ -605,7 +605,7 @@ class FirmwareExtractor:
         self._log(f"[*] {desc}")
         self._log(f"[*] Command: {' '.join(cmd)}")
         try:
-            result = await asyncio.get_event_loop().run_in_executor(
+            result = await asyncio.get_running_loop().run_in_executor(
                 None,
                 lambda: subprocess.run(
                     cmd,
@@ -799,7 +799,7 @@ class FirmwareExtractor:
 
         try:
             with open(carved_path, "rb") as f:
-                await asyncio.get_event_loop().run_in_executor(
+                await asyncio.get_running_loop().run_in_executor(
                     None,
                     lambda: subprocess.run(
                         ["cpio", "-idm", "--no-absolute-filenames"],
@@ -0,0 +1,105 @@
+"""
+Logic analyzer sample kernels.
+
+Packed captures hold one byte per sample with bit c = channel c. These
+helpers turn a window of packed samples into per-channel bit rows and
+waveform glyph strings for the TUI.
+
+numba is optional (``pip install hwh[fast]``): when it is available the
+bit unpacking runs as a compiled parallel loop, otherwise NumPy's
+unpackbits does the same job. The compiled edge scan is only offered with
+numba; callers keep their own NumPy path for when it is missing.
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _unpack8_numba(buf, out):
+        for i in prange(buf.shape[0]):
+            b = buf[i]
+            out[0, i] = b & 1
+            out[1, i] = (b >> 1) & 1
+            out[2, i] = (b >> 2) & 1
+            out[3, i] = (b >> 3) & 1
+            out[4, i] = (b >> 4) & 1
+            out[5, i] = (b >> 5) & 1
+            out[6, i] = (b >> 6) & 1
+            out[7, i] = (b >> 7) & 1
+
+    @njit(cache=True)
+    def _find_edge_numba(buf, mask, rising):
+        prev = buf[0]
+        for i in range(1, buf.shape[0]):
+            cur = buf[i]
+            changed = (cur ^ prev) & mask
+            if changed:
+                # Rising: a changed bit is now 1; falling: it was 1 before
+                if (changed & cur) if rising else (changed & prev):
+                    return i
+            prev = cur
+        return -1
+
+
+def unpack8(buf: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Unpack packed 8-channel samples into an (8, n) array of 0/1 bytes.
+
+    Args:
+        buf: 1-D uint8 array of packed samples
+        out: Optional (8, n) uint8 array to fill instead of allocating
+
+    Returns:
+        The unpacked rows, row c holding channel c
+    """
+    buf = np.ascontiguousarray(buf, dtype=np.uint8)
+    if out is None:
+        out = np.empty((8, buf.shape[0]), dtype=np.uint8)
+
+    if HAS_NUMBA:
+        _unpack8_numba(buf, out)
+    else:
+        # unpackbits gives (n, 8) with bit 0 first; transpose into the rows
+        out[:] = np.unpackbits(buf[:, None], axis=1, bitorder="little").T
+    return out
+
+
+def waveform_glyphs(bits: np.ndarray, glyphs: Sequence[str]) -> str:
+    """
+    Render one channel's 0/1 samples as a glyph string.
+
+    Each sample is drawn from its level and the previous sample's level:
+    glyphs is indexed by (previous << 1) | current, i.e. (low, rising,
+    falling, high). The first sample is compared with itself.
+    """
+    if not bits.shape[0]:
+        return ""
+
+    bits = bits.astype(np.uint8, copy=False)
+    prev = np.empty_like(bits)
+    prev[0] = bits[0]
+    prev[1:] = bits[:-1]
+    codes = (prev << 1) | bits
+    return "".join(np.asarray(glyphs)[codes])
+
+
+def find_edge_compiled(buf: np.ndarray, mask: int, rising: bool = True) -> int:
+    """
+    Index of the first packed sample where a bit of mask changes to 1
+    (rising) or 0 (falling), or -1 if there is none.
+
+    Compiled early-exit scan; requires numba (check HAS_NUMBA first).
+    """
+    buf = np.ascontiguousarray(buf, dtype=np.uint8)
+    if buf.shape[0] < 2:
+        return -1
+    return int(_find_edge_numba(buf, np.uint8(mask & 0xFF), rising))
@@ -0,0 +1,94 @@
+"""
+Windows fast path for finding Curious Bolt serial ports.
+
+comports() on Windows walks every COM device through SetupAPI, and
+Bluetooth serial entries can block for seconds each. The Bolt's ports
+can be read straight from the registry instead:
+
+    HKLM\\SYSTEM\\CurrentControlSet\\Enum\\USB\\VID_xxxx&PID_yyyy[&MI_nn]\\<instance>
+        \\Device Parameters\\PortName
+
+The Enum tree also remembers unplugged devices, so results are
+limited to ports listed in HKLM\\HARDWARE\\DEVICEMAP\\SERIALCOMM.
+"""
+
+import sys
+from typing import List, Set
+
+
+def _subkeys(winreg, key) -> List[str]:
+    """List the names of a registry key's subkeys"""
+    names = []
+    index = 0
+    while True:
+        try:
+            names.append(winreg.EnumKey(key, index))
+        except OSError:
+            return names
+        index += 1
+
+
+def _active_ports(winreg) -> Set[str]:
+    """COM port names currently present in the system"""
+    ports = set()
+    try:
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DEVICEMAP\SERIALCOMM") as key:
+            index = 0
+            while True:
+                try:
+                    _, value, _ = winreg.EnumValue(key, index)
+                except OSError:
+                    break
+                ports.add(str(value))
+                index += 1
+    except OSError:
+        pass
+    return ports
+
+
+def find_bolt_ports_windows(vid: int, pid: int) -> List[str]:
+    """
+    Return present COM ports registered under a USB VID/PID, sorted.
+
+    Returns an empty list on other platforms or if nothing is found,
+    so callers can fall back to comports().
+    """
+    if sys.platform != "win32":
+        return []
+
+    import winreg
+
+    prefix = f"VID_{vid:04X}&PID_{pid:04X}"
+    found = []
+
+    try:
+        usb = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SYSTEM\CurrentControlSet\Enum\USB")
+    except OSError:
+        return []
+
+    with usb:
+        # Composite devices list one key per interface (VID_xxxx&PID_yyyy&MI_nn)
+        for device_name in _subkeys(winreg, usb):
+            if not device_name.upper().startswith(prefix):
+                continue
+            try:
+                device = winreg.OpenKey(usb, device_name)
+            except OSError:
+                continue
+            with device:
+                for instance in _subkeys(winreg, device):
+                    try:
+                        with winreg.OpenKey(device, rf"{instance}\Device Parameters") as params:
+                            port, _ = winreg.QueryValueEx(params, "PortName")
+                    except OSError:
+                        continue
+                    found.append(str(port))
+
+    if not found:
+        return []
+
+    active = _active_ports(winreg)
+    if active:
+        found = [port for port in found if port in active]
+
+    return sorted(set(found))
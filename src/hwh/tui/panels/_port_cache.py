@@ -0,0 +1,46 @@
+"""
+Short-lived cache for serial port enumeration.
+
+comports() can take seconds on Windows hosts with Bluetooth COM ports,
+so panels that look up ports on every action share one recent result.
+"""
+
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from serial.tools.list_ports import comports
+from serial.tools.list_ports_common import ListPortInfo
+
+_comports_cache: Optional[Tuple[float, List[ListPortInfo]]] = None
+_cache_lock = threading.Lock()
+
+
+def cached_comports(max_age: float = 5.0) -> List[ListPortInfo]:
+    """
+    Return comports(), reusing the last result if it is younger than max_age.
+
+    Safe to call from executor threads.
+    """
+    global _comports_cache
+
+    with _cache_lock:
+        if _comports_cache is not None:
+            timestamp, ports = _comports_cache
+            if time.monotonic() - timestamp < max_age:
+                return ports
+
+        ports = list(comports())
+        _comports_cache = (time.monotonic(), ports)
+        return ports
+
+
+def cache_clear() -> None:
+    """Drop the cached port list so the next lookup re-enumerates"""
+    global _comports_cache
+
+    with _cache_lock:
+        _comports_cache = None
+
+
+cached_comports.cache_clear = cache_clear
@@ -5,9 +5,10 @@ Abstract base class for all device panels in the TUI.
 Each panel represents a connected device and provides UI for its capabilities.
 """
 
+import re
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Optional, List, Dict, Any, Callable, TYPE_CHECKING
+from typing import Optional, List, Dict, Any, Callable, Tuple, TYPE_CHECKING
 
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical, Horizontal
@@ -17,6 +18,10 @@ from textual.messages import Message
 if TYPE_CHECKING:
     from ..app import HwhApp
 
+# Characters replaced / dropped when turning a device id into a widget id
+_ID_SEPARATORS = re.compile(r'[:/.]')
+_ID_INVALID = re.compile(r'[^a-zA-Z0-9_-]')
+
 
 class PanelCapability(Enum):
     """Capabilities that a device panel can provide"""
@@ -42,6 +47,11 @@ class CommandSuggestion:
     command: str
     description: str
     category: str = ""
+    # Precomputed for prefix matching on every keystroke
+    command_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.command_lower = self.command.lower()
 
 
 @dataclass
@@ -91,7 +101,13 @@ class DevicePanel(Container):
 
     # Class attributes to be overridden by subclasses
     DEVICE_NAME: str = "Unknown Device"
-    CAPABILITIES: List[PanelCapability] = []
+    CAPABILITIES: Tuple[PanelCapability, ...] = ()
+    # Static auto-completion entries, filtered by get_command_suggestions()
+    SUGGESTIONS: Tuple[CommandSuggestion, ...] = ()
+
+    # Lines kept in the console; older output is dropped so long sessions
+    # don't grow the widget (and its re-layout cost) without bound
+    CONSOLE_MAX_LINES: int = 2000
 
     def __init__(
         self,
@@ -111,6 +127,10 @@ class DevicePanel(Container):
         self._output_callbacks: List[Callable[[str], None]] = []
         self._pattern_callbacks: Dict[str, Callable[[str], None]] = {}
 
+        # Widget ids/selectors derived from the device id, built on first use
+        self._safe_id: Optional[str] = None
+        self._status_selector: Optional[str] = None
+
     @property
     def device_id(self) -> str:
         """Unique identifier for this device"""
@@ -123,15 +143,16 @@ class DevicePanel(Container):
         Textual IDs must contain only letters, numbers, underscores, or hyphens,
         and must not begin with a number.
         """
-        import re
-        # Replace colons, slashes, dots with underscores
-        safe = re.sub(r'[:/.]', '_', self.device_id)
-        # Remove any remaining invalid characters
-        safe = re.sub(r'[^a-zA-Z0-9_-]', '', safe)
-        # Ensure it doesn't start with a number
-        if safe and safe[0].isdigit():
-            safe = 'dev_' + safe
-        return safe
+        if self._safe_id is None:
+            # Replace colons, slashes, dots with underscores
+            safe = _ID_SEPARATORS.sub('_', self.device_id)
+            # Remove any remaining invalid characters
+            safe = _ID_INVALID.sub('', safe)
+            # Ensure it doesn't start with a number
+            if safe and safe[0].isdigit():
+                safe = 'dev_' + safe
+            self._safe_id = safe
+        return self._safe_id
 
     @property
     def tab_title(self) -> str:
@@ -166,9 +187,14 @@ class DevicePanel(Container):
     def get_command_suggestions(self, partial: str) -> List[CommandSuggestion]:
         """
         Get command suggestions for auto-completion.
-        Override in subclasses to provide device-specific suggestions.
+        Matches SUGGESTIONS by prefix; override in subclasses for
+        suggestions that depend on device state.
         """
-        return []
+        if not partial:
+            return list(self.SUGGESTIONS)
+
+        partial_lower = partial.lower()
+        return [s for s in self.SUGGESTIONS if s.command_lower.startswith(partial_lower)]
 
     def log_output(self, text: str, channel: str = "console") -> None:
         """
@@ -189,7 +215,6 @@ class DevicePanel(Container):
                 pass
 
         # Check pattern callbacks
-        import re
         for pattern, callback in self._pattern_callbacks.items():
             try:
                 if re.search(pattern, text):
@@ -226,7 +251,11 @@ class DevicePanel(Container):
         """Helper to build a standard console section"""
         with Container(classes="console-section") as console:
             console.border_title = "console"
-            yield Log(id=f"console-{self.safe_id}", classes="device-console")
+            yield Log(
+                max_lines=self.CONSOLE_MAX_LINES,
+                id=f"console-{self.safe_id}",
+                classes="device-console"
+            )
             with Horizontal(classes="input-row"):
                 yield Static("$> ")
                 yield Input(placeholder="command...", id=f"input-{self.safe_id}")
@@ -250,7 +279,9 @@ class DevicePanel(Container):
         """Update a value in the status table"""
         from textual.widgets import DataTable
         try:
-            table = self.query_one(f"#status-{self.safe_id}", DataTable)
+            if self._status_selector is None:
+                self._status_selector = f"#status-{self.safe_id}"
+            table = self.query_one(self._status_selector, DataTable)
             table.update_cell(key, "Value", value)
         except Exception:
             pass
@@ -267,7 +298,7 @@ class GenericPanel(DevicePanel):
     """
 
     DEVICE_NAME = "Unknown Device"
-    CAPABILITIES = [PanelCapability.UART]
+    CAPABILITIES = (PanelCapability.UART,)
 
     def compose(self) -> ComposeResult:
         with Vertical():
@@ -20,6 +20,10 @@ from textual.widgets import Static, Button, Input, Select, Switch, Log, TabbedCo
 from .base import DevicePanel, DeviceInfo, PanelCapability, CommandSuggestion
 
 
+# Select options, built once and shared by every panel instance
+_INTERFACE_OPTIONS = (("SWD", "swd"), ("JTAG", "jtag"))
+
+
 class BlackMagicPanel(DevicePanel):
     """
     Panel for Black Magic Probe.
@@ -28,12 +32,21 @@ class BlackMagicPanel(DevicePanel):
     """
 
     DEVICE_NAME = "Black Magic Probe"
-    CAPABILITIES = [
+    CAPABILITIES = (
         PanelCapability.SWD,
         PanelCapability.JTAG,
         PanelCapability.DEBUG,
         PanelCapability.FLASH,
-    ]
+    )
+
+    SUGGESTIONS = (
+        CommandSuggestion("help", "Show available commands"),
+        CommandSuggestion("scan", "Scan for targets"),
+        CommandSuggestion("attach 1", "Attach to target 1", "attach"),
+        CommandSuggestion("monitor swdp_scan", "SWD scan via monitor", "monitor"),
+        CommandSuggestion("monitor jtag_scan", "JTAG scan via monitor", "monitor"),
+        CommandSuggestion("monitor version", "Show BMP version", "monitor"),
+    )
 
     def __init__(self, device_info: DeviceInfo, app, *args, **kwargs):
         super().__init__(device_info, app, *args, **kwargs)
@@ -80,7 +93,7 @@ class BlackMagicPanel(DevicePanel):
             with Grid(classes="config-grid"):
                 yield Static("Interface:")
                 yield Select(
-                    [("SWD", "swd"), ("JTAG", "jtag")],
+                    _INTERFACE_OPTIONS,
                     value="swd",
                     id="target-interface"
                 )
@@ -191,23 +204,6 @@ class BlackMagicPanel(DevicePanel):
         else:
             self.log_output(f"Unknown command: {cmd}")
 
-    def get_command_suggestions(self, partial: str) -> List[CommandSuggestion]:
-        """Get suggestions"""
-        suggestions = [
-            CommandSuggestion("help", "Show available commands"),
-            CommandSuggestion("scan", "Scan for targets"),
-            CommandSuggestion("attach 1", "Attach to target 1", "attach"),
-            CommandSuggestion("monitor swdp_scan", "SWD scan via monitor", "monitor"),
-            CommandSuggestion("monitor jtag_scan", "JTAG scan via monitor", "monitor"),
-            CommandSuggestion("monitor version", "Show BMP version", "monitor"),
-        ]
-
-        if partial:
-            partial_lower = partial.lower()
-            suggestions = [s for s in suggestions if s.command.lower().startswith(partial_lower)]
-
-        return suggestions
-
     def _show_help(self) -> None:
         """Display help"""
         help_text = """
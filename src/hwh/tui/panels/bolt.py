@@ -14,15 +14,20 @@ Features:
 """
 
 import asyncio
+import functools
+import logging
+import threading
 import time
 import re
-import os
+import sys
 import json
-from typing import List, Optional, Dict, Any, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Callable, Tuple
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 from pathlib import Path
 
+import numpy as np
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical, Horizontal, Grid
 from textual.widgets import Static, Button, Input, Switch, Log, DataTable, Select, ProgressBar, TabbedContent, TabPane
@@ -32,12 +37,64 @@ from textual.reactive import reactive
 from .base import DevicePanel, PanelCapability, CommandSuggestion
 from .logic_analyzer import LogicAnalyzerWidget, LogicCapture
 from .protocol_decoders import ProtocolType
+from ._bolt_winreg import find_bolt_ports_windows
 from ...detect import DeviceInfo
 from ...glitch_profiles import (
     GLITCH_PROFILES, GlitchProfile, find_profiles_for_chip,
     list_all_profiles, search_profiles
 )
 
+try:
+    import serial
+    from ...backends.sump import SUMPClient, SUMPConfig
+    from ._port_cache import cached_comports
+    HAS_SUMP = True
+except ImportError:
+    HAS_SUMP = False
+
+
+_log = logging.getLogger(__name__)
+
+
+class _ListHandler(logging.Handler):
+    """Collects log messages into a list for display in the panel"""
+
+    def __init__(self, messages: List[str], level: int = logging.NOTSET):
+        super().__init__(level=level)
+        self.messages = messages
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+# Curious Bolt USB IDs (see KNOWN_USB_DEVICES in hwh.detect)
+BOLT_VID = 0xCAFE
+BOLT_PID = 0x4002
+_BOLT_TAG = "Curious Bolt"  # Product/interface string fallback
+
+# Shared generator for demo data (seeding a new one per call reads OS entropy)
+_DEMO_RNG = np.random.default_rng()
+
+# Logic analyzer Select options, built once and shared by every panel instance
+_LOGIC_RATE_OPTIONS = (
+    ("31.25 MHz", "31250000"),
+    ("10 MHz", "10000000"),
+    ("5 MHz", "5000000"),
+    ("1 MHz", "1000000"),
+    ("500 kHz", "500000"),
+    ("100 kHz", "100000"),
+)
+_LOGIC_SAMPLES_OPTIONS = (
+    ("1K", "1024"),
+    ("4K", "4096"),
+    ("8K", "8192"),
+    ("16K", "16384"),
+    ("32K", "32768"),
+)
+_TRIGGER_CHANNEL_OPTIONS = (("None", "none"),) + tuple((f"CH{i}", str(i)) for i in range(8))
+_TRIGGER_EDGE_OPTIONS = (("Rising", "rising"), ("Falling", "falling"))
+_LOGIC_PROTOCOL_OPTIONS = (("None", "none"), ("SPI", "spi"), ("I2C", "i2c"), ("UART", "uart"))
+
 
 class TriggerEdge(Enum):
     RISING = "^"
@@ -133,15 +190,30 @@ class BoltPanel(DevicePanel):
     """
 
     DEVICE_NAME = "Curious Bolt"
-    CAPABILITIES = [
+    CAPABILITIES = (
         PanelCapability.GLITCH,
         PanelCapability.LOGIC,
         PanelCapability.POWER,
         PanelCapability.GPIO,
-    ]
+    )
+
+    SUGGESTIONS = (
+        CommandSuggestion("help", "Show available commands"),
+        CommandSuggestion("glitch", "Trigger a glitch"),
+        CommandSuggestion("set length", "Set glitch length in cycles", "set"),
+        CommandSuggestion("set repeat", "Set manual trigger repeat count", "set"),
+        CommandSuggestion("set delay", "Set glitch delay (ext_offset)", "set"),
+        CommandSuggestion("trigger 0 rising", "Set trigger 0 to rising edge", "trigger"),
+        CommandSuggestion("trigger 0 falling", "Set trigger 0 to falling edge", "trigger"),
+        CommandSuggestion("arm", "Arm enabled triggers"),
+        CommandSuggestion("status", "Show current status"),
+    )
 
     # Bolt timing constant
     CLOCK_PERIOD_NS = 8.3  # Single clock cycle duration
+    # Minimum seconds per continuous glitch attempt; each pass makes a
+    # blocking trigger call, so this also caps the event loop time it takes
+    GLITCH_LOOP_INTERVAL = 0.05
 
     def __init__(self, device_info: DeviceInfo, app, *args, **kwargs):
         super().__init__(device_info, app, *args, **kwargs)
@@ -195,9 +267,21 @@ class BoltPanel(DevicePanel):
         self._logic_trigger_channel: Optional[int] = None
         self._logic_trigger_edge: str = "rising"
         self._logic_capturing: bool = False
+        self._logic_task: Optional[asyncio.Task] = None
+        self._logic_stop = threading.Event()  # Polled by the SUMP read loop
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="bolt-io")
+        self._capture_buf: Optional[np.ndarray] = None  # Reused while sample count is unchanged
+        self._logic_debug = False  # Capture tracing; set per capture from the logging config
         self._logic_sump_port: Optional[str] = None  # Separate SUMP port (if different from main)
         self._logic_widget: Optional[LogicAnalyzerWidget] = None
 
+        # Status widget refs, resolved once in on_mount (None if absent)
+        self._w_glitch_state: Optional[Static] = None
+        self._w_count: Optional[Static] = None
+        self._w_time: Optional[Static] = None
+        self._w_params: Dict[str, Optional[Static]] = {}
+        self._w_trigger_symbols: List[Optional[Static]] = [None] * 8
+
     def compose(self) -> ComposeResult:
         with Vertical(id="bolt-panel"):
             # Top section - compact glitch controls with status
@@ -372,27 +456,14 @@ class BoltPanel(DevicePanel):
         with Horizontal(classes="logic-controls"):
             yield Static("Rate:", classes="logic-label")
             yield Select(
-                [
-                    ("31.25 MHz", "31250000"),
-                    ("10 MHz", "10000000"),
-                    ("5 MHz", "5000000"),
-                    ("1 MHz", "1000000"),
-                    ("500 kHz", "500000"),
-                    ("100 kHz", "100000"),
-                ],
+                _LOGIC_RATE_OPTIONS,
                 value="1000000",
                 id="logic-rate-select",
                 classes="logic-select"
             )
             yield Static("Samples:", classes="logic-label")
             yield Select(
-                [
-                    ("1K", "1024"),
-                    ("4K", "4096"),
-                    ("8K", "8192"),
-                    ("16K", "16384"),
-                    ("32K", "32768"),
-                ],
+                _LOGIC_SAMPLES_OPTIONS,
                 value="8192",
                 id="logic-samples-select",
                 classes="logic-select"
@@ -402,13 +473,13 @@ class BoltPanel(DevicePanel):
         with Horizontal(classes="logic-trigger-row"):
             yield Static("Trigger:", classes="logic-label")
             yield Select(
-                [("None", "none")] + [(f"CH{i}", str(i)) for i in range(8)],
+                _TRIGGER_CHANNEL_OPTIONS,
                 value="none",
                 id="logic-trigger-channel",
                 classes="logic-select"
             )
             yield Select(
-                [("Rising", "rising"), ("Falling", "falling")],
+                _TRIGGER_EDGE_OPTIONS,
                 value="rising",
                 id="logic-trigger-edge",
                 classes="logic-select"
@@ -418,12 +489,7 @@ class BoltPanel(DevicePanel):
         with Horizontal(classes="logic-protocol-row"):
             yield Static("Decode:", classes="logic-label")
             yield Select(
-                [
-                    ("None", "none"),
-                    ("SPI", "spi"),
-                    ("I2C", "i2c"),
-                    ("UART", "uart"),
-                ],
+                _LOGIC_PROTOCOL_OPTIONS,
                 value="none",
                 id="logic-protocol",
                 classes="logic-select"
@@ -591,7 +657,7 @@ class BoltPanel(DevicePanel):
 
         try:
             data = (text + "\r\n").encode("utf-8")
-            await asyncio.get_event_loop().run_in_executor(
+            await asyncio.get_running_loop().run_in_executor(
                 None,
                 lambda: self._target_serial.write(data)
             )
@@ -599,26 +665,6 @@ class BoltPanel(DevicePanel):
         except Exception as e:
             self._log_output(f"[!] UART TX error: {e}")
 
-    def get_command_suggestions(self, partial: str) -> List[CommandSuggestion]:
-        """Get command suggestions"""
-        suggestions = [
-            CommandSuggestion("help", "Show available commands"),
-            CommandSuggestion("glitch", "Trigger a glitch"),
-            CommandSuggestion("set length", "Set glitch length in cycles", "set"),
-            CommandSuggestion("set repeat", "Set manual trigger repeat count", "set"),
-            CommandSuggestion("set delay", "Set glitch delay (ext_offset)", "set"),
-            CommandSuggestion("trigger 0 rising", "Set trigger 0 to rising edge", "trigger"),
-            CommandSuggestion("trigger 0 falling", "Set trigger 0 to falling edge", "trigger"),
-            CommandSuggestion("arm", "Arm enabled triggers"),
-            CommandSuggestion("status", "Show current status"),
-        ]
-
-        if partial:
-            partial_lower = partial.lower()
-            suggestions = [s for s in suggestions if s.command.lower().startswith(partial_lower)]
-
-        return suggestions
-
     def _show_help(self) -> None:
         """Display help"""
         help_text = """
@@ -721,7 +767,9 @@ Mode: {'continuous' if self.glitch_running else 'manual'}
         self._update_glitch_state(True)
         self._log_output("[*] Continuous glitching started")
 
+        loop = asyncio.get_running_loop()
         while self.glitch_running:
+            started = loop.time()
             try:
                 # Configure and trigger
                 if self._scope:
@@ -745,7 +793,11 @@ Mode: {'continuous' if self.glitch_running else 'manual'}
                 self._update_glitch_count()
                 self._update_elapsed_time()
 
-                await asyncio.sleep(0.05)
+                # Pace attempts at GLITCH_LOOP_INTERVAL, counting the time
+                # this pass already took; a pass that overran only yields
+                # (sleep(0) skips arming a timer)
+                remaining = self.GLITCH_LOOP_INTERVAL - (loop.time() - started)
+                await asyncio.sleep(max(remaining, 0))
 
             except asyncio.CancelledError:
                 break
@@ -766,40 +818,54 @@ Mode: {'continuous' if self.glitch_running else 'manual'}
 
         self.glitch_start_time = None
 
+    def _resolve_widget(self, selector: str) -> Optional[Static]:
+        """Look up a status widget once, returning None if it is missing"""
+        try:
+            return self.query_one(selector, Static)
+        except Exception:
+            return None
+
+    def on_mount(self) -> None:
+        """Cache the status widgets touched by the hot update helpers"""
+        self._w_glitch_state = self._resolve_widget("#glitch-state-label")
+        self._w_count = self._resolve_widget("#status-count")
+        self._w_time = self._resolve_widget("#status-time")
+        for param in ("length", "repeat", "delay"):
+            self._w_params[param] = self._resolve_widget(f"#param-{param}")
+        for param in ("length", "delay"):
+            self._w_params[f"{param}-ns"] = self._resolve_widget(f"#param-{param}-ns")
+        self._w_trigger_symbols = [
+            self._resolve_widget(f"#trigger-symbol-{i}") for i in range(8)
+        ]
+
+    def on_unmount(self) -> None:
+        """Release the blocking I/O workers and cached widget refs"""
+        self._logic_widget = None
+        self._logic_stop.set()
+        self._io_pool.shutdown(wait=False)
+
     def _update_glitch_state(self, running: bool) -> None:
         """Update the glitch state label"""
-        try:
-            label = self.query_one("#glitch-state-label", Static)
+        label = self._w_glitch_state
+        if label is not None:
             label.update("ON" if running else "off")
-            if running:
-                label.add_class("glitch-active")
-            else:
-                label.remove_class("glitch-active")
-        except Exception:
-            pass
+            label.set_class(running, "glitch-active")
 
     def _update_glitch_count(self) -> None:
         """Update the glitch count display"""
-        try:
-            count_label = self.query_one("#status-count", Static)
-            count_label.update(f"{self._glitch_count}")
-        except Exception:
-            pass
+        if self._w_count is not None:
+            self._w_count.update(f"{self._glitch_count}")
 
     def _update_elapsed_time(self) -> None:
         """Update the elapsed time display"""
-        if not self.glitch_start_time:
+        if not self.glitch_start_time or self._w_time is None:
             return
 
-        try:
-            elapsed = time.time() - self.glitch_start_time
-            h = int(elapsed) // 3600
-            m = (int(elapsed) % 3600) // 60
-            s = int(elapsed) % 60
-            time_label = self.query_one("#status-time", Static)
-            time_label.update(f"{h:02d}:{m:02d}:{s:02d}")
-        except Exception:
-            pass
+        elapsed = int(time.time() - self.glitch_start_time)
+        h = elapsed // 3600
+        m = (elapsed % 3600) // 60
+        s = elapsed % 60
+        self._w_time.update(f"{h:02d}:{m:02d}:{s:02d}")
 
     async def _handle_set_command(self, args: List[str]) -> None:
         """Handle set commands"""
@@ -860,26 +926,21 @@ Mode: {'continuous' if self.glitch_running else 'manual'}
 
     def _update_param_display(self, param: str, value: int) -> None:
         """Update parameter display"""
-        try:
-            # Update the value display
-            value_label = self.query_one(f"#param-{param}", Static)
+        # Update the value display
+        value_label = self._w_params.get(param)
+        if value_label is not None:
             value_label.update(str(value))
 
-            # Update ns display for length and delay
-            if param in ("length", "delay"):
-                ns_value = value * self.CLOCK_PERIOD_NS
-                ns_label = self.query_one(f"#param-{param}-ns", Static)
-                ns_label.update(f"{ns_value:.1f}ns")
-        except Exception:
-            pass
+        # Update ns display for length and delay
+        ns_label = self._w_params.get(f"{param}-ns")
+        if ns_label is not None:
+            ns_label.update(f"{value * self.CLOCK_PERIOD_NS:.1f}ns")
 
     def _update_trigger_symbol(self, channel: int) -> None:
         """Update trigger symbol in UI"""
-        try:
-            symbol = self.query_one(f"#trigger-symbol-{channel}", Static)
+        symbol = self._w_trigger_symbols[channel]
+        if symbol is not None:
             symbol.update(self.triggers[channel].edge.value)
-        except Exception:
-            pass
 
     def _sync_status(self) -> None:
         """Sync all status displays"""
@@ -966,7 +1027,7 @@ Mode: {'continuous' if self.glitch_running else 'manual'}
         """Read data from target UART"""
         while self.uart_enabled and self._target_serial and self._target_serial.is_open:
             try:
-                data = await asyncio.get_event_loop().run_in_executor(
+                data = await asyncio.get_running_loop().run_in_executor(
                     None,
                     lambda: self._target_serial.read(
                         max(1, self._target_serial.in_waiting)
@@ -974,18 +1035,16 @@ Mode: {'continuous' if self.glitch_running else 'manual'}
                 )
 
                 if data:
-                    decoded = data.decode("utf-8", errors="ignore")
+                    # Strip carriage returns on the raw bytes in one C pass
+                    decoded = data.translate(None, b"\r").decode("utf-8", errors="ignore")
 
                     async with self._buffer_lock:
                         self._serial_buffer += decoded
                         if len(self._serial_buffer) > 4096:
                             self._serial_buffer = self._serial_buffer[-2048:]
 
-                    if self.uart_output_enabled:
-                        for char in decoded:
-                            if char == '\r':
-                                continue
-                            self.post_message(SerialDataMessage(char))
+                    if self.uart_output_enabled and decoded:
+                        self.post_message(SerialDataMessage(decoded))
 
                     await self._check_conditions()
 
@@ -1108,7 +1167,8 @@ Mode: {'continuous' if self.glitch_running else 'manual'}
 
         # Logic analyzer buttons
         if button_id == "btn-logic-capture":
-            await self._start_logic_capture()
+            if self._logic_task is None or self._logic_task.done():
+                self._logic_task = asyncio.create_task(self._start_logic_capture())
             return
         if button_id == "btn-logic-stop":
             self._stop_logic_capture()
@@ -1593,10 +1653,7 @@ Mode: {'continuous' if self.glitch_running else 'manual'}
 
         # Run capture in background to avoid blocking UI
         try:
-            capture_result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self._do_sump_capture
-            )
+            capture_result = await self._run_logic_capture_async()
 
             if capture_result:
                 # Log debug messages
@@ -1607,7 +1664,7 @@ Mode: {'continuous' if self.glitch_running else 'manual'}
                 if "error" in capture_result:
                     self._update_logic_status(f"Capture failed: {capture_result['error']}")
                     self._log_output(f"[LA] Error: {capture_result['error']}")
-                elif capture_result.get("samples"):
+                elif "samples" in capture_result:
                     # Convert to LogicCapture and display
                     logic_capture = LogicCapture(
                         channels=capture_result.get("channels", 8),
@@ -1617,18 +1674,16 @@ Mode: {'continuous' if self.glitch_running else 'manual'}
                     )
 
                     # Update waveform display
-                    try:
-                        waveform = self.query_one("#logic-waveform", LogicAnalyzerWidget)
+                    waveform = self._logic_widget
+                    if waveform is not None:
                         waveform.set_capture(logic_capture)
 
                         # Show decoded summary if protocol is set
                         decoded_summary = waveform.get_decoded_summary()
                         if decoded_summary and "No decoded" not in decoded_summary:
                             self._log_output(f"[LA] Decoded: {decoded_summary}")
-                    except Exception:
-                        pass
 
-                    sample_count = len(capture_result.get("samples", [[]])[0]) if capture_result.get("samples") else 0
+                    sample_count = logic_capture.sample_count
                     self._update_logic_status(f"Captured {sample_count} samples - use scroll buttons to navigate")
                     self._log_output(f"[LA] Capture complete: {sample_count} samples")
                 else:
@@ -1644,21 +1699,45 @@ Mode: {'continuous' if self.glitch_running else 'manual'}
 
         finally:
             self._logic_capturing = False
+            self._logic_task = None
 
-    def _do_sump_capture(self) -> dict | None:
+    async def _run_logic_capture_async(self) -> dict:
         """
-        Perform SUMP capture (runs in executor thread).
+        Perform a SUMP capture without blocking the UI.
 
-        Returns capture result dict or None on error.
-        """
-        # Store debug messages to return with result
-        debug_msgs = []
+        Debug messages logged during the capture are collected and returned
+        under the "debug" key.
 
+        Returns capture result dict (with "error" key on failure).
+        """
+        # Tracing follows the logging config: capture debug records only
+        # exist (and reach the panel) when DEBUG is enabled for this module
+        self._logic_debug = _log.isEnabledFor(logging.DEBUG)
+        debug_msgs: List[str] = []
+        handler = _ListHandler(debug_msgs, logging.DEBUG if self._logic_debug else logging.INFO)
+        _log.addHandler(handler)
         try:
-            from ...backends.sump import SUMPClient, SUMPConfig
-            import serial
-            from serial.tools.list_ports import comports
+            result = await self._sump_capture_session()
+        finally:
+            _log.removeHandler(handler)
+
+        result["debug"] = debug_msgs
+        return result
 
+    async def _sump_capture_session(self) -> dict:
+        """
+        Open the SUMP port and run one capture.
+
+        Each blocking serial stage runs on the panel's I/O pool while the
+        orchestration stays on the event loop.
+        """
+        if not HAS_SUMP:
+            return {"error": "SUMP module not available"}
+
+        loop = asyncio.get_running_loop()
+        self._logic_stop.clear()
+
+        try:
             # Determine which port to use
             # Priority: 1) User-specified port, 2) Auto-detect Bolt SUMP port, 3) device_info.port
             port = self._logic_sump_port
@@ -1669,61 +1748,102 @@ Mode: {'continuous' if self.glitch_running else 'manual'}
                 #   - First port (lower number): SUMP logic analyzer
                 #   - Second port (higher number): API for glitching/ADC
                 # The Scope library uses the API port, so device_info.port is likely wrong for SUMP
-                debug_msgs.append("Auto-detecting Bolt SUMP port...")
+                _log.debug("Auto-detecting Bolt SUMP port...")
 
-                ports = comports()
                 bolt_ports = []
-                for p in ports:
-                    # Match by product name or interface
-                    if p.product and "Curious Bolt" in p.product:
-                        bolt_ports.append(p.device)
-                    elif p.interface and "Curious Bolt" in p.interface:
-                        bolt_ports.append(p.device)
+                if sys.platform == "win32":
+                    # Registry lookup skips the slow SetupAPI/Bluetooth enumeration
+                    bolt_ports = await loop.run_in_executor(
+                        self._io_pool, find_bolt_ports_windows, BOLT_VID, BOLT_PID
+                    )
+
+                if not bolt_ports:
+                    ports = await loop.run_in_executor(self._io_pool, cached_comports)
+                    # Match by USB VID/PID (parsed by pyserial, no string work)
+                    bolt_ports = [p.device for p in ports if p.vid == BOLT_VID and p.pid == BOLT_PID]
+                if not bolt_ports:
+                    # Firmware variants may enumerate under another PID
+                    bolt_ports = [
+                        p.device for p in ports
+                        if any(_BOLT_TAG in s for s in (p.product, p.interface) if s)
+                    ]
 
                 if bolt_ports:
                     # Sort to get consistent order, SUMP is the FIRST (lower) port
                     bolt_ports.sort()
                     port = bolt_ports[0]  # First port = SUMP
-                    debug_msgs.append(f"Found Bolt ports: {bolt_ports}")
-                    debug_msgs.append(f"Using SUMP port: {port} (first of {len(bolt_ports)})")
+
+                    # Several candidates (e.g. more than one Bolt): probe them
+                    # all at once and take the first, in port order, that
+                    # answers as SUMP. Skip the port the glitch API holds open.
+                    api_port = getattr(self._scope, "_port", None)
+                    candidates = [p for p in bolt_ports if p != api_port]
+                    if len(candidates) > 1:
+                        results = await asyncio.gather(
+                            *(self._probe_sump(p) for p in candidates),
+                            return_exceptions=True
+                        )
+                        responding = [r[0] for r in results if not isinstance(r, BaseException)]
+                        if responding:
+                            port = responding[0]
+                        elif self._logic_debug:
+                            _log.debug("No candidate answered a SUMP probe")
+
+                    if self._logic_debug:
+                        _log.debug("Found Bolt ports: %s", bolt_ports)
+                        _log.debug("Using SUMP port: %s (first of %d)", port, len(bolt_ports))
                 else:
+                    # Nothing found - re-enumerate next time in case the Bolt was just plugged in
+                    cached_comports.cache_clear()
                     # Fallback to device_info.port (may not work for SUMP)
                     port = self.device_info.port
-                    debug_msgs.append(f"No Bolt ports auto-detected, using device port: {port}")
+                    if self._logic_debug:
+                        _log.debug("No Bolt ports auto-detected, using device port: %s", port)
 
             if not port:
-                return {"error": "No SUMP port configured", "debug": debug_msgs}
+                return {"error": "No SUMP port configured"}
 
-            debug_msgs.append(f"Opening port: {port}")
+            _log.debug("Opening port: %s", port)
 
-            # Open serial connection for SUMP
+            # Open serial connection for SUMP. write_timeout keeps a wedged
+            # device from hanging a command write; exclusive stops a second
+            # capture from sharing the port (POSIX).
             try:
-                ser = serial.Serial(port, baudrate=115200, timeout=2)
+                ser = await loop.run_in_executor(
+                    self._io_pool,
+                    functools.partial(
+                        serial.Serial, port, baudrate=115200,
+                        timeout=2, write_timeout=2, exclusive=True
+                    )
+                )
             except Exception as e:
-                return {"error": f"Failed to open port {port}: {e}", "debug": debug_msgs}
+                return {"error": f"Failed to open port {port}: {e}"}
 
-            try:
-                # Enable debug for troubleshooting
-                client = SUMPClient(ser, debug=True)
+            with ser:
+                # SUMP protocol tracing follows the panel debug setting
+                client = SUMPClient(ser, debug=self._logic_debug)
 
                 # Reset and identify
-                debug_msgs.append("Resetting SUMP device...")
-                client.reset()
+                _log.debug("Resetting SUMP device...")
+                await loop.run_in_executor(self._io_pool, client.reset)
 
-                debug_msgs.append("Identifying SUMP device...")
-                success, device_id = client.identify()
+                _log.debug("Identifying SUMP device...")
+                success, device_id = await loop.run_in_executor(self._io_pool, client.identify)
 
                 if not success:
-                    debug_msgs.append(f"SUMP not responding - got: '{device_id}'")
+                    _log.debug("SUMP not responding - got: '%s'", device_id)
                     # Try reading raw data to see what's there
                     ser.reset_input_buffer()
-                    time.sleep(0.1)
-                    raw = ser.read(100)
+                    # Wait up to 100 ms, but stop as soon as bytes arrive
+                    deadline = time.monotonic() + 0.1
+                    while time.monotonic() < deadline and ser.in_waiting < 1:
+                        await asyncio.sleep(0.005)
+                    raw = await loop.run_in_executor(self._io_pool, ser.read, ser.in_waiting or 100)
                     if raw:
-                        debug_msgs.append(f"Raw data on port: {raw.hex()}")
-                    return {"error": "SUMP device not responding", "debug": debug_msgs}
+                        _log.debug("Raw data on port: %s", raw.hex())
+                    return {"error": "SUMP device not responding"}
 
-                debug_msgs.append(f"SUMP identified: {device_id}")
+                _log.debug("SUMP identified: %s", device_id)
 
                 # Configure capture
                 # Bolt base clock: 31.25 MHz
@@ -1744,74 +1864,113 @@ Mode: {'continuous' if self.glitch_running else 'manual'}
                     else:
                         config.trigger_value = 0
 
-                debug_msgs.append(f"Configuring: rate={self._logic_sample_rate}, samples={self._logic_sample_count}")
-                client.configure(config)
-
-                # Capture
-                debug_msgs.append("Starting capture (waiting for data)...")
-                capture = client.capture(timeout=10.0)
-
-                if capture:
-                    debug_msgs.append(f"Capture complete: {len(capture.samples[0]) if capture.samples else 0} samples")
+                _log.debug("Configuring: rate=%d, samples=%d", self._logic_sample_rate, self._logic_sample_count)
+                await loop.run_in_executor(self._io_pool, client.configure, config)
+
+                # Stream the capture straight into the reusable buffer - the
+                # read loop checks the stop event between chunks. SUMP sends
+                # the newest sample first, so the reversed view of the bytes
+                # received so far is the capture-order tail.
+                _log.debug("Starting capture (waiting for data)...")
+                expected = client.expected_bytes
+                if self._capture_buf is None or self._capture_buf.size != expected:
+                    self._capture_buf = np.empty(expected, dtype=np.uint8)
+                buf = self._capture_buf
+                stream = client.capture_into(buf, timeout=10.0, stop_event=self._logic_stop)
+                received = 0
+
+                while True:
+                    count = await loop.run_in_executor(self._io_pool, next, stream, None)
+                    if count is None:
+                        break
+                    received = count
+
+                    pct = 100 * received // expected
+                    if self._logic_debug:
+                        _log.debug("Received %d/%d bytes (%d%%)", received, expected, pct)
+                    self._update_logic_status(f"Capturing... {pct}%")
+                    if self._logic_widget is not None:
+                        self._logic_widget.show_partial(buf[:received][::-1], self._logic_sample_rate)
+
+                if self._logic_stop.is_set():
+                    _log.debug("Capture aborted by user")
+                    return {"error": "Capture stopped"}
+
+                if received:
+                    # Copy out of the reused buffer: the next capture reads
+                    # into it while this one is still on screen
+                    samples = buf[:received][::-1].copy()
+                    _log.debug("Capture complete: %d samples", samples.shape[-1])
                     return {
-                        "channels": capture.channels,
-                        "sample_rate": capture.sample_rate,
-                        "samples": capture.samples,
-                        "trigger_position": capture.trigger_position,
-                        "debug": debug_msgs,
+                        "channels": 8,
+                        "sample_rate": self._logic_sample_rate,
+                        "samples": samples,
+                        "trigger_position": client.find_trigger(samples),
                     }
 
-                debug_msgs.append("Capture returned no data (timeout?)")
-                return {"error": "Capture timeout", "debug": debug_msgs}
+                _log.debug("Capture returned no data (timeout?)")
+                return {"error": "Capture timeout"}
 
-            finally:
-                ser.close()
-
-        except ImportError:
-            return {"error": "SUMP module not available", "debug": debug_msgs}
         except Exception as e:
-            debug_msgs.append(f"Exception: {e}")
-            return {"error": str(e), "debug": debug_msgs}
+            _log.debug("Exception: %s", e)
+            return {"error": str(e)}
+
+    async def _probe_sump(self, port: str) -> Tuple[str, str]:
+        """
+        Check whether a port answers SUMP reset + identify.
+
+        Returns (port, device_id), raises if the port does not respond.
+        """
+        def probe() -> Tuple[str, str]:
+            with serial.Serial(
+                port, baudrate=115200, timeout=0.5, write_timeout=0.5, exclusive=True
+            ) as ser:
+                client = SUMPClient(ser)
+                client.reset()
+                success, device_id = client.identify()
+            if not success:
+                raise IOError(f"{port}: no SUMP response ({device_id})")
+            return port, device_id
+
+        # Default executor, so every candidate is probed in parallel
+        return await asyncio.get_running_loop().run_in_executor(None, probe)
 
     def _stop_logic_capture(self) -> None:
         """Stop any in-progress logic capture"""
-        # Note: SUMP captures are blocking, so we can't easily abort mid-capture
-        # This mainly updates state for UI feedback
+        # The SUMP read loop polls this between reads, so the capture task
+        # winds down on its own and closes the port
+        if self._logic_task and not self._logic_task.done():
+            self._logic_stop.set()
         self._logic_capturing = False
         self._update_logic_status("Capture stopped")
         self._log_output("[LA] Capture stopped")
 
     def _load_logic_demo(self) -> None:
         """Load demo data for testing the logic analyzer display"""
-        import random
+        n = 1000
+
+        # Draw all random bits up front: CH1 states, then CH2-7 initial levels
+        bits = _DEMO_RNG.integers(0, 2, size=n // 10 + 6, dtype=np.uint8)
+        flips = _DEMO_RNG.random((6, n))
 
-        # Generate demo waveforms with realistic patterns
-        samples = []
+        # Generate demo waveforms packed one byte per sample (bit c = CHc)
+        samples = np.zeros(n, dtype=np.uint8)
 
         # CH0: Clock signal (regular square wave)
-        ch0 = []
-        for i in range(1000):
-            ch0.append(1 if (i // 10) % 2 == 0 else 0)
-        samples.append(ch0)
-
-        # CH1: Data signal (random with some structure)
-        ch1 = []
-        state = 0
-        for i in range(1000):
-            if i % 10 == 5:  # Change on "falling" clock edges
-                state = random.randint(0, 1)
-            ch1.append(state)
-        samples.append(ch1)
-
-        # CH2-7: Various random patterns
+        samples |= (((np.arange(n) // 10) & 1) ^ 1).astype(np.uint8)
+
+        # CH1: Data signal, new random bit on each "falling" clock edge (i % 10 == 5)
+        ch1 = np.zeros(n, dtype=np.uint8)
+        ch1[5:] = np.repeat(bits[:n // 10], 10)[:n - 5]
+        samples |= ch1 << 1
+
+        # CH2-7: Random toggles at different transition rates
+        thresh = 0.03 + np.arange(6)[:, None] * 0.01
+        toggles = flips < thresh
+        initial = bits[n // 10:, None]
+        rows = ((np.cumsum(toggles, axis=1) & 1) ^ initial).astype(np.uint8)
         for ch in range(6):
-            channel_samples = []
-            state = random.randint(0, 1)
-            for i in range(1000):
-                if random.random() < 0.03 + (ch * 0.01):  # Different transition rates
-                    state = 1 - state
-                channel_samples.append(state)
-            samples.append(channel_samples)
+            samples |= rows[ch] << (ch + 2)
 
         # Create capture and display
         capture = LogicCapture(
@@ -1821,36 +1980,24 @@ Mode: {'continuous' if self.glitch_running else 'manual'}
             trigger_position=100
         )
 
-        try:
-            waveform = self.query_one("#logic-waveform", LogicAnalyzerWidget)
-            waveform.set_capture(capture)
-        except Exception:
-            pass
+        if self._logic_widget is not None:
+            self._logic_widget.set_capture(capture)
 
         self._update_logic_status("Demo data loaded - use scroll buttons to navigate")
         self._log_output("[LA] Demo data loaded (1000 samples, 8 channels)")
 
     def _logic_scroll_left(self) -> None:
         """Scroll logic waveform left"""
-        try:
-            waveform = self.query_one("#logic-waveform", LogicAnalyzerWidget)
-            waveform.scroll_left(20)
-        except Exception:
-            pass
+        if self._logic_widget is not None:
+            self._logic_widget.scroll_left(20)
 
     def _logic_scroll_right(self) -> None:
         """Scroll logic waveform right"""
-        try:
-            waveform = self.query_one("#logic-waveform", LogicAnalyzerWidget)
-            waveform.scroll_right(20)
-        except Exception:
-            pass
+        if self._logic_widget is not None:
+            self._logic_widget.scroll_right(20)
 
     def _logic_goto_trigger(self) -> None:
         """Scroll to trigger position"""
-        try:
-            waveform = self.query_one("#logic-waveform", LogicAnalyzerWidget)
-            waveform.scroll_to_trigger()
+        if self._logic_widget is not None:
+            self._logic_widget.scroll_to_trigger()
             self._update_logic_status("Scrolled to trigger position")
-        except Exception:
-            pass
@@ -6,32 +6,49 @@ Supports: SPI, I2C, UART, 1-Wire, JTAG/SWD scanning, Logic Analyzer, ADC, PWM
 """
 
 import asyncio
-from typing import List, Optional
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+from rich.table import Table
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical, Horizontal, Grid
+from textual.timer import Timer
+from textual.widget import Widget
 from textual.widgets import Static, Button, Input, Select, Switch, Log, TabbedContent, TabPane
 
+from ...backends import get_backend
+from ...backends import SPIConfig as BackendSPIConfig
+from ...backends import I2CConfig as BackendI2CConfig
+from ...backends import UARTConfig as BackendUARTConfig
 from .base import DevicePanel, DeviceInfo, PanelCapability, CommandSuggestion
 from .logic_analyzer import LogicAnalyzerWidget, LogicCapture
 from .protocol_decoders import ProtocolType
 
 
-@dataclass
+_log = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
 class SPIConfig:
     speed: int = 1000000
     mode: int = 0
     cs_active_low: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class I2CConfig:
     speed: int = 100000
     address: int = 0x50
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UARTConfig:
     baud: int = 115200
     data_bits: int = 8
@@ -39,6 +56,197 @@ class UARTConfig:
     stop_bits: int = 1
 
 
+# Shared generator for demo waveforms
+_DEMO_RNG = np.random.default_rng()
+
+# Modes accepted by the "mode" console command (upper-cased)
+_VALID_MODES = frozenset({"HIZ", "SPI", "I2C", "UART", "1WIRE", "2WIRE", "3WIRE"})
+
+# Select options, built once and shared by every panel instance
+_MODE_OPTIONS = tuple(
+    (mode, mode) for mode in ("HiZ", "SPI", "I2C", "UART", "1-Wire", "2-Wire", "3-Wire")
+)
+_VOLTAGE_OPTIONS = (("3.3V", "3.3"), ("5V", "5.0"), ("Off", "0"))
+_PINOUT_VOLTAGE_OPTIONS = (("3.3V", "3300"), ("5.0V", "5000"), ("1.8V", "1800"), ("2.5V", "2500"))
+_SCAN_VOLTAGE_OPTIONS = (("3.3V", "3.3"), ("1.8V", "1.8"), ("5V", "5.0"))
+
+_SPI_SPEED_OPTIONS = (
+    ("1MHz", "1000000"), ("2MHz", "2000000"), ("4MHz", "4000000"),
+    ("8MHz", "8000000"), ("16MHz", "16000000"), ("24MHz", "24000000"),
+)
+_SPI_MODE_OPTIONS = (
+    ("0 (CPOL=0,CPHA=0)", "0"), ("1 (CPOL=0,CPHA=1)", "1"),
+    ("2 (CPOL=1,CPHA=0)", "2"), ("3 (CPOL=1,CPHA=1)", "3"),
+)
+_SPI_CS_OPTIONS = (("Active Low", "low"), ("Active High", "high"))
+_I2C_SPEED_OPTIONS = (
+    ("100kHz (Standard)", "100000"), ("400kHz (Fast)", "400000"),
+    ("1MHz (Fast+)", "1000000"),
+)
+_UART_BAUD_OPTIONS = tuple(
+    (baud, baud) for baud in ("9600", "19200", "38400", "57600", "115200", "230400", "460800", "921600")
+)
+# Frame formats offered in the UART tab -> (data_bits, parity, stop_bits)
+_UART_FORMATS = {
+    fmt: (int(fmt[0]), fmt[1], int(fmt[2])) for fmt in ("8N1", "8E1", "8O1", "7E1", "7O1")
+}
+_UART_FORMAT_OPTIONS = tuple((fmt, fmt) for fmt in _UART_FORMATS)
+
+# Status tab groups: (block widget id, title, ((field id, label), ...))
+_STATUS_GROUPS = (
+    ("status-version-block", "Version Information", (
+        ("status-flatbuffers", "FlatBuffers:"),
+        ("status-hardware", "Hardware:"),
+        ("status-firmware", "Firmware:"),
+        ("status-git-hash", "Git Hash:"),
+        ("status-build-date", "Build Date:"),
+    )),
+    ("status-mode-block", "Mode Information", (
+        ("status-mode", "Current Mode:"),
+        ("status-modes-available", "Available:"),
+        ("status-bit-order", "Bit Order:"),
+        ("status-pins", "Pin Labels:"),
+        ("status-max-packet", "Max Packet:"),
+        ("status-max-write", "Max Write:"),
+        ("status-max-read", "Max Read:"),
+    )),
+    ("status-power-block", "Power Supply", (
+        ("status-psu", "PSU Enabled:"),
+        ("status-set-voltage", "Set Voltage:"),
+        ("status-set-current", "Set Current:"),
+        ("status-voltage-meas", "Measured V:"),
+        ("status-current-meas", "Measured I:"),
+        ("status-oc-error", "OC Error:"),
+        ("status-pullups", "Pull-ups:"),
+    )),
+    ("status-io-block", "IO Pins", (
+        ("status-adc-values", "ADC Values:"),
+        ("status-io-directions", "Directions:"),
+        ("status-io-values", "Values:"),
+    )),
+    ("status-system-block", "System", (
+        ("status-leds", "LEDs:"),
+        ("status-disk-size", "Disk Size:"),
+        ("status-disk-used", "Disk Used:"),
+    )),
+)
+# Status field id -> block widget id, and block widget id -> its fields
+_STATUS_FIELD_BLOCKS = {field: block for block, _, fields in _STATUS_GROUPS for field, _ in fields}
+_STATUS_BLOCK_FIELDS = {block: fields for block, _, fields in _STATUS_GROUPS}
+
+
+# Pinout diagrams: a shared header, the live voltage row, then the
+# protocol-specific pin assignments
+_PINOUT_HEAD = (
+    "┌─────────────────────────────────────────────────────────────────────┐\n"
+    "│  Pin 1     2     3     4     5     6     7     8     9    10        │\n"
+    "│  VOUT    IO0   IO1   IO2   IO3   IO4   IO5   IO6   IO7   GND        │\n"
+)
+_SPI_PINOUT_TAIL = (
+    "│          └─────────────────┘     MISO   CS   CLK  MOSI              │\n"
+    "│               Auxiliary                                             │\n"
+    "└─────────────────────────────────────────────────────────────────────┘\n"
+    "  IO4=MISO (Master In)    IO6=CLK (Clock)\n"
+    "  IO5=CS (Chip Select)    IO7=MOSI (Master Out)"
+)
+_I2C_PINOUT_TAIL = (
+    "│          SDA   SCL         AUX                                      │\n"
+    "│                                                                     │\n"
+    "└─────────────────────────────────────────────────────────────────────┘\n"
+    "  IO0=SDA (Data)     IO1=SCL (Clock)\n"
+    "  Enable pull-ups for I2C (typical 4.7kΩ to VOUT)"
+)
+_UART_PINOUT_TAIL = (
+    "│                            AUX    TX    RX                          │\n"
+    "│                                                                     │\n"
+    "└─────────────────────────────────────────────────────────────────────┘\n"
+    "  IO4=TX (BP output → Target RX)\n"
+    "  IO5=RX (BP input ← Target TX)"
+)
+
+# "0x00".."0xFF", for address listings
+_HEX_BYTES = tuple(f"0x{i:02X}" for i in range(256))
+
+# JEDEC manufacturer IDs of common SPI flash vendors
+_SPI_MFR_NAMES = {
+    0xEF: "Winbond",
+    0xC2: "Macronix",
+    0x20: "Micron",
+    0x01: "Spansion",
+    0xBF: "SST",
+    0x1F: "Atmel",
+}
+
+_LOGIC_RATE_OPTIONS = (
+    ("62.5 MHz", "62500000"),
+    ("31.25 MHz", "31250000"),
+    ("10 MHz", "10000000"),
+    ("5 MHz", "5000000"),
+    ("1 MHz", "1000000"),
+    ("500 kHz", "500000"),
+    ("100 kHz", "100000"),
+)
+_LOGIC_SAMPLES_OPTIONS = (
+    ("1K", "1024"),
+    ("4K", "4096"),
+    ("8K", "8192"),
+    ("16K", "16384"),
+    ("32K", "32768"),
+)
+_LOGIC_MAX_SAMPLES = max(int(value) for _, value in _LOGIC_SAMPLES_OPTIONS)
+_LOGIC_PROTOCOL_OPTIONS = (("None", "none"), ("SPI", "spi"), ("I2C", "i2c"), ("UART", "uart"))
+_TRIGGER_EDGE_OPTIONS = (("Rising", "rising"), ("Falling", "falling"))
+
+# Logic trigger channel Select options and the channel each value maps to
+_TRIGGER_CHANNEL_OPTIONS = (("None", "none"),) + tuple((f"CH{i}", str(i)) for i in range(8))
+_TRIGGER_MAP = {"none": None, **{str(i): i for i in range(8)}}
+
+# Status tab IO pin labels, indexed [pin][bit]
+_IO_DIRECTION_LABELS = tuple((f"IO{i}:IN", f"IO{i}:OUT") for i in range(8))
+_IO_LEVEL_LABELS = tuple((f"IO{i}:LOW", f"IO{i}:HIGH") for i in range(8))
+
+
+def _gen_spi_data(n: int, rng: np.random.Generator, samples_per_bit: int = 8) -> np.ndarray:
+    """
+    Simulated SPI MOSI line: random bytes sent MSB first.
+
+    Each bit is held for samples_per_bit samples, so a new byte starts
+    every 8 * samples_per_bit samples. Returns a 0/1 uint8 array.
+    """
+    data_bytes = rng.integers(0, 256, size=n // (8 * samples_per_bit) + 1, dtype=np.uint8)
+    # unpackbits is MSB first already; stretch each bit over its samples
+    return np.repeat(np.unpackbits(data_bytes), samples_per_bit)[:n]
+
+
+def _format_voltage(mv: int) -> str:
+    """Format millivolt value for display (e.g., '3.3V' or '---')"""
+    if mv <= 0:
+        return "---"
+    elif mv < 1000:
+        return f"{mv}mV"
+    else:
+        return f"{mv/1000:.1f}V"
+
+
+@functools.lru_cache(maxsize=64)
+def _pinout_voltage_row(vout_mv: int, adc_mv: Tuple[int, ...]) -> str:
+    """Pinout voltage row for a PSU reading and up to 8 ADC readings (memoised)"""
+    vout = _format_voltage(vout_mv)
+    v = [_format_voltage(adc_mv[i]) if i < len(adc_mv) else "---" for i in range(8)]
+    return f"│  {vout:^5} {v[0]:^5} {v[1]:^5} {v[2]:^5} {v[3]:^5} {v[4]:^5} {v[5]:^5} {v[6]:^5} {v[7]:^5}  0V         │\n"
+
+
+class _ComposedSection(Vertical):
+    """Container whose children come from one of the panel's _build_* methods"""
+
+    def __init__(self, build: Callable[[], ComposeResult], **kwargs):
+        super().__init__(**kwargs)
+        self._build = build
+
+    def compose(self) -> ComposeResult:
+        yield from self._build()
+
+
 class BusPiratePanel(DevicePanel):
     """
     Panel for Bus Pirate 5/6 devices.
@@ -53,7 +261,7 @@ class BusPiratePanel(DevicePanel):
     """
 
     DEVICE_NAME = "Bus Pirate"
-    CAPABILITIES = [
+    CAPABILITIES = (
         PanelCapability.SPI,
         PanelCapability.I2C,
         PanelCapability.UART,
@@ -63,7 +271,43 @@ class BusPiratePanel(DevicePanel):
         PanelCapability.ADC,
         PanelCapability.PWM,
         PanelCapability.GPIO,
-    ]
+    )
+
+    SUGGESTIONS = (
+        CommandSuggestion("help", "Show available commands"),
+        CommandSuggestion("mode spi", "Switch to SPI mode", "mode"),
+        CommandSuggestion("mode i2c", "Switch to I2C mode", "mode"),
+        CommandSuggestion("mode uart", "Switch to UART mode", "mode"),
+        CommandSuggestion("spi id", "Read SPI flash ID", "spi"),
+        CommandSuggestion("spi dump", "Dump SPI flash", "spi"),
+        CommandSuggestion("i2c scan", "Scan I2C bus for devices", "i2c"),
+        CommandSuggestion("logic capture", "Start logic capture", "logic"),
+        CommandSuggestion("power on", "Enable power supply", "power"),
+        CommandSuggestion("power off", "Disable power supply", "power"),
+        CommandSuggestion("adc read", "Read ADC voltage", "adc"),
+    )
+
+    # Status tab text styles, resolved from the .status-* rules in style.tcss
+    COMPONENT_CLASSES = {
+        "status-key", "status-val", "status-val-on", "status-val-off", "status-val-error",
+    }
+
+    # Widgets read or updated by handlers, resolved once in on_mount
+    _CACHED_WIDGET_IDS = (
+        # Status tab
+        *(block for block, _, _ in _STATUS_GROUPS),
+        # Protocol tab
+        "spi-speed", "spi-mode", "spi-cs", "i2c-speed", "i2c-addr",
+        "uart-baud", "uart-format",
+        "spi-voltage-select", "i2c-voltage-select", "uart-voltage-select",
+    )
+
+    # Feature tabs built on first activation: content tab id -> (pane id, builder)
+    _LAZY_TABS = {
+        "--content-tab-tab-scan": ("tab-scan", "_build_scan_section"),
+        "--content-tab-tab-logic": ("tab-logic", "_build_logic_section"),
+        "--content-tab-tab-power": ("tab-power", "_build_power_section"),
+    }
 
     def __init__(self, device_info: DeviceInfo, app, *args, **kwargs):
         super().__init__(device_info, app, *args, **kwargs)
@@ -71,16 +315,46 @@ class BusPiratePanel(DevicePanel):
         self.spi_config = SPIConfig()
         self.i2c_config = I2CConfig()
         self.uart_config = UARTConfig()
+        # Last SPI/I2C/UART config the device accepted (None when unknown)
+        self._applied_config = None
         self.power_enabled = False
         self.pullups_enabled = False
         self._backend = None
+        # Single worker: BPIO2 calls share one serial port, so they must not
+        # overlap; a one-thread pool runs them in order off the event loop
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="buspirate-io")
         self._logic_widget: Optional[LogicAnalyzerWidget] = None
+        self._logic_rate_select: Optional[Select] = None
+        self._logic_samples_select: Optional[Select] = None
+        self._logic_trigger_ch_select: Optional[Select] = None
+        self._logic_trigger_edge_select: Optional[Select] = None
+        self._logic_sump_port_input: Optional[Input] = None
+        self._logic_log_widget: Optional[Log] = None
+        self._built_tabs: set = set()
+        self._widgets: Dict[str, Widget] = {}
         self._logic_capturing = False
+        self._logic_task: Optional[asyncio.Task] = None
+        self._logic_stop = threading.Event()  # Polled by the SUMP read loop
+        # Reused across captures; sized for the largest sample count option
+        self._logic_buffer = np.zeros(_LOGIC_MAX_SAMPLES, dtype=np.uint8)
         # Live ADC values for pinout display (in mV)
         self._adc_values: List[int] = [0] * 8
         self._psu_measured_mv: int = 0
         self._psu_measured_ma: int = 0
         self._pinout_refresh_timer = None
+        self._pinout_row = ""  # Voltage row last painted into the pinouts
+        self._adc_refreshing = False  # An ADC read is on the I/O worker
+        # Last (value, css class) written to each Status tab field
+        self._status_cache: Dict[str, Tuple[str, str]] = {}
+        # Status blocks with fields changed since they were last painted
+        self._status_dirty: set = set()
+        # Pending debounced Select/Switch changes, by debounce slot
+        self._debounce_timers: Dict[str, Timer] = {}
+        # monotonic() of the last UART scan progress line
+        self._uart_progress_t = 0.0
+        # Lines waiting to be written to each Log widget, by widget id
+        self._log_pending: Dict[str, List[str]] = {}
+        self._log_flush_timer: Optional[Timer] = None
 
     def compose(self) -> ComposeResult:
         with Vertical(id="buspirate-panel"):
@@ -90,14 +364,14 @@ class BusPiratePanel(DevicePanel):
                 yield Static(f"Port: {self.device_info.port}", classes="device-port")
                 yield Static(f"Mode: ", classes="mode-label")
                 yield Select(
-                    [(mode, mode) for mode in ["HiZ", "SPI", "I2C", "UART", "1-Wire", "2-Wire", "3-Wire"]],
+                    _MODE_OPTIONS,
                     value="HiZ",
                     id="mode-select",
                     classes="mode-select"
                 )
                 yield Static(" Voltage:", classes="voltage-label")
                 yield Select(
-                    [("3.3V", "3.3"), ("5V", "5.0"), ("Off", "0")],
+                    _VOLTAGE_OPTIONS,
                     value="3.3",
                     id="voltage-select",
                     classes="voltage-select"
@@ -113,17 +387,17 @@ class BusPiratePanel(DevicePanel):
                 with TabPane("Protocol", id="tab-protocol"):
                     yield from self._build_protocol_section()
 
+                # Scan, Logic and Power tabs are filled in on first
+                # activation (see _LAZY_TABS)
+
                 # Scan Tab - JTAG/SWD pin detection
-                with TabPane("Scan", id="tab-scan"):
-                    yield from self._build_scan_section()
+                yield TabPane("Scan", id="tab-scan")
 
                 # Logic Tab - Logic analyzer
-                with TabPane("Logic", id="tab-logic"):
-                    yield from self._build_logic_section()
+                yield TabPane("Logic", id="tab-logic")
 
                 # Power Tab - ADC/PWM/Power
-                with TabPane("Power", id="tab-power"):
-                    yield from self._build_power_section()
+                yield TabPane("Power", id="tab-power")
 
             # Console at bottom
             yield from self._build_console_section()
@@ -135,80 +409,11 @@ class BusPiratePanel(DevicePanel):
             with Horizontal(classes="button-row"):
                 yield Button("Refresh", id="btn-status-refresh", classes="btn-action")
 
-            # Version Information group
-            with Container(classes="status-group"):
-                yield Static("Version Information", classes="status-group-title")
-                with Grid(classes="status-grid-2col"):
-                    yield Static("FlatBuffers:", classes="status-key")
-                    yield Static("---", id="status-flatbuffers", classes="status-val")
-                    yield Static("Hardware:", classes="status-key")
-                    yield Static("---", id="status-hardware", classes="status-val")
-                    yield Static("Firmware:", classes="status-key")
-                    yield Static("---", id="status-firmware", classes="status-val")
-                    yield Static("Git Hash:", classes="status-key")
-                    yield Static("---", id="status-git-hash", classes="status-val")
-                    yield Static("Build Date:", classes="status-key")
-                    yield Static("---", id="status-build-date", classes="status-val")
-
-            # Mode Information group
-            with Container(classes="status-group"):
-                yield Static("Mode Information", classes="status-group-title")
-                with Grid(classes="status-grid-2col"):
-                    yield Static("Current Mode:", classes="status-key")
-                    yield Static("---", id="status-mode", classes="status-val")
-                    yield Static("Available:", classes="status-key")
-                    yield Static("---", id="status-modes-available", classes="status-val")
-                    yield Static("Bit Order:", classes="status-key")
-                    yield Static("---", id="status-bit-order", classes="status-val")
-                    yield Static("Pin Labels:", classes="status-key")
-                    yield Static("---", id="status-pins", classes="status-val")
-                    yield Static("Max Packet:", classes="status-key")
-                    yield Static("---", id="status-max-packet", classes="status-val")
-                    yield Static("Max Write:", classes="status-key")
-                    yield Static("---", id="status-max-write", classes="status-val")
-                    yield Static("Max Read:", classes="status-key")
-                    yield Static("---", id="status-max-read", classes="status-val")
-
-            # Power Supply group
-            with Container(classes="status-group"):
-                yield Static("Power Supply", classes="status-group-title")
-                with Grid(classes="status-grid-2col"):
-                    yield Static("PSU Enabled:", classes="status-key")
-                    yield Static("---", id="status-psu", classes="status-val")
-                    yield Static("Set Voltage:", classes="status-key")
-                    yield Static("---", id="status-set-voltage", classes="status-val")
-                    yield Static("Set Current:", classes="status-key")
-                    yield Static("---", id="status-set-current", classes="status-val")
-                    yield Static("Measured V:", classes="status-key")
-                    yield Static("---", id="status-voltage-meas", classes="status-val")
-                    yield Static("Measured I:", classes="status-key")
-                    yield Static("---", id="status-current-meas", classes="status-val")
-                    yield Static("OC Error:", classes="status-key")
-                    yield Static("---", id="status-oc-error", classes="status-val")
-                    yield Static("Pull-ups:", classes="status-key")
-                    yield Static("---", id="status-pullups", classes="status-val")
-
-            # IO Pins group
-            with Container(classes="status-group"):
-                yield Static("IO Pins", classes="status-group-title")
-                with Grid(classes="status-grid-2col"):
-                    yield Static("ADC Values:", classes="status-key")
-                    yield Static("---", id="status-adc-values", classes="status-val")
-                    yield Static("Directions:", classes="status-key")
-                    yield Static("---", id="status-io-directions", classes="status-val")
-                    yield Static("Values:", classes="status-key")
-                    yield Static("---", id="status-io-values", classes="status-val")
-
-            # System group
-            with Container(classes="status-group"):
-                yield Static("System", classes="status-group-title")
-                with Grid(classes="status-grid-2col"):
-                    yield Static("LEDs:", classes="status-key")
-                    yield Static("---", id="status-leds", classes="status-val")
-                    yield Static("Disk Size:", classes="status-key")
-                    yield Static("---", id="status-disk-size", classes="status-val")
-                    yield Static("Disk Used:", classes="status-key")
-                    yield Static("---", id="status-disk-used", classes="status-val")
+            # One pre-rendered block per group, repainted as a whole
+            for block_id, title, fields in _STATUS_GROUPS:
+                with Container(classes="status-group"):
+                    yield Static(title, classes="status-group-title")
+                    yield Static(self._render_status_block(fields), id=block_id, classes="status-block")
 
     def _build_protocol_section(self) -> ComposeResult:
         """Protocol-specific controls with subtabs for SPI, I2C, UART"""
@@ -231,7 +436,7 @@ class BusPiratePanel(DevicePanel):
             yield Static("VOUT:", classes="power-label")
             yield Switch(id=f"{prefix}-power-switch", value=False)
             yield Select(
-                [("3.3V", "3300"), ("5.0V", "5000"), ("1.8V", "1800"), ("2.5V", "2500")],
+                _PINOUT_VOLTAGE_OPTIONS,
                 value="3300",
                 id=f"{prefix}-voltage-select",
                 classes="voltage-select-sm"
@@ -261,22 +466,20 @@ class BusPiratePanel(DevicePanel):
             with Horizontal(classes="config-row"):
                 yield Static("Speed:", classes="config-label")
                 yield Select(
-                    [("1MHz", "1000000"), ("2MHz", "2000000"), ("4MHz", "4000000"),
-                     ("8MHz", "8000000"), ("16MHz", "16000000"), ("24MHz", "24000000")],
+                    _SPI_SPEED_OPTIONS,
                     value="1000000",
                     id="spi-speed",
                     classes="config-select"
                 )
                 yield Static("Mode:", classes="config-label")
                 yield Select(
-                    [("0 (CPOL=0,CPHA=0)", "0"), ("1 (CPOL=0,CPHA=1)", "1"),
-                     ("2 (CPOL=1,CPHA=0)", "2"), ("3 (CPOL=1,CPHA=1)", "3")],
+                    _SPI_MODE_OPTIONS,
                     value="0",
                     id="spi-mode",
                     classes="config-select"
                 )
                 yield Static("CS:", classes="config-label")
-                yield Select([("Active Low", "low"), ("Active High", "high")], value="low", id="spi-cs", classes="config-select-sm")
+                yield Select(_SPI_CS_OPTIONS, value="low", id="spi-cs", classes="config-select-sm")
 
             # Flash Operations
             yield Static("Flash Operations", classes="section-subtitle")
@@ -317,8 +520,7 @@ class BusPiratePanel(DevicePanel):
             with Horizontal(classes="config-row"):
                 yield Static("Speed:", classes="config-label")
                 yield Select(
-                    [("100kHz (Standard)", "100000"), ("400kHz (Fast)", "400000"),
-                     ("1MHz (Fast+)", "1000000")],
+                    _I2C_SPEED_OPTIONS,
                     value="100000",
                     id="i2c-speed",
                     classes="config-select"
@@ -374,16 +576,14 @@ class BusPiratePanel(DevicePanel):
             with Horizontal(classes="config-row"):
                 yield Static("Baud:", classes="config-label")
                 yield Select(
-                    [("9600", "9600"), ("19200", "19200"), ("38400", "38400"),
-                     ("57600", "57600"), ("115200", "115200"), ("230400", "230400"),
-                     ("460800", "460800"), ("921600", "921600")],
+                    _UART_BAUD_OPTIONS,
                     value="115200",
                     id="uart-baud",
                     classes="config-select"
                 )
                 yield Static("Format:", classes="config-label")
                 yield Select(
-                    [("8N1", "8N1"), ("8E1", "8E1"), ("8O1", "8O1"), ("7E1", "7E1"), ("7O1", "7O1")],
+                    _UART_FORMAT_OPTIONS,
                     value="8N1",
                     id="uart-format",
                     classes="config-select-sm"
@@ -413,7 +613,7 @@ class BusPiratePanel(DevicePanel):
                 yield Static("Pins to scan:")
                 yield Input(value="0-7", id="scan-pins", classes="pin-input")
                 yield Static("Voltage:")
-                yield Select([("3.3V", "3.3"), ("1.8V", "1.8"), ("5V", "5.0")], value="3.3", id="scan-voltage")
+                yield Select(_SCAN_VOLTAGE_OPTIONS, value="3.3", id="scan-voltage")
 
             yield Static("Scan Results:", classes="section-subtitle")
             yield Log(id="scan-results", classes="scan-log")
@@ -427,60 +627,45 @@ class BusPiratePanel(DevicePanel):
             # Controls row - rate and samples
             with Horizontal(classes="logic-controls"):
                 yield Static("Rate:", classes="logic-label")
-                yield Select(
-                    [
-                        ("62.5 MHz", "62500000"),
-                        ("31.25 MHz", "31250000"),
-                        ("10 MHz", "10000000"),
-                        ("5 MHz", "5000000"),
-                        ("1 MHz", "1000000"),
-                        ("500 kHz", "500000"),
-                        ("100 kHz", "100000"),
-                    ],
+                self._logic_rate_select = Select(
+                    _LOGIC_RATE_OPTIONS,
                     value="1000000",
                     id="logic-rate",
                     classes="logic-select"
                 )
+                yield self._logic_rate_select
                 yield Static("Samples:", classes="logic-label")
-                yield Select(
-                    [
-                        ("1K", "1024"),
-                        ("4K", "4096"),
-                        ("8K", "8192"),
-                        ("16K", "16384"),
-                        ("32K", "32768"),
-                    ],
+                self._logic_samples_select = Select(
+                    _LOGIC_SAMPLES_OPTIONS,
                     value="8192",
                     id="logic-samples",
                     classes="logic-select"
                 )
+                yield self._logic_samples_select
 
             # Trigger row - separate channel and edge selectors like Bolt
             with Horizontal(classes="logic-trigger-row"):
                 yield Static("Trigger:", classes="logic-label")
-                yield Select(
-                    [("None", "none")] + [(f"CH{i}", str(i)) for i in range(8)],
+                self._logic_trigger_ch_select = Select(
+                    _TRIGGER_CHANNEL_OPTIONS,
                     value="none",
                     id="logic-trigger-channel",
                     classes="logic-select"
                 )
-                yield Select(
-                    [("Rising", "rising"), ("Falling", "falling")],
+                yield self._logic_trigger_ch_select
+                self._logic_trigger_edge_select = Select(
+                    _TRIGGER_EDGE_OPTIONS,
                     value="rising",
                     id="logic-trigger-edge",
                     classes="logic-select"
                 )
+                yield self._logic_trigger_edge_select
 
             # Protocol decoding row
             with Horizontal(classes="logic-protocol-row"):
                 yield Static("Decode:", classes="logic-label")
                 yield Select(
-                    [
-                        ("None", "none"),
-                        ("SPI", "spi"),
-                        ("I2C", "i2c"),
-                        ("UART", "uart"),
-                    ],
+                    _LOGIC_PROTOCOL_OPTIONS,
                     value="none",
                     id="logic-protocol",
                     classes="logic-select"
@@ -495,11 +680,12 @@ class BusPiratePanel(DevicePanel):
             # SUMP port input (for manual override)
             with Horizontal(classes="logic-port-row"):
                 yield Static("SUMP Port:", classes="logic-label")
-                yield Input(
+                self._logic_sump_port_input = Input(
                     placeholder="auto-detect (buspirate3)",
                     id="logic-sump-port",
                     classes="logic-port-input"
                 )
+                yield self._logic_sump_port_input
 
             # Action buttons - consistent with Bolt
             with Horizontal(classes="logic-buttons"):
@@ -527,7 +713,8 @@ class BusPiratePanel(DevicePanel):
             )
 
             # Log output for detailed status messages
-            yield Log(id="logic-log", classes="logic-log")
+            self._logic_log_widget = Log(id="logic-log", classes="logic-log")
+            yield self._logic_log_widget
 
     def _build_power_section(self) -> ComposeResult:
         """Power supply and measurement controls"""
@@ -539,7 +726,7 @@ class BusPiratePanel(DevicePanel):
                     yield Static("VOUT Power Supply", classes="power-group-title")
                     with Horizontal(classes="power-row"):
                         yield Static("Enable:", classes="power-label")
-                        yield Switch(id="power-enable")
+                        yield Switch(value=self.power_enabled, id="power-enable")
                     with Horizontal(classes="power-row"):
                         yield Static("Voltage:", classes="power-label")
                         yield Input(value="3.3", id="power-voltage-input", classes="voltage-input", placeholder="0.0-5.0")
@@ -556,7 +743,7 @@ class BusPiratePanel(DevicePanel):
                     yield Static("Pull-ups", classes="power-group-title")
                     with Horizontal(classes="power-row"):
                         yield Static("Enable:", classes="power-label")
-                        yield Switch(id="pullup-enable")
+                        yield Switch(value=self.pullups_enabled, id="pullup-enable")
 
             yield Static("ADC Measurement", classes="section-subtitle")
             with Horizontal(classes="adc-display"):
@@ -585,94 +772,111 @@ class BusPiratePanel(DevicePanel):
 
     async def connect(self) -> bool:
         """Connect to Bus Pirate via BPIO2 FlatBuffers protocol"""
+        # Console lines not yet written; flushed in one batch per step
+        msgs = [
+            f"[*] Connecting to {self.device_info.name}...",
+            f"[*] Port: {self.device_info.port}",
+        ]
         try:
             # Try to get Bus Pirate backend
-            from ...backends import get_backend
-            self.log_output(f"[*] Connecting to {self.device_info.name}...")
-            self.log_output(f"[*] Port: {self.device_info.port}")
-
             self._backend = get_backend(self.device_info)
 
             if self._backend:
-                self.log_output(f"[*] Using BPIO2 FlatBuffers protocol...")
-                success = self._backend.connect()
+                msgs.append(f"[*] Using BPIO2 FlatBuffers protocol...")
+                self._log_batch(msgs)
+                msgs = []
+                # Blocking serial handshake - keep it off the event loop
+                success = await self._run_io(self._backend.connect)
 
                 if success:
                     self.connected = True
-                    self.log_output(f"[+] Connected successfully!")
-
-                    # Query device status to display info in console
-                    await self._query_device_status()
-
-                    # Also populate the Status tab
-                    await self._refresh_status_display()
-
-                    # Initial ADC refresh for live pinout displays
-                    await self._refresh_adc_values()
+                    self._applied_config = None
+
+                    # Console status summary and the full BPIO2 status are
+                    # queued on the I/O worker together, so the second
+                    # request goes out as soon as the first completes. The
+                    # full status feeds both the Status tab and the initial
+                    # ADC values for the live pinout displays
+                    _, full_status = await asyncio.gather(
+                        self._query_device_status(["[+] Connected successfully!"]),
+                        self._fetch_backend_status('get_full_status'),
+                    )
+                    await self._refresh_status_display(full_status)
+                    self._apply_adc_status(full_status)
                     return True
                 else:
                     self.log_output(f"[!] Backend connection failed")
                     return False
             else:
-                self.log_output(f"[!] No backend available for {self.device_info.name}")
+                msgs.append(f"[!] No backend available for {self.device_info.name}")
+                self._log_batch(msgs)
                 return False
 
         except Exception as e:
-            self.log_output(f"[!] Connection failed: {e}")
-            import traceback
-            self.log_output(f"[!] {traceback.format_exc()}")
+            # Full traceback goes to the logging system; the console gets one line
+            _log.exception("Bus Pirate connect failed on %s", self.device_info.port)
+            msgs.append(f"[!] Connection failed: {type(e).__name__}: {e}")
+            self._log_batch(msgs)
             return False
 
-    async def _query_device_status(self) -> None:
-        """Query and display device status from BPIO2"""
+    async def _query_device_status(self, lines: Optional[List[str]] = None) -> None:
+        """
+        Query and display device status from BPIO2.
+
+        Any lines passed in are written first, in the same batch as the
+        status report.
+        """
         if not self._backend:
             return
 
+        msgs = list(lines) if lines else []
         try:
             # Get status from backend (simplified format)
             status = None
             if hasattr(self._backend, 'get_status'):
-                status = self._backend.get_status()
+                status = await self._run_io(self._backend.get_status)
 
             if status and not status.get('error'):
                 # Display version info
                 fw_ver = status.get('firmware', 'Unknown')
                 hw_ver = status.get('hardware', 'Unknown')
-                self.log_output(f"[*] Firmware: v{fw_ver}")
-                self.log_output(f"[*] Hardware: v{hw_ver}")
+                msgs.append(f"[*] Firmware: v{fw_ver}")
+                msgs.append(f"[*] Hardware: v{hw_ver}")
 
                 # Display current mode
                 mode = status.get('mode', 'HiZ')
                 self.current_mode = mode
-                self.log_output(f"[*] Mode: {mode}")
+                msgs.append(f"[*] Mode: {mode}")
 
                 # Display PSU status
                 psu_enabled = status.get('psu_enabled', False)
                 psu_voltage = status.get('psu_voltage', '3.3V')
                 if psu_enabled:
-                    self.log_output(f"[*] PSU: ON ({psu_voltage})")
+                    msgs.append(f"[*] PSU: ON ({psu_voltage})")
                     self.power_enabled = True
                 else:
-                    self.log_output(f"[*] PSU: OFF")
+                    msgs.append(f"[*] PSU: OFF")
                     self.power_enabled = False
 
                 # Display pullups
                 pullups = status.get('pullups_enabled', False)
                 self.pullups_enabled = pullups
                 if pullups:
-                    self.log_output(f"[*] Pull-ups: Enabled")
+                    msgs.append(f"[*] Pull-ups: Enabled")
 
                 # Check if using serial fallback
                 if status.get('serial_fallback'):
-                    self.log_output(f"[!] Note: Using serial fallback (BPIO2 unavailable)")
+                    msgs.append(f"[!] Note: Using serial fallback (BPIO2 unavailable)")
 
             else:
                 error = status.get('error', 'Unknown error') if status else 'No response'
-                self.log_output(f"[!] Status error: {error}")
-                self.log_output(f"[*] Mode: HiZ (default)")
+                msgs.append(f"[!] Status error: {error}")
+                msgs.append(f"[*] Mode: HiZ (default)")
 
         except Exception as e:
-            self.log_output(f"[!] Status query error: {e}")
+            msgs.append(f"[!] Status query error: {e}")
+        finally:
+            self._log_batch(msgs)
 
     async def disconnect(self) -> None:
         """Disconnect from Bus Pirate"""
@@ -683,14 +887,30 @@ class BusPiratePanel(DevicePanel):
             self._update_live_button_labels(False)
 
         if self._backend:
+            backend, self._backend = self._backend, None
             try:
-                self._backend.disconnect()
+                try:
+                    await self._run_io(backend.disconnect)
+                except RuntimeError:
+                    # I/O worker already shut down (panel unmounted first)
+                    backend.disconnect()
             except Exception:
                 pass
-            self._backend = None
         self.connected = False
+        self._applied_config = None
         self.log_output(f"[-] Disconnected from {self.device_info.name}")
 
+    # Console commands: name -> handler taking (panel, remaining args);
+    # handlers may be sync or return a coroutine
+    _COMMANDS = {
+        "help": lambda self, args: self._show_help(),
+        "mode": lambda self, args: self._set_mode(args[0]) if args else None,
+        "spi": lambda self, args: self._handle_spi_command(args),
+        "i2c": lambda self, args: self._handle_i2c_command(args),
+        "logic": lambda self, args: self._handle_logic_command(args),
+        "power": lambda self, args: self._handle_power_command(args),
+    }
+
     async def send_command(self, command: str) -> None:
         """Send command to Bus Pirate"""
         await super().send_command(command)
@@ -701,44 +921,14 @@ class BusPiratePanel(DevicePanel):
             return
 
         cmd = parts[0].lower()
-
-        if cmd == "help":
-            self._show_help()
-        elif cmd == "mode":
-            if len(parts) > 1:
-                await self._set_mode(parts[1])
-        elif cmd == "spi":
-            await self._handle_spi_command(parts[1:])
-        elif cmd == "i2c":
-            await self._handle_i2c_command(parts[1:])
-        elif cmd == "logic":
-            await self._handle_logic_command(parts[1:])
-        elif cmd == "power":
-            await self._handle_power_command(parts[1:])
-        else:
+        handler = self._COMMANDS.get(cmd)
+        if handler is None:
             self.log_output(f"Unknown command: {cmd}. Type 'help' for available commands.")
+            return
 
-    def get_command_suggestions(self, partial: str) -> List[CommandSuggestion]:
-        """Get command suggestions for auto-completion"""
-        suggestions = [
-            CommandSuggestion("help", "Show available commands"),
-            CommandSuggestion("mode spi", "Switch to SPI mode", "mode"),
-            CommandSuggestion("mode i2c", "Switch to I2C mode", "mode"),
-            CommandSuggestion("mode uart", "Switch to UART mode", "mode"),
-            CommandSuggestion("spi id", "Read SPI flash ID", "spi"),
-            CommandSuggestion("spi dump", "Dump SPI flash", "spi"),
-            CommandSuggestion("i2c scan", "Scan I2C bus for devices", "i2c"),
-            CommandSuggestion("logic capture", "Start logic capture", "logic"),
-            CommandSuggestion("power on", "Enable power supply", "power"),
-            CommandSuggestion("power off", "Disable power supply", "power"),
-            CommandSuggestion("adc read", "Read ADC voltage", "adc"),
-        ]
-
-        if partial:
-            partial_lower = partial.lower()
-            suggestions = [s for s in suggestions if s.command.lower().startswith(partial_lower)]
-
-        return suggestions
+        result = handler(self, parts[1:])
+        if asyncio.iscoroutine(result):
+            await result
 
     def _show_help(self) -> None:
         """Display help message"""
@@ -758,8 +948,7 @@ Available commands:
     async def _set_mode(self, mode: str) -> None:
         """Set Bus Pirate mode"""
         mode = mode.upper()
-        valid_modes = ["HIZ", "SPI", "I2C", "UART", "1WIRE", "2WIRE", "3WIRE"]
-        if mode not in valid_modes:
+        if mode not in _VALID_MODES:
             self.log_output(f"[!] Invalid mode: {mode}")
             return
 
@@ -769,232 +958,299 @@ Available commands:
         # Update UI to show relevant controls
         # This would hide/show protocol-specific controls
 
-    async def _handle_spi_command(self, args: List[str]) -> None:
-        """Handle SPI commands"""
+    def _spi_cmd_id(self, args: List[str]) -> None:
+        """spi id - read flash JEDEC ID"""
+        self.log_output("[*] Reading SPI flash ID...")
+        # Would call backend to read flash ID
+        self.log_output("[+] Flash ID: 0xEF4016 (Winbond W25Q32)")
+
+    def _i2c_cmd_scan(self, args: List[str]) -> None:
+        """i2c scan - probe the bus for devices"""
+        self.log_output("[*] Scanning I2C bus...")
+        self.log_output("[+] Found devices at: 0x50, 0x68")
+
+    def _logic_cmd_capture(self, args: List[str]) -> None:
+        """logic capture - arm a capture"""
+        self.log_output("[*] Starting logic capture...")
+        self.log_output("[*] Waiting for trigger...")
+
+    def _power_cmd_set(self, enabled: bool) -> None:
+        """power on/off"""
+        self.power_enabled = enabled
+        if enabled:
+            self.log_output("[+] Power supply enabled (3.3V)")
+        else:
+            self.log_output("[-] Power supply disabled")
+
+    # Sub-command tables: name -> handler taking (panel, remaining args)
+    _SPI_COMMANDS = {
+        "id": lambda self, args: self._spi_cmd_id(args),
+        "dump": lambda self, args: self.log_output(
+            f"[*] Dumping flash to {args[0] if args else 'dump.bin'}..."
+        ),
+        "write": lambda self, args: self.log_output("[*] Writing to flash..."),
+        "erase": lambda self, args: self.log_output("[*] Erasing flash..."),
+    }
+    _I2C_COMMANDS = {
+        "scan": lambda self, args: self._i2c_cmd_scan(args),
+        "read": lambda self, args: self.log_output(
+            f"[*] Reading from {args[0] if args else '0x50'}..."
+        ),
+    }
+    _LOGIC_COMMANDS = {
+        "capture": lambda self, args: self._logic_cmd_capture(args),
+        "stop": lambda self, args: self.log_output("[*] Stopping capture..."),
+    }
+    _POWER_COMMANDS = {
+        "on": lambda self, args: self._power_cmd_set(True),
+        "off": lambda self, args: self._power_cmd_set(False),
+    }
+
+    async def _dispatch_subcommand(self, commands: dict, args: List[str], usage: str) -> None:
+        """Run the handler for args[0] from a sub-command table"""
         if not args:
-            self.log_output("[!] SPI command required (id, dump, write, erase)")
+            self.log_output(usage)
+            return
+
+        handler = commands.get(args[0].lower())
+        if handler is None:
+            self.log_output(f"[!] Unknown sub-command: {args[0]}")
             return
 
-        subcmd = args[0].lower()
-        if subcmd == "id":
-            self.log_output("[*] Reading SPI flash ID...")
-            # Would call backend to read flash ID
-            self.log_output("[+] Flash ID: 0xEF4016 (Winbond W25Q32)")
-        elif subcmd == "dump":
-            filename = args[1] if len(args) > 1 else "dump.bin"
-            self.log_output(f"[*] Dumping flash to {filename}...")
-        elif subcmd == "write":
-            self.log_output("[*] Writing to flash...")
-        elif subcmd == "erase":
-            self.log_output("[*] Erasing flash...")
+        result = handler(self, args[1:])
+        if asyncio.iscoroutine(result):
+            await result
+
+    async def _handle_spi_command(self, args: List[str]) -> None:
+        """Handle SPI commands"""
+        await self._dispatch_subcommand(
+            self._SPI_COMMANDS, args, "[!] SPI command required (id, dump, write, erase)"
+        )
 
     async def _handle_i2c_command(self, args: List[str]) -> None:
         """Handle I2C commands"""
-        if not args:
-            self.log_output("[!] I2C command required (scan, read, write)")
-            return
-
-        subcmd = args[0].lower()
-        if subcmd == "scan":
-            self.log_output("[*] Scanning I2C bus...")
-            self.log_output("[+] Found devices at: 0x50, 0x68")
-        elif subcmd == "read":
-            addr = args[1] if len(args) > 1 else "0x50"
-            self.log_output(f"[*] Reading from {addr}...")
+        await self._dispatch_subcommand(
+            self._I2C_COMMANDS, args, "[!] I2C command required (scan, read, write)"
+        )
 
     async def _handle_logic_command(self, args: List[str]) -> None:
         """Handle logic analyzer commands"""
-        if not args:
-            self.log_output("[!] Logic command required (capture, stop)")
-            return
-
-        subcmd = args[0].lower()
-        if subcmd == "capture":
-            self.log_output("[*] Starting logic capture...")
-            self.log_output("[*] Waiting for trigger...")
-        elif subcmd == "stop":
-            self.log_output("[*] Stopping capture...")
+        await self._dispatch_subcommand(
+            self._LOGIC_COMMANDS, args, "[!] Logic command required (capture, stop)"
+        )
 
     async def _handle_power_command(self, args: List[str]) -> None:
         """Handle power commands"""
-        if not args:
-            self.log_output("[!] Power command required (on, off)")
-            return
+        await self._dispatch_subcommand(
+            self._POWER_COMMANDS, args, "[!] Power command required (on, off)"
+        )
 
-        subcmd = args[0].lower()
-        if subcmd == "on":
-            self.power_enabled = True
-            self.log_output("[+] Power supply enabled (3.3V)")
-        elif subcmd == "off":
-            self.power_enabled = False
-            self.log_output("[-] Power supply disabled")
+    async def _refresh_pinout_voltages(self) -> None:
+        """Re-read ADC values for the pinout diagrams"""
+        await self._refresh_adc_values()
+        self.log_output("[+] Pinout voltages refreshed")
 
-    async def on_button_pressed(self, event: Button.Pressed) -> None:
-        """Handle button presses"""
-        button_id = event.button.id
-        if not button_id:
-            return
+    def _start_jtag_scan(self) -> None:
+        """Start JTAG pin scan"""
+        self.log_output("[*] Starting JTAG pin scan...")
+        self.log_output("[*] Testing all pin combinations...")
 
+    # Button id -> handler taking the panel; handlers may be sync or async
+    _BUTTON_HANDLERS = {
         # Status tab
-        if button_id == "btn-status-refresh":
-            await self._refresh_status_display()
+        "btn-status-refresh": lambda self: self._refresh_status_display(),
 
         # Protocol tab - SPI
-        elif button_id == "btn-spi-id":
-            await self._spi_read_flash_id()
-        elif button_id == "btn-spi-dump":
-            await self._spi_dump_flash()
-        elif button_id == "btn-spi-erase":
-            await self._spi_erase_flash()
-        elif button_id == "btn-spi-write":
-            await self._spi_write_flash()
+        "btn-spi-id": lambda self: self._spi_read_flash_id(),
+        "btn-spi-dump": lambda self: self._spi_dump_flash(),
+        "btn-spi-erase": lambda self: self._spi_erase_flash(),
+        "btn-spi-write": lambda self: self._spi_write_flash(),
 
         # Protocol tab - I2C
-        elif button_id == "btn-i2c-scan":
-            await self._i2c_scan_bus()
-        elif button_id == "btn-i2c-read":
-            await self._i2c_read_byte()
-        elif button_id == "btn-i2c-write":
-            await self._i2c_write_byte()
-        elif button_id == "btn-i2c-dump":
-            await self._i2c_dump_eeprom()
+        "btn-i2c-scan": lambda self: self._i2c_scan_bus(),
+        "btn-i2c-read": lambda self: self._i2c_read_byte(),
+        "btn-i2c-write": lambda self: self._i2c_write_byte(),
+        "btn-i2c-dump": lambda self: self._i2c_dump_eeprom(),
 
         # Protocol tab - UART
-        elif button_id == "btn-uart-bridge":
-            await self._uart_start_bridge()
-        elif button_id == "btn-uart-auto":
-            await self._uart_auto_detect()
+        "btn-uart-bridge": lambda self: self._uart_start_bridge(),
+        "btn-uart-auto": lambda self: self._uart_auto_detect(),
 
         # Logic tab
-        elif button_id == "btn-logic-capture":
-            await self._start_logic_capture()
-        elif button_id == "btn-logic-stop":
-            await self._stop_logic_capture()
-        elif button_id == "btn-logic-demo":
-            await self._load_logic_demo()
-        elif button_id == "btn-logic-scroll-left":
-            self._logic_scroll(-50)
-        elif button_id == "btn-logic-scroll-right":
-            self._logic_scroll(50)
-        elif button_id == "btn-logic-goto-trigger":
-            self._logic_goto_trigger()
+        "btn-logic-capture": lambda self: self._launch_logic_capture(),
+        "btn-logic-stop": lambda self: self._stop_logic_capture(),
+        "btn-logic-demo": lambda self: self._load_logic_demo(),
+        "btn-logic-scroll-left": lambda self: self._logic_scroll(-50),
+        "btn-logic-scroll-right": lambda self: self._logic_scroll(50),
+        "btn-logic-goto-trigger": lambda self: self._logic_goto_trigger(),
 
         # Scan tab
-        elif button_id == "btn-jtag-scan":
-            self.log_output("[*] Starting JTAG pin scan...")
-            self.log_output("[*] Testing all pin combinations...")
-        elif button_id == "btn-swd-scan":
-            self.log_output("[*] Starting SWD pin scan...")
-        elif button_id == "btn-uart-detect":
-            await self._uart_auto_detect()
+        "btn-jtag-scan": lambda self: self._start_jtag_scan(),
+        "btn-swd-scan": lambda self: self.log_output("[*] Starting SWD pin scan..."),
+        "btn-uart-detect": lambda self: self._uart_auto_detect(),
 
         # Power tab - VOUT controls
-        elif button_id == "btn-vout-18":
-            self._set_voltage_input("1.8")
-        elif button_id == "btn-vout-33":
-            self._set_voltage_input("3.3")
-        elif button_id == "btn-vout-50":
-            self._set_voltage_input("5.0")
-        elif button_id == "btn-vout-apply":
-            await self._apply_vout_voltage()
+        "btn-vout-18": lambda self: self._set_voltage_input("1.8"),
+        "btn-vout-33": lambda self: self._set_voltage_input("3.3"),
+        "btn-vout-50": lambda self: self._set_voltage_input("5.0"),
+        "btn-vout-apply": lambda self: self._apply_vout_voltage(),
 
         # Power tab - other controls
-        elif button_id == "btn-adc-read":
-            await self._read_adc()
-        elif button_id == "btn-adc-monitor":
-            await self._toggle_adc_monitor()
-        elif button_id == "btn-pwm-start":
-            await self._start_pwm()
-        elif button_id == "btn-pwm-stop":
-            await self._stop_pwm()
-        elif button_id == "btn-freq-measure":
-            await self._measure_frequency()
+        "btn-adc-read": lambda self: self._read_adc(),
+        "btn-adc-monitor": lambda self: self._toggle_adc_monitor(),
+        "btn-pwm-start": lambda self: self._start_pwm(),
+        "btn-pwm-stop": lambda self: self._stop_pwm(),
+        "btn-freq-measure": lambda self: self._measure_frequency(),
 
         # Pinout refresh buttons
-        elif button_id in ("spi-refresh-pinout", "i2c-refresh-pinout", "uart-refresh-pinout"):
-            await self._refresh_adc_values()
-            self.log_output("[+] Pinout voltages refreshed")
+        "spi-refresh-pinout": lambda self: self._refresh_pinout_voltages(),
+        "i2c-refresh-pinout": lambda self: self._refresh_pinout_voltages(),
+        "uart-refresh-pinout": lambda self: self._refresh_pinout_voltages(),
 
         # Live toggle buttons
-        elif button_id in ("spi-live-toggle", "i2c-live-toggle", "uart-live-toggle"):
-            await self._toggle_live_pinout()
+        "spi-live-toggle": lambda self: self._toggle_live_pinout(),
+        "i2c-live-toggle": lambda self: self._toggle_live_pinout(),
+        "uart-live-toggle": lambda self: self._toggle_live_pinout(),
+    }
+
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
+        """Handle button presses"""
+        handler = self._BUTTON_HANDLERS.get(event.button.id)
+        if handler is None:
+            return
+
+        result = handler(self)
+        if asyncio.iscoroutine(result):
+            await result
+
+    async def _protocol_voltage_selected(self, prefix: str, value: str) -> None:
+        """Protocol subtab voltage changed - apply immediately if power is on"""
+        try:
+            power_switch = self._widget(f"{prefix}-power-switch")
+            if power_switch is not None and power_switch.value:
+                # Power is on, apply new voltage
+                voltage_mv = int(value)
+                await self._toggle_protocol_power(True, voltage_mv)
+                # Sync other protocol voltage selects
+                self._sync_protocol_voltage_selects(value)
+        except Exception:
+            pass
+
+    async def _protocol_power_switched(self, prefix: str, value: bool) -> None:
+        """Protocol subtab power switch toggled"""
+        # Get the voltage from the corresponding dropdown
+        voltage_mv = int(self._get_select_value(f"{prefix}-voltage-select", "3300"))
+        await self._toggle_protocol_power(value, voltage_mv)
+        # Sync other protocol power switches
+        self._sync_protocol_power_switches(value)
+
+    async def _protocol_pullups_switched(self, value: bool) -> None:
+        """Protocol subtab pull-up switch toggled"""
+        await self._toggle_pullups(value)
+        # Sync other pullup switches
+        self._sync_pullup_switches(value)
+
+    # Select id -> handler taking (panel, value); handlers may be sync or async
+    _SELECT_HANDLERS = {
+        # Header
+        "mode-select": lambda self, value: self._change_mode(value),
+        "voltage-select": lambda self, value: self._change_voltage(value),
+
+        # Power tab voltage - just stored, applied when power is enabled
+        "power-voltage": lambda self, value: None,
+
+        # Protocol subtab voltage selections
+        "spi-voltage-select": lambda self, value: self._protocol_voltage_selected("spi", value),
+        "i2c-voltage-select": lambda self, value: self._protocol_voltage_selected("i2c", value),
+        "uart-voltage-select": lambda self, value: self._protocol_voltage_selected("uart", value),
+
+        # Logic analyzer protocol decoder selection
+        "logic-protocol": lambda self, value: self._set_logic_protocol(value),
+    }
+
+    # Selects that reconfigure the device; arrowing through their options
+    # only applies the value the user settles on
+    _DEBOUNCED_SELECTS = frozenset({"mode-select", "voltage-select"})
+    SELECT_DEBOUNCE = 0.15  # seconds
+
+    # Switches that drive the PSU; rapid toggling of any of them ends in
+    # one write of the state the user settles on
+    _PSU_SWITCHES = frozenset({"power-enable", "spi-power-switch", "i2c-power-switch", "uart-power-switch"})
+
+    # Switch id -> handler taking (panel, value)
+    _SWITCH_HANDLERS = {
+        # Power tab switches
+        "power-enable": lambda self, value: self._toggle_power(value),
+        "pullup-enable": lambda self, value: self._toggle_pullups(value),
+
+        # Protocol subtab power switches
+        "spi-power-switch": lambda self, value: self._protocol_power_switched("spi", value),
+        "i2c-power-switch": lambda self, value: self._protocol_power_switched("i2c", value),
+        "uart-power-switch": lambda self, value: self._protocol_power_switched("uart", value),
+
+        # Protocol subtab pullup switches
+        "spi-pullup-switch": lambda self, value: self._protocol_pullups_switched(value),
+        "i2c-pullup-switch": lambda self, value: self._protocol_pullups_switched(value),
+        "uart-pullup-switch": lambda self, value: self._protocol_pullups_switched(value),
+    }
 
     async def on_select_changed(self, event: Select.Changed) -> None:
         """Handle Select widget changes"""
-        select_id = event.select.id
-        if not select_id:
+        handler = self._SELECT_HANDLERS.get(event.select.id)
+        if handler is None:
             return
 
         value = str(event.value) if event.value else None
         if not value:
             return
 
-        # Mode selection in header
-        if select_id == "mode-select":
-            await self._change_mode(value)
+        select_id = event.select.id
+        if select_id in self._DEBOUNCED_SELECTS:
+            self._debounce(select_id, lambda: handler(self, value))
+            return
 
-        # Voltage selection in header
-        elif select_id == "voltage-select":
-            await self._change_voltage(value)
+        result = handler(self, value)
+        if asyncio.iscoroutine(result):
+            await result
 
-        # Power tab voltage
-        elif select_id == "power-voltage":
-            # Just store the selection, applied when power is enabled
-            pass
+    def _debounce(self, slot: str, callback: Callable) -> None:
+        """Run callback once events in `slot` have been quiet for SELECT_DEBOUNCE"""
+        pending = self._debounce_timers.pop(slot, None)
+        if pending is not None:
+            pending.stop()
+        self._debounce_timers[slot] = self.set_timer(self.SELECT_DEBOUNCE, callback)
 
-        # Protocol subtab voltage selections (spi/i2c/uart-voltage-select)
-        elif select_id in ("spi-voltage-select", "i2c-voltage-select", "uart-voltage-select"):
-            # If power is already enabled, apply the new voltage immediately
-            prefix = select_id.replace("-voltage-select", "")
-            try:
-                power_switch = self.query_one(f"#{prefix}-power-switch", Switch)
-                if power_switch.value:
-                    # Power is on, apply new voltage
-                    voltage_mv = int(value)
-                    await self._toggle_protocol_power(True, voltage_mv)
-                    # Sync other protocol voltage selects
-                    self._sync_protocol_voltage_selects(value)
-            except Exception:
-                pass
-
-        # Logic analyzer protocol decoder selection
-        elif select_id == "logic-protocol":
-            self._set_logic_protocol(value)
+    def _psu_switch_settled(self, handler: Callable, value: bool):
+        """Apply a settled PSU switch state unless the supply is already in it"""
+        # Syncing the other power switches after a write echoes the same state
+        if value != self.power_enabled:
+            return handler(self, value)
+        return None
 
     async def on_switch_changed(self, event: Switch.Changed) -> None:
         """Handle Switch widget changes"""
-        switch_id = event.switch.id
-        value = event.value
-
-        if not switch_id:
+        handler = self._SWITCH_HANDLERS.get(event.switch.id)
+        if handler is None:
             return
 
-        # Power tab switches
-        if switch_id == "power-enable":
-            await self._toggle_power(value)
-        elif switch_id == "pullup-enable":
-            await self._toggle_pullups(value)
-
-        # Protocol subtab power switches (SPI/I2C/UART)
-        elif switch_id in ("spi-power-switch", "i2c-power-switch", "uart-power-switch"):
-            # Get the voltage from the corresponding dropdown
-            prefix = switch_id.replace("-power-switch", "")
-            voltage_mv = int(self._get_select_value(f"{prefix}-voltage-select", "3300"))
-            await self._toggle_protocol_power(value, voltage_mv)
-            # Sync other protocol power switches
-            self._sync_protocol_power_switches(value)
+        value = event.value
+        if event.switch.id in self._PSU_SWITCHES:
+            self._debounce("psu", lambda: self._psu_switch_settled(handler, value))
+            return
 
-        # Protocol subtab pullup switches
-        elif switch_id in ("spi-pullup-switch", "i2c-pullup-switch", "uart-pullup-switch"):
-            await self._toggle_pullups(value)
-            # Sync other pullup switches
-            self._sync_pullup_switches(value)
+        result = handler(self, value)
+        if asyncio.iscoroutine(result):
+            await result
 
     async def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
-        """Handle tab activation - configure Bus Pirate mode when switching protocol subtabs"""
+        """Handle tab activation - build lazy feature tabs, and configure Bus Pirate mode when switching protocol subtabs"""
         tab_id = event.tab.id if event.tab else None
         tabbed_content_id = event.tabbed_content.id if event.tabbed_content else None
 
+        if tabbed_content_id == "bp-features":
+            await self._build_lazy_tab(tab_id)
+            return
+
         # Only handle protocol subtab switches
         if tabbed_content_id != "protocol-tabs":
             return
@@ -1014,6 +1270,58 @@ Available commands:
         if mode:
             await self._change_mode(mode)
 
+    def on_mount(self) -> None:
+        """Resolve the widgets handlers touch on every event"""
+        for widget_id in self._CACHED_WIDGET_IDS:
+            self._widget(widget_id)
+
+    def on_unmount(self) -> None:
+        """Stop any capture, release the backend I/O worker and cached widget refs"""
+        # A running SUMP read would otherwise hold the worker (and the port)
+        # until its timeout, delaying interpreter exit
+        self._logic_stop.set()
+        if self._logic_task is not None and not self._logic_task.done():
+            self._logic_task.cancel()
+        self._logic_task = None
+        self._io_pool.shutdown(wait=False)
+        self._widgets.clear()
+        self._status_cache.clear()
+        self._status_dirty.clear()
+        if self._log_flush_timer is not None:
+            self._log_flush_timer.stop()
+            self._log_flush_timer = None
+        self._log_pending.clear()
+
+    def _widget(self, widget_id: str) -> Optional[Widget]:
+        """
+        Look up a widget by id, caching it for later calls.
+
+        Returns None if the widget does not exist (yet), e.g. it lives in
+        a lazily built tab; the next call will try again.
+        """
+        widget = self._widgets.get(widget_id)
+        if widget is None:
+            # query() doesn't raise on a miss, unlike query_one()
+            matches = self.query(f"#{widget_id}")
+            if not matches:
+                return None
+            widget = self._widgets[widget_id] = matches.first()
+        return widget
+
+    async def _build_lazy_tab(self, tab_id: Optional[str]) -> None:
+        """Mount a feature tab's widgets the first time it is shown"""
+        entry = self._LAZY_TABS.get(tab_id)
+        if entry is None or tab_id in self._built_tabs:
+            return
+        self._built_tabs.add(tab_id)
+
+        pane_id, builder_name = entry
+        try:
+            pane = self.query_one(f"#{pane_id}", TabPane)
+        except Exception:
+            return
+        await pane.mount(_ComposedSection(getattr(self, builder_name)))
+
     # --------------------------------------------------------------------------
     # Mode Switching
     # --------------------------------------------------------------------------
@@ -1033,6 +1341,7 @@ Available commands:
             if mode_upper == "HIZ":
                 # HiZ is the default safe mode
                 self.current_mode = "HiZ"
+                self._applied_config = None
                 self.log_output(f"[+] Mode: HiZ (safe mode)")
 
             elif mode_upper == "SPI":
@@ -1041,14 +1350,13 @@ Available commands:
                 spi_mode = self._get_select_value("spi-mode", "0")
                 cs_active = self._get_select_value("spi-cs", "low")
 
-                from ...backends.base import SPIConfig
-                config = SPIConfig(
+                config = BackendSPIConfig(
                     speed_hz=int(speed),
                     mode=int(spi_mode),
                     cs_active_low=(cs_active == "low")
                 )
 
-                if self._backend.configure_spi(config):
+                if await self._apply_bus_config("SPI", self._backend.configure_spi, config):
                     self.current_mode = "SPI"
                     self.log_output(f"[+] SPI mode: {int(speed)//1000}kHz, mode {spi_mode}")
                 else:
@@ -1058,10 +1366,9 @@ Available commands:
                 # Get I2C config from UI
                 speed = self._get_select_value("i2c-speed", "100000")
 
-                from ...backends.base import I2CConfig
-                config = I2CConfig(speed_hz=int(speed))
+                config = BackendI2CConfig(speed_hz=int(speed))
 
-                if self._backend.configure_i2c(config):
+                if await self._apply_bus_config("I2C", self._backend.configure_i2c, config):
                     self.current_mode = "I2C"
                     self.log_output(f"[+] I2C mode: {int(speed)//1000}kHz")
                 else:
@@ -1072,20 +1379,19 @@ Available commands:
                 baud = self._get_select_value("uart-baud", "115200")
                 format_str = self._get_select_value("uart-format", "8N1")
 
-                # Parse format (e.g., "8N1" -> data_bits=8, parity='N', stop_bits=1)
-                data_bits = int(format_str[0])
-                parity = format_str[1]
-                stop_bits = int(format_str[2])
+                # Format (e.g., "8N1" -> data_bits=8, parity='N', stop_bits=1)
+                data_bits, parity, stop_bits = _UART_FORMATS.get(format_str) or (
+                    int(format_str[0]), format_str[1], int(format_str[2])
+                )
 
-                from ...backends.base import UARTConfig
-                config = UARTConfig(
+                config = BackendUARTConfig(
                     baudrate=int(baud),
                     data_bits=data_bits,
                     parity=parity,
                     stop_bits=stop_bits
                 )
 
-                if self._backend.configure_uart(config):
+                if await self._apply_bus_config("UART", self._backend.configure_uart, config):
                     self.current_mode = "UART"
                     self.log_output(f"[+] UART mode: {baud} {format_str}")
                 else:
@@ -1100,127 +1406,100 @@ Available commands:
         except Exception as e:
             self.log_output(f"[!] Mode change error: {e}")
 
+    async def _run_io(self, call: Callable, *args, **kwargs) -> Any:
+        """Run a blocking backend call on the I/O worker, keeping the UI responsive"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, lambda: call(*args, **kwargs))
+
+    async def _apply_bus_config(self, mode: str, configure: Callable, config) -> bool:
+        """
+        Apply a bus config on the I/O worker, skipping the round-trip when
+        the device is still in `mode` with an equal config.
+        """
+        if self.current_mode == mode and config == self._applied_config:
+            return True
+
+        success = await self._run_io(configure, config)
+        self._applied_config = config if success else None
+        return success
+
     def _get_select_value(self, select_id: str, default: str) -> str:
         """Get value from a Select widget"""
-        try:
-            select = self.query_one(f"#{select_id}", Select)
-            # Check for Select.BLANK and None/falsy values
-            if select.value is None or select.value == Select.BLANK:
-                return default
-            return str(select.value)
-        except Exception:
+        select = self._widget(select_id)
+        # Check for a missing widget, Select.BLANK and None/falsy values
+        if select is None or select.value is None or select.value == Select.BLANK:
             return default
+        return str(select.value)
 
     # --------------------------------------------------------------------------
     # Live Pinout Diagram Functions
     # --------------------------------------------------------------------------
 
-    def _format_voltage(self, mv: int) -> str:
-        """Format millivolt value for display (e.g., '3.3V' or '---')"""
-        if mv <= 0:
-            return "---"
-        elif mv < 1000:
-            return f"{mv}mV"
-        else:
-            return f"{mv/1000:.1f}V"
+    def _pinout_voltage_row(self) -> str:
+        """The live voltage row shared by all pinout diagrams"""
+        return _pinout_voltage_row(self._psu_measured_mv, tuple(self._adc_values[:8]))
 
     def _build_spi_pinout_ascii(self) -> str:
         """Build SPI pinout ASCII diagram with live voltage values"""
-        # Get live voltage values
-        vout = self._format_voltage(self._psu_measured_mv)
-        v = [self._format_voltage(self._adc_values[i]) if i < len(self._adc_values) else "---" for i in range(8)]
-
-        return (
-            "┌─────────────────────────────────────────────────────────────────────┐\n"
-            "│  Pin 1     2     3     4     5     6     7     8     9    10        │\n"
-            "│  VOUT    IO0   IO1   IO2   IO3   IO4   IO5   IO6   IO7   GND        │\n"
-            f"│  {vout:^5} {v[0]:^5} {v[1]:^5} {v[2]:^5} {v[3]:^5} {v[4]:^5} {v[5]:^5} {v[6]:^5} {v[7]:^5}  0V         │\n"
-            "│          └─────────────────┘     MISO   CS   CLK  MOSI              │\n"
-            "│               Auxiliary                                             │\n"
-            "└─────────────────────────────────────────────────────────────────────┘\n"
-            "  IO4=MISO (Master In)    IO6=CLK (Clock)\n"
-            "  IO5=CS (Chip Select)    IO7=MOSI (Master Out)"
-        )
+        return _PINOUT_HEAD + self._pinout_voltage_row() + _SPI_PINOUT_TAIL
 
     def _build_i2c_pinout_ascii(self) -> str:
         """Build I2C pinout ASCII diagram with live voltage values"""
-        # Get live voltage values
-        vout = self._format_voltage(self._psu_measured_mv)
-        v = [self._format_voltage(self._adc_values[i]) if i < len(self._adc_values) else "---" for i in range(8)]
-
-        return (
-            "┌─────────────────────────────────────────────────────────────────────┐\n"
-            "│  Pin 1     2     3     4     5     6     7     8     9    10        │\n"
-            "│  VOUT    IO0   IO1   IO2   IO3   IO4   IO5   IO6   IO7   GND        │\n"
-            f"│  {vout:^5} {v[0]:^5} {v[1]:^5} {v[2]:^5} {v[3]:^5} {v[4]:^5} {v[5]:^5} {v[6]:^5} {v[7]:^5}  0V         │\n"
-            "│          SDA   SCL         AUX                                      │\n"
-            "│                                                                     │\n"
-            "└─────────────────────────────────────────────────────────────────────┘\n"
-            "  IO0=SDA (Data)     IO1=SCL (Clock)\n"
-            "  Enable pull-ups for I2C (typical 4.7kΩ to VOUT)"
-        )
+        return _PINOUT_HEAD + self._pinout_voltage_row() + _I2C_PINOUT_TAIL
 
     def _build_uart_pinout_ascii(self) -> str:
         """Build UART pinout ASCII diagram with live voltage values"""
-        # Get live voltage values
-        vout = self._format_voltage(self._psu_measured_mv)
-        v = [self._format_voltage(self._adc_values[i]) if i < len(self._adc_values) else "---" for i in range(8)]
-
-        return (
-            "┌─────────────────────────────────────────────────────────────────────┐\n"
-            "│  Pin 1     2     3     4     5     6     7     8     9    10        │\n"
-            "│  VOUT    IO0   IO1   IO2   IO3   IO4   IO5   IO6   IO7   GND        │\n"
-            f"│  {vout:^5} {v[0]:^5} {v[1]:^5} {v[2]:^5} {v[3]:^5} {v[4]:^5} {v[5]:^5} {v[6]:^5} {v[7]:^5}  0V         │\n"
-            "│                            AUX    TX    RX                          │\n"
-            "│                                                                     │\n"
-            "└─────────────────────────────────────────────────────────────────────┘\n"
-            "  IO4=TX (BP output → Target RX)\n"
-            "  IO5=RX (BP input ← Target TX)"
-        )
+        return _PINOUT_HEAD + self._pinout_voltage_row() + _UART_PINOUT_TAIL
 
     async def _refresh_adc_values(self) -> None:
         """Fetch current ADC values from device and update pinout displays"""
         if not self._backend or not self.connected:
             return
+        # Refresh button, mode changes and the live timer all land here; a
+        # request arriving while a read is in flight is served by that read
+        if self._adc_refreshing:
+            return
 
+        self._adc_refreshing = True
         try:
             # Get full status which includes ADC values
-            status = None
-            if hasattr(self._backend, 'get_full_status'):
-                status = self._backend.get_full_status()
-
-            if status:
-                # Update cached ADC values
-                self._adc_values = status.get('adc_mv', [0] * 8)
-                self._psu_measured_mv = status.get('psu_measured_mv', 0)
-                self._psu_measured_ma = status.get('psu_measured_ma', 0)
-
-                # Update all pinout diagrams
-                self._update_pinout_displays()
+            self._apply_adc_status(await self._fetch_backend_status('get_full_status'))
         except Exception as e:
             # Log errors but don't spam during live updates
             if self._pinout_refresh_timer is None:
                 self.log_output(f"[!] ADC refresh error: {e}")
+        finally:
+            self._adc_refreshing = False
+
+    def _apply_adc_status(self, status: Optional[Dict[str, Any]]) -> None:
+        """Take the ADC/PSU readings from a full status into the pinout displays"""
+        if status:
+            # Update cached ADC values
+            self._adc_values = status.get('adc_mv', [0] * 8)
+            self._psu_measured_mv = status.get('psu_measured_mv', 0)
+            self._psu_measured_ma = status.get('psu_measured_ma', 0)
+
+            # Update all pinout diagrams
+            self._update_pinout_displays()
+
+    # Pinout diagram id -> the static part below its voltage row
+    _PINOUTS = (
+        ("spi-pinout", _SPI_PINOUT_TAIL),
+        ("i2c-pinout", _I2C_PINOUT_TAIL),
+        ("uart-pinout", _UART_PINOUT_TAIL),
+    )
 
     def _update_pinout_displays(self) -> None:
         """Update all pinout displays with current ADC values"""
-        try:
-            spi_pinout = self.query_one("#spi-pinout", Static)
-            spi_pinout.update(self._build_spi_pinout_ascii())
-        except Exception:
-            pass
-
-        try:
-            i2c_pinout = self.query_one("#i2c-pinout", Static)
-            i2c_pinout.update(self._build_i2c_pinout_ascii())
-        except Exception:
-            pass
-
-        try:
-            uart_pinout = self.query_one("#uart-pinout", Static)
-            uart_pinout.update(self._build_uart_pinout_ascii())
-        except Exception:
-            pass
+        # Only the voltage row is live; repaint only when its text changes
+        row = self._pinout_voltage_row()
+        if row == self._pinout_row:
+            return
+        self._pinout_row = row
+        for widget_id, tail in self._PINOUTS:
+            pinout = self._widget(widget_id)
+            if pinout is not None:
+                pinout.update(_PINOUT_HEAD + row + tail)
 
     async def _toggle_live_pinout(self) -> None:
         """Toggle live pinout updates on/off"""
@@ -1246,15 +1525,10 @@ Available commands:
     def _update_live_button_labels(self, is_live: bool) -> None:
         """Update live toggle button labels to show current state"""
         for prefix in ("spi", "i2c", "uart"):
-            try:
-                btn = self.query_one(f"#{prefix}-live-toggle", Button)
+            btn = self._widget(f"{prefix}-live-toggle")
+            if btn is not None:
                 btn.label = "Stop" if is_live else "Live"
-                if is_live:
-                    btn.add_class("btn-active")
-                else:
-                    btn.remove_class("btn-active")
-            except Exception:
-                pass
+                btn.set_class(is_live, "btn-active")
 
     async def _toggle_adc_monitor(self) -> None:
         """Toggle ADC monitoring - alias for live pinout toggle"""
@@ -1268,7 +1542,7 @@ Available commands:
 
         try:
             self.log_output(f"[*] Setting PSU: {'ON' if enabled else 'OFF'} at {voltage_mv}mV")
-            result = self._backend.set_psu(enabled=enabled, voltage_mv=voltage_mv)
+            result = await self._run_io(self._backend.set_psu, enabled=enabled, voltage_mv=voltage_mv)
             if result:
                 self.power_enabled = enabled
                 if enabled:
@@ -1283,48 +1557,33 @@ Available commands:
     def _sync_protocol_power_switches(self, value: bool) -> None:
         """Sync all protocol power switches to the same state"""
         for prefix in ("spi", "i2c", "uart"):
-            try:
-                switch = self.query_one(f"#{prefix}-power-switch", Switch)
-                if switch.value != value:
-                    switch.value = value
-            except Exception:
-                pass
+            switch = self._widget(f"{prefix}-power-switch")
+            if switch is not None and switch.value != value:
+                switch.value = value
 
         # Also sync the main power switch in Power tab
-        try:
-            main_switch = self.query_one("#power-enable", Switch)
-            if main_switch.value != value:
-                main_switch.value = value
-        except Exception:
-            pass
+        main_switch = self._widget("power-enable")
+        if main_switch is not None and main_switch.value != value:
+            main_switch.value = value
 
     def _sync_pullup_switches(self, value: bool) -> None:
         """Sync all pullup switches to the same state"""
         for prefix in ("spi", "i2c", "uart"):
-            try:
-                switch = self.query_one(f"#{prefix}-pullup-switch", Switch)
-                if switch.value != value:
-                    switch.value = value
-            except Exception:
-                pass
+            switch = self._widget(f"{prefix}-pullup-switch")
+            if switch is not None and switch.value != value:
+                switch.value = value
 
         # Also sync the main pullup switch in Power tab
-        try:
-            main_switch = self.query_one("#pullup-enable", Switch)
-            if main_switch.value != value:
-                main_switch.value = value
-        except Exception:
-            pass
+        main_switch = self._widget("pullup-enable")
+        if main_switch is not None and main_switch.value != value:
+            main_switch.value = value
 
     def _sync_protocol_voltage_selects(self, value: str) -> None:
         """Sync all protocol voltage selects to the same value"""
         for prefix in ("spi", "i2c", "uart"):
-            try:
-                select = self.query_one(f"#{prefix}-voltage-select", Select)
-                if str(select.value) != value:
-                    select.value = value
-            except Exception:
-                pass
+            select = self._widget(f"{prefix}-voltage-select")
+            if select is not None and str(select.value) != value:
+                select.value = value
 
     async def _change_voltage(self, voltage_str: str) -> None:
         """Change PSU voltage via header dropdown"""
@@ -1335,13 +1594,13 @@ Available commands:
             voltage = float(voltage_str)
             if voltage == 0:
                 # Turn off PSU
-                if self._backend.set_psu(enabled=False):
+                if await self._run_io(self._backend.set_psu, enabled=False):
                     self.power_enabled = False
                     self.log_output("[*] PSU disabled")
             else:
                 # Set voltage and enable
                 voltage_mv = int(voltage * 1000)
-                if self._backend.set_psu(enabled=True, voltage_mv=voltage_mv):
+                if await self._run_io(self._backend.set_psu, enabled=True, voltage_mv=voltage_mv):
                     self.power_enabled = True
                     self.log_output(f"[+] PSU enabled: {voltage}V")
         except Exception as e:
@@ -1349,16 +1608,14 @@ Available commands:
 
     def _set_voltage_input(self, voltage: str) -> None:
         """Set the voltage input field to a preset value"""
-        try:
-            voltage_input = self.query_one("#power-voltage-input", Input)
+        voltage_input = self._widget("power-voltage-input")
+        if voltage_input is not None:
             voltage_input.value = voltage
-        except Exception:
-            pass
 
     def _get_voltage_from_input(self) -> float:
         """Get voltage from input field, clamped to 0.0-5.0 range"""
         try:
-            voltage_input = self.query_one("#power-voltage-input", Input)
+            voltage_input = self._widget("power-voltage-input")
             voltage = float(voltage_input.value or "3.3")
             # Clamp to valid range
             return max(0.0, min(5.0, voltage))
@@ -1377,16 +1634,14 @@ Available commands:
             self.log_output(f"[*] Applying VOUT: {voltage:.2f}V ({voltage_mv}mV)")
 
             # Enable PSU with the specified voltage
-            result = self._backend.set_psu(enabled=True, voltage_mv=voltage_mv)
+            result = await self._run_io(self._backend.set_psu, enabled=True, voltage_mv=voltage_mv)
             if result:
                 self.power_enabled = True
                 self.log_output(f"[+] VOUT set to {voltage:.2f}V")
                 # Update the switch to reflect enabled state
-                try:
-                    power_switch = self.query_one("#power-enable", Switch)
+                power_switch = self._widget("power-enable")
+                if power_switch is not None:
                     power_switch.value = True
-                except Exception:
-                    pass
                 # Also sync protocol subtab power switches
                 self._sync_protocol_power_switches(True)
             else:
@@ -1406,7 +1661,7 @@ Available commands:
             voltage_mv = int(voltage * 1000)
             self.log_output(f"[*] Setting PSU: {'ON' if enabled else 'OFF'} at {voltage:.2f}V")
 
-            result = self._backend.set_psu(enabled=enabled, voltage_mv=voltage_mv)
+            result = await self._run_io(self._backend.set_psu, enabled=enabled, voltage_mv=voltage_mv)
             if result:
                 self.power_enabled = enabled
                 if enabled:
@@ -1427,7 +1682,7 @@ Available commands:
             return
 
         try:
-            if self._backend.set_pullups(enabled=enabled):
+            if await self._run_io(self._backend.set_pullups, enabled=enabled):
                 self.pullups_enabled = enabled
                 if enabled:
                     self.log_output("[+] Pull-ups enabled")
@@ -1455,22 +1710,14 @@ Available commands:
             if self.current_mode != "SPI":
                 await self._change_mode("SPI")
 
-            flash_id = self._backend.spi_flash_read_id()
+            flash_id = await self._run_io(self._backend.spi_flash_read_id)
             if flash_id and len(flash_id) >= 3:
                 mfr = flash_id[0]
                 dev_type = flash_id[1]
                 capacity = flash_id[2]
 
                 # Lookup manufacturer
-                mfr_names = {
-                    0xEF: "Winbond",
-                    0xC2: "Macronix",
-                    0x20: "Micron",
-                    0x01: "Spansion",
-                    0xBF: "SST",
-                    0x1F: "Atmel",
-                }
-                mfr_name = mfr_names.get(mfr, "Unknown")
+                mfr_name = _SPI_MFR_NAMES.get(mfr, "Unknown")
 
                 self.log_output(f"[+] Flash ID: {flash_id.hex().upper()}")
                 self.log_output(f"    Manufacturer: {mfr_name} (0x{mfr:02X})")
@@ -1513,14 +1760,14 @@ Available commands:
 
             self.log_output("[*] Erasing 4KB sector at address 0x000000...")
 
-            # Progress callback
-            def progress(msg):
-                self.log_output(f"[*] {msg}")
+            # Run erase in executor to not block UI; progress is reported
+            # from the worker thread, so hop it back onto the event loop
+            loop = asyncio.get_running_loop()
 
-            # Run erase in executor to not block UI
-            loop = asyncio.get_event_loop()
+            def progress(msg):
+                loop.call_soon_threadsafe(self.log_output, f"[*] {msg}")
             success = await loop.run_in_executor(
-                None,
+                self._io_pool,
                 lambda: self._backend.spi_flash_erase(
                     address=0,
                     erase_type="sector",
@@ -1554,16 +1801,17 @@ Available commands:
             # Create test data (256 bytes incrementing pattern)
             test_data = bytes(range(256))
 
-            # Progress callback
+            # Run write in executor; progress comes from the worker thread
+            loop = asyncio.get_running_loop()
+
             def progress(written, total):
                 pct = (written / total) * 100 if total > 0 else 0
-                self.log_output(f"[*] Progress: {written}/{total} bytes ({pct:.0f}%)")
+                loop.call_soon_threadsafe(
+                    self.log_output, f"[*] Progress: {written}/{total} bytes ({pct:.0f}%)"
+                )
                 return True  # Continue
-
-            # Run write in executor
-            loop = asyncio.get_event_loop()
             success = await loop.run_in_executor(
-                None,
+                self._io_pool,
                 lambda: self._backend.spi_flash_write(
                     address=0,
                     data=test_data,
@@ -1575,10 +1823,7 @@ Available commands:
                 self.log_output("[+] Write complete")
                 # Verify by reading back
                 self.log_output("[*] Verifying...")
-                verify_data = await loop.run_in_executor(
-                    None,
-                    lambda: self._backend.spi_flash_read(0, 256)
-                )
+                verify_data = await self._run_io(self._backend.spi_flash_read, 0, 256)
                 if verify_data == test_data:
                     self.log_output("[+] Verification passed")
                 else:
@@ -1606,11 +1851,12 @@ Available commands:
             if self.current_mode != "I2C":
                 await self._change_mode("I2C")
 
-            devices = self._backend.i2c_scan()
+            devices = await self._run_io(self._backend.i2c_scan)
             if devices:
-                self.log_output(f"[+] Found {len(devices)} device(s):")
-                for addr in devices:
-                    self.log_output(f"    0x{addr:02X}")
+                self._log_batch(
+                    [f"[+] Found {len(devices)} device(s):"]
+                    + ["    " + _HEX_BYTES[addr] for addr in devices]
+                )
             else:
                 self.log_output("[*] No I2C devices found")
         except Exception as e:
@@ -1629,7 +1875,7 @@ Available commands:
 
             self.log_output(f"[*] Reading from I2C address 0x{addr:02X}...")
 
-            data = self._backend.i2c_read(addr, 1)
+            data = await self._run_io(self._backend.i2c_read, addr, 1)
             if data:
                 self.log_output(f"[+] Read: 0x{data[0]:02X}")
             else:
@@ -1649,11 +1895,10 @@ Available commands:
 
     def _get_input_value(self, input_id: str, default: str) -> str:
         """Get value from an Input widget"""
-        try:
-            input_widget = self.query_one(f"#{input_id}", Input)
-            return input_widget.value if input_widget.value else default
-        except Exception:
+        input_widget = self._widget(input_id)
+        if input_widget is None:
             return default
+        return input_widget.value if input_widget.value else default
 
     # --------------------------------------------------------------------------
     # UART Operations
@@ -1672,7 +1917,7 @@ Available commands:
             if self.current_mode != "UART":
                 await self._change_mode("UART")
 
-            if self._backend.uart_start_bridge():
+            if await self._run_io(self._backend.uart_start_bridge):
                 self.log_output("[+] UART bridge mode active")
                 self.log_output("[*] Data is passed through transparently")
                 self.log_output("[*] Reset device to exit bridge mode")
@@ -1690,10 +1935,21 @@ Available commands:
         self.log_output("[*] Auto-detecting UART configuration...")
         self.log_output("[*] Make sure target is transmitting data...")
 
+        # The scan reconfigures UART at each candidate baud rate
+        self._applied_config = None
         try:
-            results = self._backend.uart_auto_detect_quick(
-                test_duration_ms=500,
-                progress_callback=lambda cur, tot, cfg: self._uart_scan_progress(cur, tot, cfg)
+            # Each candidate listens for 500ms, so scan on the I/O worker and
+            # hop progress reports back onto the event loop
+            loop = asyncio.get_running_loop()
+            backend = self._backend
+
+            def progress(cur: int, tot: int, cfg: str) -> bool:
+                loop.call_soon_threadsafe(self._uart_scan_progress, cur, tot, cfg)
+                return True
+
+            results = await loop.run_in_executor(
+                self._io_pool,
+                lambda: backend.uart_auto_detect_quick(test_duration_ms=500, progress_callback=progress)
             )
 
             if results:
@@ -1710,10 +1966,16 @@ Available commands:
         except Exception as e:
             self.log_output(f"[!] UART auto-detect error: {e}")
 
+    UART_PROGRESS_INTERVAL = 0.1  # seconds between scan progress lines
+
     def _uart_scan_progress(self, current: int, total: int, config_str: str) -> bool:
-        """Progress callback for UART scan"""
+        """Progress callback for UART scan, at most one line per interval"""
         if config_str:
-            self.log_output(f"[*] Testing {config_str}... ({current}/{total})")
+            now = time.monotonic()
+            # Always report the last config so the count ends at total
+            if now - self._uart_progress_t >= self.UART_PROGRESS_INTERVAL or current >= total:
+                self._uart_progress_t = now
+                self.log_output(f"[*] Testing {config_str}... ({current}/{total})")
         return True  # Continue scanning
 
     # --------------------------------------------------------------------------
@@ -1727,9 +1989,7 @@ Available commands:
             return
 
         try:
-            status = None
-            if hasattr(self._backend, 'get_full_status'):
-                status = self._backend.get_full_status()
+            status = await self._fetch_backend_status('get_full_status')
 
             if status:
                 adc_values = status.get('adc_mv', [])
@@ -1740,12 +2000,9 @@ Available commands:
                         self.log_output(f"    IO{i}: {val}mV ({voltage_v:.2f}V)")
 
                     # Update the ADC display in Power tab
-                    try:
-                        adc_ch0 = self.query_one("#adc-ch0", Static)
-                        if adc_values:
-                            adc_ch0.update(f"{adc_values[0] / 1000:.2f}")
-                    except Exception:
-                        pass
+                    adc_ch0 = self._widget("adc-ch0")
+                    if adc_ch0 is not None:
+                        adc_ch0.update(f"{adc_values[0] / 1000:.2f}")
                 else:
                     self.log_output("[*] No ADC data available")
             else:
@@ -1769,12 +2026,7 @@ Available commands:
 
             self.log_output(f"[*] Starting PWM: {frequency}Hz, {duty_cycle}% duty cycle...")
 
-            # Run in executor
-            loop = asyncio.get_event_loop()
-            success = await loop.run_in_executor(
-                None,
-                lambda: self._backend.pwm_start(frequency, duty_cycle)
-            )
+            success = await self._run_io(self._backend.pwm_start, frequency, duty_cycle)
 
             if success:
                 self.log_output(f"[+] PWM started on AUX pin")
@@ -1795,11 +2047,7 @@ Available commands:
         try:
             self.log_output("[*] Stopping PWM...")
 
-            loop = asyncio.get_event_loop()
-            success = await loop.run_in_executor(
-                None,
-                lambda: self._backend.pwm_stop()
-            )
+            success = await self._run_io(self._backend.pwm_stop)
 
             if success:
                 self.log_output("[+] PWM stopped")
@@ -1819,12 +2067,7 @@ Available commands:
             self.log_output("[*] Measuring frequency on AUX pin...")
             self.log_output("[*] Connect signal to AUX pin and wait...")
 
-            # Run in executor
-            loop = asyncio.get_event_loop()
-            freq = await loop.run_in_executor(
-                None,
-                lambda: self._backend.frequency_measure(timeout_ms=3000)
-            )
+            freq = await self._run_io(self._backend.frequency_measure, timeout_ms=3000)
 
             if freq is not None:
                 if freq >= 1_000_000:
@@ -1843,8 +2086,20 @@ Available commands:
     # Status Display Functions
     # --------------------------------------------------------------------------
 
-    async def _refresh_status_display(self) -> None:
-        """Refresh the status tab with current device information"""
+    async def _fetch_backend_status(self, getter: str) -> Optional[Dict[str, Any]]:
+        """Run a backend status query on the I/O worker; None if unsupported"""
+        fetch = getattr(self._backend, getter, None)
+        if fetch is None:
+            return None
+        return await self._run_io(fetch)
+
+    async def _refresh_status_display(self, status: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Refresh the status tab with current device information.
+
+        A full status the caller has just fetched can be passed in to
+        save a round-trip; otherwise it is queried here.
+        """
         if not self._backend:
             self.log_output("[!] Not connected")
             return
@@ -1852,146 +2107,170 @@ Available commands:
         self.log_output("[*] Refreshing device status...")
 
         try:
-            # Get full status from BPIO2
-            status = None
-            if hasattr(self._backend, 'get_full_status'):
-                status = self._backend.get_full_status()
-
-            if status:
-                # Version Information
-                fb_ver = f"{status.get('version_flatbuffers_major', '?')}.{status.get('version_flatbuffers_minor', '?')}"
-                self._update_status_field("status-flatbuffers", fb_ver)
-
-                hw_ver = f"{status.get('version_hardware_major', '?')} REV{status.get('version_hardware_minor', '?')}"
-                self._update_status_field("status-hardware", hw_ver)
-
-                fw_ver = f"{status.get('version_firmware_major', '?')}.{status.get('version_firmware_minor', '?')}"
-                self._update_status_field("status-firmware", fw_ver)
-
-                git_hash = status.get('version_firmware_git_hash', '')
-                self._update_status_field("status-git-hash", git_hash if git_hash else "N/A")
-
-                # Use version_firmware_date (correct key from BPIO2)
-                build_date = status.get('version_firmware_date', '')
-                self._update_status_field("status-build-date", build_date if build_date else "N/A")
-
-                # Mode Information
-                mode = status.get('mode_current', 'Unknown')
-                self._update_status_field("status-mode", mode if mode else "HiZ")
-                self.current_mode = mode if mode else "HiZ"
-
-                modes_available = status.get('modes_available', [])
-                self._update_status_field("status-modes-available", ", ".join(modes_available) if modes_available else "N/A")
-
-                # Use mode_bitorder_msb (boolean) from BPIO2
-                bit_order_msb = status.get('mode_bitorder_msb', True)
-                self._update_status_field("status-bit-order", "MSB" if bit_order_msb else "LSB")
-
-                pins = status.get('mode_pin_labels', [])
-                pin_str = ", ".join(pins) if pins else "N/A"
-                self._update_status_field("status-pins", pin_str)
-
-                # Use mode_max_* keys (correct from BPIO2)
-                max_packet = status.get('mode_max_packet_size', 0)
-                self._update_status_field("status-max-packet", f"{max_packet} bytes" if max_packet else "N/A")
-
-                max_write = status.get('mode_max_write', 0)
-                self._update_status_field("status-max-write", f"{max_write} bytes" if max_write else "N/A")
-
-                max_read = status.get('mode_max_read', 0)
-                self._update_status_field("status-max-read", f"{max_read} bytes" if max_read else "N/A")
-
-                # Power Supply
-                psu_enabled = status.get('psu_enabled', False)
-                self._update_status_field("status-psu", "Yes" if psu_enabled else "No", "status-val-on" if psu_enabled else "status-val-off")
-                self.power_enabled = psu_enabled
+            # Get full status from BPIO2 (simplified status as a fallback),
+            # off the event loop so the UI keeps servicing input meanwhile
+            if status is None:
+                status = await self._fetch_backend_status('get_full_status')
+            simple_status = None
+            if not status:
+                simple_status = await self._fetch_backend_status('get_status')
+
+            # One layout/paint pass for the whole table instead of one per field
+            with self.app.batch_update():
+                if status:
+                    # Version Information
+                    fb_ver = f"{status.get('version_flatbuffers_major', '?')}.{status.get('version_flatbuffers_minor', '?')}"
+                    self._update_status_field("status-flatbuffers", fb_ver)
+
+                    hw_ver = f"{status.get('version_hardware_major', '?')} REV{status.get('version_hardware_minor', '?')}"
+                    self._update_status_field("status-hardware", hw_ver)
+
+                    fw_ver = f"{status.get('version_firmware_major', '?')}.{status.get('version_firmware_minor', '?')}"
+                    self._update_status_field("status-firmware", fw_ver)
+
+                    git_hash = status.get('version_firmware_git_hash', '')
+                    self._update_status_field("status-git-hash", git_hash if git_hash else "N/A")
+
+                    # Use version_firmware_date (correct key from BPIO2)
+                    build_date = status.get('version_firmware_date', '')
+                    self._update_status_field("status-build-date", build_date if build_date else "N/A")
+
+                    # Mode Information
+                    mode = status.get('mode_current', 'Unknown')
+                    self._update_status_field("status-mode", mode if mode else "HiZ")
+                    self.current_mode = mode if mode else "HiZ"
+
+                    modes_available = status.get('modes_available', [])
+                    self._update_status_field("status-modes-available", ", ".join(modes_available) if modes_available else "N/A")
+
+                    # Use mode_bitorder_msb (boolean) from BPIO2
+                    bit_order_msb = status.get('mode_bitorder_msb', True)
+                    self._update_status_field("status-bit-order", "MSB" if bit_order_msb else "LSB")
+
+                    pins = status.get('mode_pin_labels', [])
+                    pin_str = ", ".join(pins) if pins else "N/A"
+                    self._update_status_field("status-pins", pin_str)
+
+                    # Use mode_max_* keys (correct from BPIO2)
+                    max_packet = status.get('mode_max_packet_size', 0)
+                    self._update_status_field("status-max-packet", f"{max_packet} bytes" if max_packet else "N/A")
+
+                    max_write = status.get('mode_max_write', 0)
+                    self._update_status_field("status-max-write", f"{max_write} bytes" if max_write else "N/A")
+
+                    max_read = status.get('mode_max_read', 0)
+                    self._update_status_field("status-max-read", f"{max_read} bytes" if max_read else "N/A")
+
+                    # Power Supply
+                    psu_enabled = status.get('psu_enabled', False)
+                    self._update_status_field("status-psu", "Yes" if psu_enabled else "No", "status-val-on" if psu_enabled else "status-val-off")
+                    self.power_enabled = psu_enabled
+
+                    set_mv = status.get('psu_set_mv', 0)
+                    self._update_status_field("status-set-voltage", f"{set_mv} mV")
+
+                    set_ma = status.get('psu_set_ma', 0)
+                    self._update_status_field("status-set-current", f"{set_ma} mA")
+
+                    meas_mv = status.get('psu_measured_mv', 0)
+                    self._update_status_field("status-voltage-meas", f"{meas_mv} mV")
+
+                    meas_ma = status.get('psu_measured_ma', 0)
+                    self._update_status_field("status-current-meas", f"{meas_ma} mA")
+
+                    # Use psu_current_error (correct key from BPIO2)
+                    oc_error = status.get('psu_current_error', False)
+                    self._update_status_field("status-oc-error", "Yes" if oc_error else "No", "status-val-error" if oc_error else "")
+
+                    pullups = status.get('pullup_enabled', False)
+                    self._update_status_field("status-pullups", "Enabled" if pullups else "Disabled", "status-val-on" if pullups else "status-val-off")
+                    self.pullups_enabled = pullups
+
+                    # IO Pins
+                    adc_values = status.get('adc_mv', [])
+                    if adc_values:
+                        adc_str = ", ".join(f"{v}mV" for v in adc_values[:8])
+                        self._update_status_field("status-adc-values", adc_str)
+                    else:
+                        self._update_status_field("status-adc-values", "N/A")
 
-                set_mv = status.get('psu_set_mv', 0)
-                self._update_status_field("status-set-voltage", f"{set_mv} mV")
+                    io_dir = status.get('io_direction', 0)
+                    if isinstance(io_dir, int):
+                        dir_strs = [labels[(io_dir >> i) & 1] for i, labels in enumerate(_IO_DIRECTION_LABELS)]
+                        self._update_status_field("status-io-directions", ", ".join(dir_strs))
+                    else:
+                        self._update_status_field("status-io-directions", str(io_dir))
 
-                set_ma = status.get('psu_set_ma', 0)
-                self._update_status_field("status-set-current", f"{set_ma} mA")
+                    io_val = status.get('io_value', 0)
+                    if isinstance(io_val, int):
+                        val_strs = [labels[(io_val >> i) & 1] for i, labels in enumerate(_IO_LEVEL_LABELS)]
+                        self._update_status_field("status-io-values", ", ".join(val_strs))
+                    else:
+                        self._update_status_field("status-io-values", str(io_val))
 
-                meas_mv = status.get('psu_measured_mv', 0)
-                self._update_status_field("status-voltage-meas", f"{meas_mv} mV")
+                    # System - use led_count and disk_*_mb (correct keys from BPIO2)
+                    led_count = status.get('led_count', 0)
+                    self._update_status_field("status-leds", str(led_count) if led_count else "N/A")
 
-                meas_ma = status.get('psu_measured_ma', 0)
-                self._update_status_field("status-current-meas", f"{meas_ma} mA")
+                    disk_size_mb = status.get('disk_size_mb', 0)
+                    self._update_status_field("status-disk-size", f"{disk_size_mb:.2f} MB" if disk_size_mb else "N/A")
 
-                # Use psu_current_error (correct key from BPIO2)
-                oc_error = status.get('psu_current_error', False)
-                self._update_status_field("status-oc-error", "Yes" if oc_error else "No", "status-val-error" if oc_error else "")
+                    disk_used_mb = status.get('disk_used_mb', 0)
+                    self._update_status_field("status-disk-used", f"{disk_used_mb:.2f} MB" if disk_used_mb else "N/A")
 
-                pullups = status.get('pullup_enabled', False)
-                self._update_status_field("status-pullups", "Enabled" if pullups else "Disabled", "status-val-on" if pullups else "status-val-off")
-                self.pullups_enabled = pullups
+                    self.log_output("[+] Status refreshed")
 
-                # IO Pins
-                adc_values = status.get('adc_mv', [])
-                if adc_values:
-                    adc_str = ", ".join(f"{v}mV" for v in adc_values[:8])
-                    self._update_status_field("status-adc-values", adc_str)
                 else:
-                    self._update_status_field("status-adc-values", "N/A")
-
-                io_dir = status.get('io_direction', 0)
-                if isinstance(io_dir, int):
-                    dir_strs = [f"IO{i}:{'OUT' if (io_dir >> i) & 1 else 'IN'}" for i in range(8)]
-                    self._update_status_field("status-io-directions", ", ".join(dir_strs))
-                else:
-                    self._update_status_field("status-io-directions", str(io_dir))
-
-                io_val = status.get('io_value', 0)
-                if isinstance(io_val, int):
-                    val_strs = [f"IO{i}:{'HIGH' if (io_val >> i) & 1 else 'LOW'}" for i in range(8)]
-                    self._update_status_field("status-io-values", ", ".join(val_strs))
-                else:
-                    self._update_status_field("status-io-values", str(io_val))
-
-                # System - use led_count and disk_*_mb (correct keys from BPIO2)
-                led_count = status.get('led_count', 0)
-                self._update_status_field("status-leds", str(led_count) if led_count else "N/A")
-
-                disk_size_mb = status.get('disk_size_mb', 0)
-                self._update_status_field("status-disk-size", f"{disk_size_mb:.2f} MB" if disk_size_mb else "N/A")
-
-                disk_used_mb = status.get('disk_used_mb', 0)
-                self._update_status_field("status-disk-used", f"{disk_used_mb:.2f} MB" if disk_used_mb else "N/A")
-
-                self.log_output("[+] Status refreshed")
-
-            else:
-                # Try simplified status
-                simple_status = self._backend.get_status() if hasattr(self._backend, 'get_status') else None
-                if simple_status and not simple_status.get('error'):
-                    self._update_status_field("status-firmware", simple_status.get('firmware', 'N/A'))
-                    self._update_status_field("status-hardware", simple_status.get('hardware', 'N/A'))
-                    self._update_status_field("status-mode", simple_status.get('mode', 'HiZ'))
-                    self._update_status_field("status-psu", "Yes" if simple_status.get('psu_enabled') else "No")
-                    self._update_status_field("status-pullups", "Enabled" if simple_status.get('pullups_enabled') else "Disabled")
-
-                    if simple_status.get('serial_fallback'):
-                        self.log_output("[!] Limited info (serial fallback mode)")
+                    # Try simplified status
+                    if simple_status and not simple_status.get('error'):
+                        self._update_status_field("status-firmware", simple_status.get('firmware', 'N/A'))
+                        self._update_status_field("status-hardware", simple_status.get('hardware', 'N/A'))
+                        self._update_status_field("status-mode", simple_status.get('mode', 'HiZ'))
+                        self._update_status_field("status-psu", "Yes" if simple_status.get('psu_enabled') else "No")
+                        self._update_status_field("status-pullups", "Enabled" if simple_status.get('pullups_enabled') else "Disabled")
+
+                        if simple_status.get('serial_fallback'):
+                            self.log_output("[!] Limited info (serial fallback mode)")
+                        else:
+                            self.log_output("[+] Status refreshed (simplified)")
                     else:
-                        self.log_output("[+] Status refreshed (simplified)")
-                else:
-                    self.log_output("[!] Could not get device status")
+                        self.log_output("[!] Could not get device status")
+
+                self._paint_status_blocks()
 
         except Exception as e:
             self.log_output(f"[!] Status refresh error: {e}")
 
     def _update_status_field(self, field_id: str, value: str, css_class: str = "") -> None:
-        """Update a status field in the Status tab with optional styling"""
-        try:
-            field = self.query_one(f"#{field_id}", Static)
-            field.update(value)
-            # Apply CSS class if provided (for on/off/error styling)
-            if css_class:
-                # Remove previous state classes and add new one
-                field.remove_class("status-val-on", "status-val-off", "status-val-error")
-                field.add_class(css_class)
-        except Exception:
-            pass  # Field may not exist yet
+        """
+        Set a status field in the Status tab, with optional on/off/error
+        styling. The field's block is repainted by _paint_status_blocks.
+        """
+        # Steady-state refreshes mostly repeat the last values; skip the repaint
+        if self._status_cache.get(field_id) == (value, css_class):
+            return
+        self._status_cache[field_id] = (value, css_class)
+        self._status_dirty.add(_STATUS_FIELD_BLOCKS[field_id])
+
+    def _render_status_block(self, fields) -> Table:
+        """Render one status group's fields as a key/value grid"""
+        style = self.get_component_rich_style
+        table = Table.grid(padding=(0, 1), expand=True)
+        table.add_column(width=13, justify="right", style=style("status-key", partial=True))
+        table.add_column(ratio=1)
+        for field_id, label in fields:
+            value, state = self._status_cache.get(field_id, ("---", ""))
+            names = ("status-val", state) if state else ("status-val",)
+            table.add_row(label, Text(value, style=style(*names, partial=True)))
+        return table
+
+    def _paint_status_blocks(self) -> None:
+        """Repaint the status blocks whose fields changed, one update each"""
+        for block_id in self._status_dirty:
+            block = self._widget(block_id)
+            if block is not None:
+                block.update(self._render_status_block(_STATUS_BLOCK_FIELDS[block_id]))
+        self._status_dirty.clear()
 
     # --------------------------------------------------------------------------
     # Logic Analyzer Functions
@@ -1999,21 +2278,52 @@ Available commands:
 
     def _update_logic_status(self, message: str) -> None:
         """Update the logic analyzer status line"""
-        try:
-            status = self.query_one("#logic-status", Static)
+        status = self._widget("logic-status")
+        if status is not None:
             status.update(message)
-        except Exception:
-            pass
 
-    def _logic_log(self, message: str) -> None:
-        """Log message to the logic analyzer log widget"""
-        try:
-            log_widget = self.query_one("#logic-log", Log)
-            log_widget.write_line(message)
-        except Exception:
-            pass
+    def _log_batch(self, lines: List[str]) -> None:
+        """Write several console lines as one output message (one redraw)"""
+        if lines:
+            self.log_output("\n".join(lines))
+
+    LOG_FLUSH_INTERVAL = 0.03  # seconds Log widget lines are held before writing
+
+    def _queue_log(self, widget_id: str, lines) -> None:
+        """
+        Queue lines for a Log widget, written out by _flush_logs.
+
+        Bursts (capture progress, decoder output) then cost one write and
+        one redraw per widget every LOG_FLUSH_INTERVAL, however many lines
+        arrive in between.
+        """
+        self._log_pending.setdefault(widget_id, []).extend(lines)
+        if self._log_flush_timer is None:
+            self._log_flush_timer = self.set_timer(self.LOG_FLUSH_INTERVAL, self._flush_logs)
+
+    def _flush_logs(self) -> None:
+        """Write all queued lines, one write_lines() per Log widget"""
+        self._log_flush_timer = None
+        pending, self._log_pending = self._log_pending, {}
+        for widget_id, lines in pending.items():
+            log = self._widget(widget_id)
+            if log is not None:
+                try:
+                    log.write_lines(lines)
+                except Exception:
+                    pass
+
+    def _logic_log(self, *messages: str) -> None:
+        """
+        Log one or more lines to the logic analyzer log widget.
+
+        Lines are queued and written in batches, so the log widget
+        refreshes at most once per LOG_FLUSH_INTERVAL.
+        """
+        if self._logic_log_widget is not None:
+            self._queue_log("logic-log", messages)
         # Also send to main log
-        self.log_output(message)
+        self.log_output("\n".join(messages))
 
     def _logic_scroll(self, delta: int) -> None:
         """Scroll the logic analyzer waveform view"""
@@ -2069,11 +2379,9 @@ Available commands:
         self._logic_widget.set_protocol(protocol, channel_map)
 
         # Update hint text
-        try:
-            hint_widget = self.query_one("#logic-protocol-hint", Static)
+        hint_widget = self._widget("logic-protocol-hint")
+        if hint_widget is not None:
             hint_widget.update(hint_text)
-        except Exception:
-            pass
 
         # Log the change
         if protocol != ProtocolType.NONE:
@@ -2095,31 +2403,31 @@ Available commands:
 
         # Get config from UI - use new separate trigger selectors like Bolt
         try:
-            rate_select = self.query_one("#logic-rate", Select)
-            samples_select = self.query_one("#logic-samples", Select)
-            trigger_ch_select = self.query_one("#logic-trigger-channel", Select)
-            trigger_edge_select = self.query_one("#logic-trigger-edge", Select)
-            sump_port_input = self.query_one("#logic-sump-port", Input)
+            rate_select = self._logic_rate_select
+            samples_select = self._logic_samples_select
+            trigger_ch_select = self._logic_trigger_ch_select
+            trigger_edge_select = self._logic_trigger_edge_select
+            sump_port_input = self._logic_sump_port_input
 
             sample_rate = int(rate_select.value) if rate_select.value != Select.BLANK else 1000000
             num_samples = int(samples_select.value) if samples_select.value != Select.BLANK else 8192
 
-            # Parse trigger settings
-            trigger_channel = None
-            trigger_ch_val = trigger_ch_select.value
-            if trigger_ch_val and trigger_ch_val != "none" and trigger_ch_val != Select.BLANK:
-                trigger_channel = int(trigger_ch_val)
+            # Look up trigger settings (blank or unknown means immediate)
+            trigger_channel = _TRIGGER_MAP.get(trigger_ch_select.value)
 
             trigger_edge = str(trigger_edge_select.value) if trigger_edge_select.value != Select.BLANK else "rising"
 
             # Get custom SUMP port if specified
             custom_port = sump_port_input.value.strip() if sump_port_input.value else None
 
-            self._logic_log(f"[*] Rate: {sample_rate/1e6:.1f}MHz, Samples: {num_samples}")
             if trigger_channel is not None:
-                self._logic_log(f"[*] Trigger: CH{trigger_channel} {trigger_edge} edge")
+                trigger_msg = f"[*] Trigger: CH{trigger_channel} {trigger_edge} edge"
             else:
-                self._logic_log("[*] Trigger: Immediate (no trigger)")
+                trigger_msg = "[*] Trigger: Immediate (no trigger)"
+            self._logic_log(
+                f"[*] Rate: {sample_rate/1e6:.1f}MHz, Samples: {num_samples}",
+                trigger_msg
+            )
 
         except Exception as e:
             self._logic_log(f"[!] Config error: {e}")
@@ -2133,121 +2441,184 @@ Available commands:
             self._logic_log("[*] Entering SUMP mode...")
             try:
                 # Run capture in background to avoid blocking UI
-                loop = asyncio.get_event_loop()
-
-                # Run the blocking capture in executor
-                result = await loop.run_in_executor(
-                    None,
-                    lambda: self._backend.capture_logic(
-                        sample_rate=sample_rate,
-                        sample_count=num_samples,
-                        channels=8,
-                        trigger_channel=trigger_channel,
-                        trigger_edge=trigger_edge,
-                        timeout=10.0
-                    )
+                loop = asyncio.get_running_loop()
+                # The device reads straight into the preallocated buffer
+                buf = self._logic_buffer[:num_samples]
+                self._logic_stop.clear()
+                self._applied_config = None  # SUMP leaves the previous bus mode
+
+                # Producer: the blocking capture in the executor reports byte
+                # counts into a bounded queue; consumer: redraws at <= 30 FPS
+                progress_q: asyncio.Queue = asyncio.Queue(maxsize=64)
+
+                def offer(received: int) -> None:
+                    # Only the latest count matters: when full, make room by
+                    # discarding the oldest (runs on the loop, so no race)
+                    if progress_q.full():
+                        progress_q.get_nowait()
+                    progress_q.put_nowait(received)
+
+                consumer = asyncio.create_task(
+                    self._logic_consume(progress_q, buf, sample_rate)
                 )
-
-                if result and result.get("samples"):
-                    sample_count = len(result['samples'][0]) if result.get('samples') else 0
-                    self._logic_log(f"[+] Captured {sample_count} samples")
-
-                    # Convert to LogicCapture format
+                try:
+                    # On the I/O worker like every other backend call, so ADC
+                    # refreshes and PSU writes queue behind the SUMP session
+                    # instead of hitting the port mid-capture
+                    result = await loop.run_in_executor(
+                        self._io_pool,
+                        lambda: self._backend.capture_logic(
+                            sample_rate=sample_rate,
+                            sample_count=num_samples,
+                            channels=8,
+                            trigger_channel=trigger_channel,
+                            trigger_edge=trigger_edge,
+                            timeout=10.0,
+                            out=buf,
+                            stop_event=self._logic_stop,
+                            progress=lambda n: loop.call_soon_threadsafe(offer, n)
+                        )
+                    )
+                finally:
+                    consumer.cancel()
+
+                if result and result.get("samples") is not None:
+                    # Backend hands back a reversed view of _logic_buffer; this
+                    # is the capture's only copy, so the next capture can reuse
+                    # the buffer. copy() rather than ascontiguousarray(), which
+                    # would pass a one-sample view through uncopied
                     capture = LogicCapture(
                         channels=result.get("channels", 8),
                         sample_rate=result.get("sample_rate", sample_rate),
-                        samples=result["samples"],
+                        samples=result["samples"].copy(),
                         trigger_position=result.get("trigger_position", 0)
                     )
-
+                    sample_count = capture.sample_count
                     if self._logic_widget:
-                        self._logic_widget.set_capture(capture)
-                        self._logic_widget.scroll_to_trigger()
-                        self._logic_log("[+] Capture complete - waveform updated")
                         self._update_logic_status(f"Captured {sample_count} samples - use scroll buttons to navigate")
-
-                        # Show decoded summary if protocol is set
-                        decoded_summary = self._logic_widget.get_decoded_summary()
-                        if decoded_summary and "No decoded" not in decoded_summary:
-                            self._logic_log(f"[+] Decoded: {decoded_summary}")
+                        self.call_after_refresh(
+                            self._show_logic_capture,
+                            capture,
+                            f"[+] Captured {sample_count} samples",
+                            "[+] Capture complete - waveform updated"
+                        )
+                    else:
+                        self._logic_log(f"[+] Captured {sample_count} samples")
+                elif self._logic_stop.is_set():
+                    pass  # _stop_logic_capture already reported it
                 else:
-                    self._logic_log("[!] Capture returned no data")
-                    self._logic_log("[*] Check device connection and trigger conditions")
+                    self._logic_log(
+                        "[!] Capture returned no data",
+                        "[*] Check device connection and trigger conditions"
+                    )
                     self._update_logic_status("Capture failed - no data returned")
 
             except Exception as e:
-                self._logic_log(f"[!] Capture error: {e}")
-                self._logic_log("[*] Use 'Demo' button to test with sample data")
+                self._logic_log(
+                    f"[!] Capture error: {e}",
+                    "[*] Use 'Demo' button to test with sample data"
+                )
                 self._update_logic_status(f"Capture error: {e}")
         else:
-            self._logic_log("[!] No backend available for hardware capture")
-            self._logic_log("[*] Use 'Demo' button to test with sample data")
+            self._logic_log(
+                "[!] No backend available for hardware capture",
+                "[*] Use 'Demo' button to test with sample data"
+            )
             self._update_logic_status("No backend - use Demo to test")
 
         self._logic_capturing = False
 
+    def _show_logic_capture(self, capture: LogicCapture, *messages: str) -> None:
+        """
+        Hand a finished capture to the waveform widget and log the result.
+
+        Called via call_after_refresh so the status update paints before
+        the widget decodes and re-renders a large capture.
+        """
+        if not self._logic_widget:
+            return
+
+        self._logic_widget.set_capture(capture)
+        self._logic_widget.scroll_to_trigger()
+
+        # Show decoded summary if protocol is set
+        decoded_summary = self._logic_widget.get_decoded_summary()
+        if decoded_summary and "No decoded" not in decoded_summary:
+            messages += (f"[+] Decoded: {decoded_summary}",)
+
+        self._logic_log(*messages)
+
+    def _launch_logic_capture(self) -> None:
+        """Run the capture as a task so the Stop button stays responsive"""
+        if self._logic_task is not None and not self._logic_task.done():
+            self._logic_log("[!] Capture already in progress")
+            return
+        self._logic_task = asyncio.create_task(self._start_logic_capture())
+
+    async def _logic_consume(self, progress_q: asyncio.Queue, buf: np.ndarray, sample_rate: int) -> None:
+        """Preview a streaming capture from producer byte counts, at most 30 times a second"""
+        total = len(buf)
+        while True:
+            received = await progress_q.get()
+            # Coalesce everything queued since the last frame
+            while not progress_q.empty():
+                received = progress_q.get_nowait()
+
+            self._update_logic_status(f"Receiving... {received}/{total} samples")
+            if self._logic_widget:
+                # SUMP sends newest first; show what has arrived in capture order
+                self._logic_widget.show_partial(buf[:received][::-1], sample_rate)
+            await asyncio.sleep(1 / 30)
+
     async def _stop_logic_capture(self) -> None:
         """Stop logic analyzer capture"""
         if not self._logic_capturing:
             return
 
+        # The SUMP read loop checks this between chunks
+        self._logic_stop.set()
         self._logic_capturing = False
         self._logic_log("[*] Capture stopped")
         self._update_logic_status("Capture stopped")
 
     async def _load_logic_demo(self) -> None:
         """Load demo capture data for testing the waveform display"""
-        import random
-
         self._logic_log("[*] Loading demo capture data...")
         self._update_logic_status("Loading demo data...")
 
-        # Generate realistic-looking demo waveforms
-        samples = []
+        # Generate realistic-looking demo waveforms, packed one bit per
+        # channel per sample (bit N = CHN) the way SUMP delivers them
         num_samples = 500
+        idx = np.arange(num_samples)
 
         # CH0: Clock signal (regular square wave)
-        ch0 = []
-        for i in range(num_samples):
-            ch0.append(1 if (i // 8) % 2 == 0 else 0)
-        samples.append(ch0)
+        ch0 = ((idx // 8) & 1) ^ 1
 
         # CH1: Data signal (changes on clock edges, simulating SPI MOSI)
-        ch1 = []
-        data_byte = 0xA5  # Example data pattern
-        bit_idx = 0
-        for i in range(num_samples):
-            if i % 64 == 0:  # New byte every 64 samples (8 bits * 8 samples/bit)
-                data_byte = random.randint(0, 255)
-                bit_idx = 0
-            bit = (data_byte >> (7 - (bit_idx // 8))) & 1
-            ch1.append(bit)
-            if i % 8 == 7:
-                bit_idx += 1
-        samples.append(ch1)
+        ch1 = _gen_spi_data(num_samples, _DEMO_RNG)
 
         # CH2: Chip select (low during transfer)
-        ch2 = []
-        for i in range(num_samples):
-            ch2.append(0 if 50 < i < 450 else 1)
-        samples.append(ch2)
+        ch2 = (idx <= 50) | (idx >= 450)
 
         # CH3: Glitch trigger signal (short pulse)
-        ch3 = []
-        glitch_pos = random.randint(200, 300)
-        for i in range(num_samples):
-            ch3.append(1 if glitch_pos <= i < glitch_pos + 5 else 0)
-        samples.append(ch3)
-
-        # CH4-7: Random noise/unused
-        for ch in range(4, 8):
-            ch_data = []
-            state = 0
-            for i in range(num_samples):
-                if random.random() < 0.02:
-                    state = 1 - state
-                ch_data.append(state)
-            samples.append(ch_data)
+        glitch_pos = int(_DEMO_RNG.integers(200, 301))
+        ch3 = (idx >= glitch_pos) & (idx < glitch_pos + 5)
+
+        # CH4-7: Random noise/unused, toggling with 2% probability per sample.
+        # Transitions are packed straight into bits 4-7, so one XOR-accumulate
+        # over the packed bytes gives all four channels' states in place
+        transitions = (_DEMO_RNG.random((4, num_samples)) < 0.02).view(np.uint8)
+        noise = np.bitwise_xor.accumulate(
+            np.bitwise_or.reduce(transitions << np.arange(4, 8, dtype=np.uint8)[:, None], axis=0)
+        )
+
+        samples = (
+            ch0.astype(np.uint8)
+            | (ch1.astype(np.uint8) << 1)
+            | (ch2.astype(np.uint8) << 2)
+            | (ch3.astype(np.uint8) << 3)
+            | noise
+        )
 
         # Create capture object
         capture = LogicCapture(
@@ -2259,11 +2630,13 @@ Available commands:
 
         # Update the widget
         if self._logic_widget:
-            self._logic_widget.set_capture(capture)
-            self._logic_widget.scroll_to_trigger()
-            self._logic_log(f"[+] Loaded {num_samples} samples, trigger at position {glitch_pos}")
-            self._logic_log("[*] CH0=CLK, CH1=DATA, CH2=CS, CH3=GLITCH_TRIGGER")
             self._update_logic_status(f"Demo loaded: {num_samples} samples - use scroll buttons to navigate")
+            self.call_after_refresh(
+                self._show_logic_capture,
+                capture,
+                f"[+] Loaded {num_samples} samples, trigger at position {glitch_pos}",
+                "[*] CH0=CLK, CH1=DATA, CH2=CS, CH3=GLITCH_TRIGGER"
+            )
         else:
             self._logic_log("[!] Logic widget not initialized")
             self._update_logic_status("Error: Logic widget not initialized")
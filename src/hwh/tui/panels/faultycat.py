@@ -36,10 +36,19 @@ class FaultyCatPanel(DevicePanel):
     """
 
     DEVICE_NAME = "FaultyCat"
-    CAPABILITIES = [
+    CAPABILITIES = (
         PanelCapability.EMFI,
         PanelCapability.GPIO,
-    ]
+    )
+
+    SUGGESTIONS = (
+        CommandSuggestion("help", "Show available commands"),
+        CommandSuggestion("arm", "Arm EMFI device"),
+        CommandSuggestion("disarm", "Disarm EMFI device"),
+        CommandSuggestion("fire", "Fire EMFI pulse"),
+        CommandSuggestion("detect swd", "Detect SWD pins", "detect"),
+        CommandSuggestion("detect jtag", "Detect JTAG pins", "detect"),
+    )
 
     def __init__(self, device_info: DeviceInfo, app, *args, **kwargs):
         super().__init__(device_info, app, *args, **kwargs)
@@ -158,37 +167,24 @@ class FaultyCatPanel(DevicePanel):
         """Arm the EMFI device"""
         self.armed = True
         self.log_output("[!] EMFI ARMED - Ready to fire")
-
-        try:
-            status = self.query_one("#arm-status", Static)
-            status.update("ARMED")
-            status.remove_class("status-safe")
-            status.add_class("status-danger")
-
-            fire_btn = self.query_one("#btn-fire", Button)
-            fire_btn.disabled = False
-
-            msg = self.query_one("#arm-message", Static)
-            msg.remove_class("hidden")
-        except Exception:
-            pass
+        self._show_armed(True)
 
     def _disarm(self) -> None:
         """Disarm the EMFI device"""
         self.armed = False
         self.log_output("[*] EMFI DISARMED")
+        self._show_armed(False)
 
+    def _show_armed(self, armed: bool) -> None:
+        """Reflect the arm state in the status line, fire button and warning"""
         try:
             status = self.query_one("#arm-status", Static)
-            status.update("DISARMED")
-            status.remove_class("status-danger")
-            status.add_class("status-safe")
+            status.update("ARMED" if armed else "DISARMED")
+            status.set_class(armed, "status-danger")
+            status.set_class(not armed, "status-safe")
 
-            fire_btn = self.query_one("#btn-fire", Button)
-            fire_btn.disabled = True
-
-            msg = self.query_one("#arm-message", Static)
-            msg.add_class("hidden")
+            self.query_one("#btn-fire", Button).disabled = not armed
+            self.query_one("#arm-message", Static).set_class(not armed, "hidden")
         except Exception:
             pass
 
@@ -235,23 +231,6 @@ class FaultyCatPanel(DevicePanel):
         else:
             self.log_output(f"Unknown command: {cmd}")
 
-    def get_command_suggestions(self, partial: str) -> List[CommandSuggestion]:
-        """Get suggestions"""
-        suggestions = [
-            CommandSuggestion("help", "Show available commands"),
-            CommandSuggestion("arm", "Arm EMFI device"),
-            CommandSuggestion("disarm", "Disarm EMFI device"),
-            CommandSuggestion("fire", "Fire EMFI pulse"),
-            CommandSuggestion("detect swd", "Detect SWD pins", "detect"),
-            CommandSuggestion("detect jtag", "Detect JTAG pins", "detect"),
-        ]
-
-        if partial:
-            partial_lower = partial.lower()
-            suggestions = [s for s in suggestions if s.command.lower().startswith(partial_lower)]
-
-        return suggestions
-
     def _show_help(self) -> None:
         """Display help"""
         help_text = """
@@ -15,26 +15,82 @@ Features:
 from typing import List, Optional, Tuple
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from textual.app import ComposeResult
 from textual.widget import Widget
 from textual.widgets import Static
 from textual.containers import Container, Vertical, Horizontal
 from textual.reactive import reactive
 
+from ...logic_kernels import unpack8, waveform_glyphs
 from .protocol_decoders import (
     ProtocolType, DecodedCapture, decode_protocol,
     SPITransaction, I2CTransaction, UARTFrame
 )
 
 
-@dataclass
+# Waveform row labels; SUMP captures have at most 32 channels
+_CHANNEL_LABELS = tuple(f"CH{i} " for i in range(32))
+
+# Capture Select options, built once and shared by every panel instance
+_RATE_OPTIONS = (("1MHz", "1000000"), ("10MHz", "10000000"), ("62.5MHz", "62500000"))
+_SAMPLES_OPTIONS = (("1K", "1024"), ("8K", "8192"), ("32K", "32768"))
+
+
+def _demo_samples(channels: int, count: int = 1000, toggle: float = 0.05) -> np.ndarray:
+    """Random packed waveforms: each channel toggles with probability `toggle`"""
+    rng = np.random.default_rng()
+    dtype = np.uint8 if channels <= 8 else np.uint32
+    mask = (1 << channels) - 1
+    # One bit per channel per sample set where that channel transitions
+    flips = np.bitwise_or.reduce(
+        (rng.random((channels, count)) < toggle).astype(dtype)
+        << np.arange(channels, dtype=dtype)[:, None],
+        axis=0
+    )
+    flips[0] = rng.integers(0, mask + 1, dtype=dtype)  # Random start levels
+    return np.bitwise_xor.accumulate(flips)
+
+
+@dataclass(slots=True, frozen=True, eq=False)
 class LogicCapture:
-    """Captured logic data"""
+    """
+    Captured logic data.
+
+    Immutable; compares and hashes by identity since ndarrays are not
+    hashable. Protocol decode results live on the displaying widget.
+    """
     channels: int = 8
     sample_rate: int = 1000000  # 1MHz default
-    samples: List[List[int]] = field(default_factory=list)
+    # Packed samples, bit c = channel c (one byte per sample for 8 channels).
+    # Packed bytes/bytearray and per-channel rows are converted on construction.
+    samples: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.uint8))
     trigger_position: int = 0
-    decoded: Optional[DecodedCapture] = None  # Protocol decoded data
+
+    def __post_init__(self) -> None:
+        if isinstance(self.samples, (bytes, bytearray, memoryview)):
+            # Raw packed bytes (e.g. straight off the wire): view, don't copy
+            samples = np.frombuffer(self.samples, dtype=np.uint8)
+        else:
+            samples = np.asarray(self.samples)
+        if samples.ndim == 2:
+            # Per-channel rows from older callers: pack into one word per sample
+            dtype = np.uint8 if samples.shape[0] <= 8 else np.uint32
+            shifts = np.arange(samples.shape[0], dtype=dtype)[:, None]
+            samples = np.bitwise_or.reduce(samples.astype(dtype) << shifts, axis=0)
+        elif samples.dtype.kind != "u":
+            samples = samples.astype(np.uint8 if self.channels <= 8 else np.uint32)
+        object.__setattr__(self, "samples", samples)
+
+    @property
+    def sample_count(self) -> int:
+        """Number of samples per channel"""
+        return self.samples.shape[0]
+
+    def channel(self, channel: int) -> np.ndarray:
+        """Return one channel as a 0/1 array"""
+        return (self.samples >> channel) & 1
 
 
 @dataclass
@@ -84,6 +140,8 @@ class LogicAnalyzerWidget(Widget):
 
         # Capture data
         self.capture: Optional[LogicCapture] = None
+        self._decoded: Optional[DecodedCapture] = None  # Protocol decode of self.capture
+        self._capture_key: Optional[tuple] = None  # Identity of the last set_capture() data
 
         # Protocol decoding
         self._protocol = ProtocolType.NONE
@@ -93,25 +151,35 @@ class LogicAnalyzerWidget(Widget):
         # Display state
         self._waveform_lines: List[str] = []
 
+        # Display widgets, kept from compose so redraws skip id lookups
+        self._scale_widget: Optional[Static] = None
+        self._channel_widgets: List[Static] = []
+        self._annotations_widget: Optional[Static] = None
+
     def compose(self) -> ComposeResult:
         with Vertical(classes="logic-analyzer"):
             # Header with scale
-            yield Static(self._build_scale_line(), id="logic-scale", classes="logic-scale")
+            self._scale_widget = Static(self._build_scale_line(), id="logic-scale", classes="logic-scale")
+            yield self._scale_widget
 
             # Waveform display area
-            for i in range(self.num_channels):
-                yield Static(
+            self._channel_widgets = [
+                Static(
                     self._build_empty_channel(i),
                     id=f"logic-ch{i}",
                     classes="logic-channel"
                 )
+                for i in range(self.num_channels)
+            ]
+            yield from self._channel_widgets
 
             # Protocol annotation line
-            yield Static(
+            self._annotations_widget = Static(
                 "",
                 id="logic-annotations",
                 classes="logic-annotations"
             )
+            yield self._annotations_widget
 
             # Footer with controls hint
             yield Static(
@@ -130,20 +198,53 @@ class LogicAnalyzerWidget(Widget):
 
     def _build_empty_channel(self, channel: int) -> str:
         """Build an empty channel line"""
-        label = f"CH{channel} "
+        label = _CHANNEL_LABELS[channel]
         waveform = self.LOW * self.visible_samples
         return f"{label}{waveform}"
 
     def set_capture(self, capture: LogicCapture) -> None:
-        """Set the capture data to display"""
+        """
+        Set the capture data to display.
+
+        Re-setting a capture identical to the one shown (same samples,
+        rate and trigger) is a no-op, so decoding and redraw are skipped.
+        """
+        key = (
+            capture.channels,
+            capture.sample_rate,
+            capture.trigger_position,
+            capture.samples.dtype.str,
+            hash(capture.samples.tobytes()),
+        )
+        if key == self._capture_key and self.capture is not None:
+            return
+
         self.capture = capture
+        self._capture_key = key
+        self._decoded = None
 
         # Decode protocol if one is set
-        if self._protocol != ProtocolType.NONE and capture.samples:
+        if self._protocol != ProtocolType.NONE and capture.sample_count:
             self._decode_protocol()
 
         self._update_display()
 
+    def show_partial(self, samples: np.ndarray, sample_rate: int) -> None:
+        """
+        Preview samples from a capture that is still streaming in.
+
+        No protocol decoding is done; call set_capture with the finished
+        capture for that.
+        """
+        self.capture = LogicCapture(
+            channels=self.num_channels,
+            sample_rate=sample_rate,
+            samples=samples,
+        )
+        self._capture_key = None
+        self._decoded = None
+        self._update_display()
+
     def set_protocol(
         self,
         protocol: ProtocolType,
@@ -169,7 +270,7 @@ class LogicAnalyzerWidget(Widget):
         self._update_channel_labels()
 
         # Re-decode if we have capture data
-        if self.capture and self.capture.samples:
+        if self.capture and self.capture.sample_count:
             self._decode_protocol()
             self._update_display()
 
@@ -198,10 +299,11 @@ class LogicAnalyzerWidget(Widget):
 
     def _decode_protocol(self) -> None:
         """Decode the captured data using the current protocol"""
-        if not self.capture or not self.capture.samples:
+        if not self.capture or not self.capture.sample_count:
             return
 
-        self.capture.decoded = decode_protocol(
+        # Packed samples go straight through; only the mapped channels are unpacked
+        self._decoded = decode_protocol(
             samples=self.capture.samples,
             sample_rate=self.capture.sample_rate,
             protocol=self._protocol,
@@ -211,10 +313,10 @@ class LogicAnalyzerWidget(Widget):
 
     def get_decoded_summary(self) -> str:
         """Get a summary of decoded data"""
-        if not self.capture or not self.capture.decoded:
+        if not self.capture or not self._decoded:
             return "No decoded data"
 
-        decoded = self.capture.decoded
+        decoded = self._decoded
 
         if decoded.protocol == ProtocolType.SPI:
             tx_count = len(decoded.spi_transactions)
@@ -244,42 +346,36 @@ class LogicAnalyzerWidget(Widget):
 
     def _update_display(self) -> None:
         """Update the waveform display"""
-        if not self.capture or not self.capture.samples:
+        # Nothing to draw, or nothing to draw into until compose has run
+        if not self.capture or not self.capture.sample_count or self._scale_widget is None:
             return
 
         # Update scale
-        try:
-            scale_widget = self.query_one("#logic-scale", Static)
-            scale_widget.update(self._build_scale_line())
-        except Exception:
-            pass
+        self._scale_widget.update(self._build_scale_line())
+
+        # Unpack the visible window once for all channels (8-channel captures)
+        rows = None
+        if self.capture.samples.dtype == np.uint8:
+            start = self.waveform_offset
+            rows = unpack8(self.capture.samples[start:start + self.visible_samples])
 
         # Update each channel
-        for ch in range(min(self.num_channels, len(self.capture.samples))):
+        for ch in range(min(self.num_channels, self.capture.channels)):
             if not self.channel_configs[ch].enabled:
                 continue
 
-            try:
-                channel_widget = self.query_one(f"#logic-ch{ch}", Static)
-                waveform = self._render_channel(ch)
-                channel_widget.update(waveform)
-            except Exception:
-                pass
+            waveform = self._render_channel(ch, None if rows is None else rows[ch])
+            self._channel_widgets[ch].update(waveform)
 
         # Update protocol annotations
-        try:
-            annotations_widget = self.query_one("#logic-annotations", Static)
-            annotations = self._render_annotations()
-            annotations_widget.update(annotations)
-        except Exception:
-            pass
+        self._annotations_widget.update(self._render_annotations())
 
     def _render_annotations(self) -> str:
         """Render protocol annotations for the visible window"""
-        if not self.capture or not self.capture.decoded:
+        if not self.capture or not self._decoded:
             return ""
 
-        decoded = self.capture.decoded
+        decoded = self._decoded
         start = self.waveform_offset
         end = start + self.visible_samples
 
@@ -332,42 +428,29 @@ class LogicAnalyzerWidget(Widget):
 
         return label_pad + "".join(annotation_chars)
 
-    def _render_channel(self, channel: int) -> str:
-        """Render a single channel's waveform"""
-        if not self.capture or channel >= len(self.capture.samples):
+    def _render_channel(self, channel: int, bits: Optional[np.ndarray] = None) -> str:
+        """
+        Render a single channel's waveform.
+
+        bits is this channel's 0/1 row for the visible window when the
+        caller has already unpacked it; otherwise it is extracted here.
+        """
+        if not self.capture or channel >= self.capture.channels:
             return self._build_empty_channel(channel)
 
-        samples = self.capture.samples[channel]
-        label = f"CH{channel} "
+        label = _CHANNEL_LABELS[channel]
 
-        # Get visible window
-        start = self.waveform_offset
-        end = min(start + self.visible_samples, len(samples))
+        if bits is None:
+            # Extract this channel's bit for the visible columns only
+            start = self.waveform_offset
+            window = self.capture.samples[start:start + self.visible_samples]
+            bits = (window >> channel) & 1
 
-        if start >= len(samples):
+        if not bits.shape[0]:
             return f"{label}{self.LOW * self.visible_samples}"
 
-        # Build waveform
-        waveform = ""
-        prev_value = samples[start] if start < len(samples) else 0
-
-        for i in range(start, end):
-            if i >= len(samples):
-                waveform += self.LOW
-                continue
-
-            value = samples[i]
-
-            # Detect transitions
-            if value != prev_value:
-                if value > prev_value:
-                    waveform += self.RISING
-                else:
-                    waveform += self.FALLING
-            else:
-                waveform += self.HIGH if value else self.LOW
-
-            prev_value = value
+        # Level or transition glyph per sample, indexed by (previous, current)
+        waveform = waveform_glyphs(bits, (self.LOW, self.RISING, self.FALLING, self.HIGH))
 
         # Pad to visible width
         waveform = waveform.ljust(self.visible_samples, self.LOW)
@@ -382,7 +465,7 @@ class LogicAnalyzerWidget(Widget):
     def scroll_right(self, amount: int = 10) -> None:
         """Scroll right (later in time)"""
         if self.capture:
-            max_offset = max(0, len(self.capture.samples[0]) - self.visible_samples)
+            max_offset = max(0, self.capture.sample_count - self.visible_samples)
             self.waveform_offset = min(max_offset, self.waveform_offset + amount)
         self._update_display()
 
@@ -406,23 +489,10 @@ class LogicAnalyzerWidget(Widget):
 
     def load_demo_data(self) -> None:
         """Load demo capture data for testing"""
-        import random
-
-        # Generate some demo waveforms
-        samples = []
-        for ch in range(self.num_channels):
-            channel_samples = []
-            state = random.randint(0, 1)
-            for i in range(1000):
-                if random.random() < 0.05:  # 5% chance of transition
-                    state = 1 - state
-                channel_samples.append(state)
-            samples.append(channel_samples)
-
         capture = LogicCapture(
             channels=self.num_channels,
             sample_rate=1000000,
-            samples=samples,
+            samples=_demo_samples(self.num_channels),
             trigger_position=100
         )
 
@@ -516,13 +586,13 @@ class LogicAnalyzerPanel(Container):
                 yield Static("Rate:")
                 from textual.widgets import Select
                 yield Select(
-                    [("1MHz", "1000000"), ("10MHz", "10000000"), ("62.5MHz", "62500000")],
+                    _RATE_OPTIONS,
                     value="1000000",
                     id="logic-rate"
                 )
                 yield Static("Samples:")
                 yield Select(
-                    [("1K", "1024"), ("8K", "8192"), ("32K", "32768")],
+                    _SAMPLES_OPTIONS,
                     value="8192",
                     id="logic-samples"
                 )
@@ -537,23 +607,10 @@ class LogicAnalyzerPanel(Container):
 
     def load_demo_data(self) -> None:
         """Load demo capture data for testing"""
-        import random
-
-        # Generate some demo waveforms
-        samples = []
-        for ch in range(8):
-            channel_samples = []
-            state = random.randint(0, 1)
-            for i in range(1000):
-                if random.random() < 0.05:  # 5% chance of transition
-                    state = 1 - state
-                channel_samples.append(state)
-            samples.append(channel_samples)
-
         capture = LogicCapture(
             channels=8,
             sample_rate=1000000,
-            samples=samples,
+            samples=_demo_samples(8),
             trigger_position=100
         )
 
@@ -8,9 +8,11 @@ Decodes captured digital signals into protocol-specific data:
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple, Union
 from enum import Enum
 
+import numpy as np
+
 
 class ProtocolType(Enum):
     """Supported protocol types"""
@@ -456,8 +458,31 @@ class UARTDecoder:
         return frames
 
 
+class _PackedChannels:
+    """
+    Per-channel view of packed samples (bit N = channel N).
+
+    Behaves like the list of channel sample lists the decoders expect,
+    but only unpacks a channel when it is actually indexed.
+    """
+
+    def __init__(self, packed: np.ndarray):
+        self._packed = packed
+
+    def __len__(self) -> int:
+        return self._packed.dtype.itemsize * 8
+
+    def __bool__(self) -> bool:
+        return self._packed.size > 0
+
+    def __getitem__(self, channel: int) -> List[int]:
+        if channel < 0:
+            channel += len(self)
+        return ((self._packed >> channel) & 1).tolist()
+
+
 def decode_protocol(
-    samples: List[List[int]],
+    samples: Union[np.ndarray, Sequence[List[int]]],
     sample_rate: int,
     protocol: ProtocolType,
     channel_map: dict = None,
@@ -467,7 +492,8 @@ def decode_protocol(
     High-level protocol decoder.
 
     Args:
-        samples: List of channel sample lists
+        samples: Packed 1-D sample array (bit N = channel N), or a list
+            of per-channel sample lists
         sample_rate: Sample rate in Hz
         protocol: Protocol type to decode
         channel_map: Maps channel names to sample indices
@@ -481,6 +507,9 @@ def decode_protocol(
     """
     result = DecodedCapture(protocol=protocol)
 
+    if isinstance(samples, np.ndarray) and samples.ndim == 1:
+        samples = _PackedChannels(samples)
+
     if protocol == ProtocolType.NONE or not samples:
         return result
 
@@ -11,6 +11,7 @@ Features:
 - UART bridging
 """
 
+import asyncio
 from typing import List, Optional
 from dataclasses import dataclass
 
@@ -21,6 +22,20 @@ from textual.widgets import Static, Button, Input, Select, Switch, Log, TabbedCo
 from .base import DevicePanel, DeviceInfo, PanelCapability, CommandSuggestion
 
 
+# Select options, built once and shared by every panel instance
+_MODE_OPTIONS = tuple((m, m) for m in ("SPI", "I2C", "UART", "JTAG", "SWD"))
+_SPI_SPEED_OPTIONS = (("1MHz", "1000000"), ("4MHz", "4000000"), ("8MHz", "8000000"), ("24MHz", "24000000"))
+_SPI_MODE_OPTIONS = (("0", "0"), ("1", "1"), ("2", "2"), ("3", "3"))
+_DEBUG_INTERFACE_OPTIONS = (("SWD", "swd"), ("JTAG", "jtag"))
+_DEBUG_TARGET_OPTIONS = (
+    ("Auto", "auto"), ("STM32F1", "stm32f1x"), ("STM32F4", "stm32f4x"),
+    ("nRF52", "nrf52"), ("ESP32", "esp32"), ("RP2040", "rp2040"),
+)
+_DEBUG_SPEED_OPTIONS = (("1MHz", "1000"), ("2MHz", "2000"), ("4MHz", "4000"))
+_UART_BAUD_OPTIONS = (("9600", "9600"), ("115200", "115200"), ("921600", "921600"))
+_UART_FORMAT_OPTIONS = (("8N1", "8N1"), ("8E1", "8E1"), ("8O1", "8O1"))
+
+
 @dataclass
 class SPIFlashInfo:
     """SPI Flash identification"""
@@ -41,14 +56,24 @@ class TigardPanel(DevicePanel):
     """
 
     DEVICE_NAME = "Tigard"
-    CAPABILITIES = [
+    CAPABILITIES = (
         PanelCapability.SPI,
         PanelCapability.I2C,
         PanelCapability.UART,
         PanelCapability.JTAG,
         PanelCapability.SWD,
         PanelCapability.FLASH,
-    ]
+    )
+
+    SUGGESTIONS = (
+        CommandSuggestion("help", "Show available commands"),
+        CommandSuggestion("spi id", "Read SPI flash ID", "spi"),
+        CommandSuggestion("spi dump", "Dump SPI flash", "spi"),
+        CommandSuggestion("debug connect", "Connect via OpenOCD", "debug"),
+        CommandSuggestion("debug halt", "Halt target", "debug"),
+        CommandSuggestion("debug reset", "Reset target", "debug"),
+        CommandSuggestion("openocd start", "Start OpenOCD server", "openocd"),
+    )
 
     def __init__(self, device_info: DeviceInfo, app, *args, **kwargs):
         super().__init__(device_info, app, *args, **kwargs)
@@ -64,7 +89,7 @@ class TigardPanel(DevicePanel):
                 yield Static(f"Port: {self.device_info.port}", classes="device-port")
                 yield Static("Mode:", classes="mode-label")
                 yield Select(
-                    [(m, m) for m in ["SPI", "I2C", "UART", "JTAG", "SWD"]],
+                    _MODE_OPTIONS,
                     value="SPI",
                     id="tigard-mode",
                     classes="mode-select"
@@ -96,13 +121,13 @@ class TigardPanel(DevicePanel):
             with Grid(classes="config-grid"):
                 yield Static("Speed:")
                 yield Select(
-                    [("1MHz", "1000000"), ("4MHz", "4000000"), ("8MHz", "8000000"), ("24MHz", "24000000")],
+                    _SPI_SPEED_OPTIONS,
                     value="8000000",
                     id="spi-speed"
                 )
                 yield Static("Mode:")
                 yield Select(
-                    [("0", "0"), ("1", "1"), ("2", "2"), ("3", "3")],
+                    _SPI_MODE_OPTIONS,
                     value="0",
                     id="spi-mode"
                 )
@@ -140,20 +165,19 @@ class TigardPanel(DevicePanel):
             with Grid(classes="config-grid"):
                 yield Static("Interface:")
                 yield Select(
-                    [("SWD", "swd"), ("JTAG", "jtag")],
+                    _DEBUG_INTERFACE_OPTIONS,
                     value="swd",
                     id="debug-interface"
                 )
                 yield Static("Target:")
                 yield Select(
-                    [("Auto", "auto"), ("STM32F1", "stm32f1x"), ("STM32F4", "stm32f4x"),
-                     ("nRF52", "nrf52"), ("ESP32", "esp32"), ("RP2040", "rp2040")],
+                    _DEBUG_TARGET_OPTIONS,
                     value="auto",
                     id="debug-target"
                 )
                 yield Static("Speed:")
                 yield Select(
-                    [("1MHz", "1000"), ("2MHz", "2000"), ("4MHz", "4000")],
+                    _DEBUG_SPEED_OPTIONS,
                     value="1000",
                     id="debug-speed"
                 )
@@ -191,13 +215,13 @@ class TigardPanel(DevicePanel):
             with Grid(classes="config-grid"):
                 yield Static("Baud:")
                 yield Select(
-                    [("9600", "9600"), ("115200", "115200"), ("921600", "921600")],
+                    _UART_BAUD_OPTIONS,
                     value="115200",
                     id="uart-baud"
                 )
                 yield Static("Format:")
                 yield Select(
-                    [("8N1", "8N1"), ("8E1", "8E1"), ("8O1", "8O1")],
+                    _UART_FORMAT_OPTIONS,
                     value="8N1",
                     id="uart-format"
                 )
@@ -260,24 +284,6 @@ class TigardPanel(DevicePanel):
         else:
             self.log_output(f"Unknown command: {cmd}")
 
-    def get_command_suggestions(self, partial: str) -> List[CommandSuggestion]:
-        """Get suggestions"""
-        suggestions = [
-            CommandSuggestion("help", "Show available commands"),
-            CommandSuggestion("spi id", "Read SPI flash ID", "spi"),
-            CommandSuggestion("spi dump", "Dump SPI flash", "spi"),
-            CommandSuggestion("debug connect", "Connect via OpenOCD", "debug"),
-            CommandSuggestion("debug halt", "Halt target", "debug"),
-            CommandSuggestion("debug reset", "Reset target", "debug"),
-            CommandSuggestion("openocd start", "Start OpenOCD server", "openocd"),
-        ]
-
-        if partial:
-            partial_lower = partial.lower()
-            suggestions = [s for s in suggestions if s.command.lower().startswith(partial_lower)]
-
-        return suggestions
-
     def _show_help(self) -> None:
         """Display help"""
         help_text = """
@@ -413,7 +419,6 @@ Tigard Commands:
         self.log_output(f"[*] Dumping {size:,} bytes from 0x{address:06X} to {filename}...")
 
         try:
-            import asyncio
             from pathlib import Path
 
             data = bytearray()
@@ -462,7 +467,6 @@ Tigard Commands:
     async def _spi_write(self, filename: str, address: int = 0) -> None:
         """Write file to SPI flash"""
         from pathlib import Path
-        import asyncio
 
         path = Path(filename)
         if not path.exists():
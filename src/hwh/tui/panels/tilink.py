@@ -25,6 +25,13 @@ from textual.widgets import Static, Button, Input, Select, Switch, Log, TabbedCo
 from .base import DevicePanel, DeviceInfo, PanelCapability, CommandSuggestion
 
 
+# Select options, built once and shared by every panel instance
+_VOLTAGE_OPTIONS = (("3.3V", "3.3"), ("2.5V", "2.5"), ("1.8V", "1.8"))
+_INTERFACE_OPTIONS = (("Auto", "auto"), ("JTAG", "jtag"), ("Spy-Bi-Wire", "sbw"), ("SWD", "swd"))
+_SPEED_OPTIONS = (("Fast", "fast"), ("Medium", "medium"), ("Slow", "slow"))
+_BAUD_OPTIONS = (("9600", "9600"), ("115200", "115200"))
+
+
 @dataclass
 class MSPTarget:
     """MSP target information"""
@@ -42,14 +49,25 @@ class TILinkPanel(DevicePanel):
     """
 
     DEVICE_NAME = "TI-Link"
-    CAPABILITIES = [
+    CAPABILITIES = (
         PanelCapability.JTAG,
         PanelCapability.SWD,
         PanelCapability.DEBUG,
         PanelCapability.FLASH,
         PanelCapability.UART,
         PanelCapability.POWER,
-    ]
+    )
+
+    SUGGESTIONS = (
+        CommandSuggestion("help", "Show available commands"),
+        CommandSuggestion("connect", "Connect to target"),
+        CommandSuggestion("reset", "Reset target"),
+        CommandSuggestion("halt", "Halt target"),
+        CommandSuggestion("run", "Run target"),
+        CommandSuggestion("program", "Program flash", "program"),
+        CommandSuggestion("md 0x0000 0x100", "Dump memory", "memory"),
+        CommandSuggestion("mspdebug tilib", "Run mspdebug with tilib", "mspdebug"),
+    )
 
     def __init__(self, device_info: DeviceInfo, app, *args, **kwargs):
         super().__init__(device_info, app, *args, **kwargs)
@@ -65,7 +83,7 @@ class TILinkPanel(DevicePanel):
                 yield Static(f"Port: {self.device_info.port}", classes="device-port")
                 yield Static("Voltage:", classes="voltage-label")
                 yield Select(
-                    [("3.3V", "3.3"), ("2.5V", "2.5"), ("1.8V", "1.8")],
+                    _VOLTAGE_OPTIONS,
                     value="3.3",
                     id="tilink-voltage"
                 )
@@ -99,13 +117,13 @@ class TILinkPanel(DevicePanel):
             with Grid(classes="config-grid"):
                 yield Static("Interface:")
                 yield Select(
-                    [("Auto", "auto"), ("JTAG", "jtag"), ("Spy-Bi-Wire", "sbw"), ("SWD", "swd")],
+                    _INTERFACE_OPTIONS,
                     value="auto",
                     id="debug-interface"
                 )
                 yield Static("Speed:")
                 yield Select(
-                    [("Fast", "fast"), ("Medium", "medium"), ("Slow", "slow")],
+                    _SPEED_OPTIONS,
                     value="fast",
                     id="debug-speed"
                 )
@@ -191,7 +209,7 @@ class TILinkPanel(DevicePanel):
             with Grid(classes="config-grid"):
                 yield Static("Baud:")
                 yield Select(
-                    [("9600", "9600"), ("115200", "115200")],
+                    _BAUD_OPTIONS,
                     value="9600",
                     id="uart-baud"
                 )
@@ -261,25 +279,6 @@ class TILinkPanel(DevicePanel):
             # Pass through to mspdebug
             await self._run_mspdebug(parts)
 
-    def get_command_suggestions(self, partial: str) -> List[CommandSuggestion]:
-        """Get suggestions"""
-        suggestions = [
-            CommandSuggestion("help", "Show available commands"),
-            CommandSuggestion("connect", "Connect to target"),
-            CommandSuggestion("reset", "Reset target"),
-            CommandSuggestion("halt", "Halt target"),
-            CommandSuggestion("run", "Run target"),
-            CommandSuggestion("program", "Program flash", "program"),
-            CommandSuggestion("md 0x0000 0x100", "Dump memory", "memory"),
-            CommandSuggestion("mspdebug tilib", "Run mspdebug with tilib", "mspdebug"),
-        ]
-
-        if partial:
-            partial_lower = partial.lower()
-            suggestions = [s for s in suggestions if s.command.lower().startswith(partial_lower)]
-
-        return suggestions
-
     def _show_help(self) -> None:
         """Display help"""
         help_text = """
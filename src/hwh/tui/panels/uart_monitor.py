@@ -24,6 +24,13 @@ from textual.messages import Message
 from .base import DevicePanel, DeviceInfo, PanelCapability, CommandSuggestion
 
 
+# Select options, built once and shared by every panel instance
+_BAUD_OPTIONS = tuple(
+    (baud, baud) for baud in ("9600", "19200", "38400", "57600", "115200", "230400", "460800", "921600")
+)
+_FORMAT_OPTIONS = tuple((fmt, fmt) for fmt in ("8N1", "8E1", "8O1", "7E1", "7O1"))
+
+
 @dataclass
 class UartFilter:
     """UART output filter with regex pattern and color"""
@@ -52,7 +59,16 @@ class UARTMonitorPanel(DevicePanel):
     """
 
     DEVICE_NAME = "UART Monitor"
-    CAPABILITIES = [PanelCapability.UART]
+    CAPABILITIES = (PanelCapability.UART,)
+
+    SUGGESTIONS = (
+        CommandSuggestion("help", "Show available commands"),
+        CommandSuggestion("filter add", "Add a regex filter", "filter"),
+        CommandSuggestion("filter remove", "Remove a filter", "filter"),
+        CommandSuggestion("filter list", "List active filters", "filter"),
+        CommandSuggestion("clear", "Clear output"),
+        CommandSuggestion("send", "Send data to UART"),
+    )
 
     # Default filter colors
     FILTER_COLORS = [
@@ -96,17 +112,14 @@ class UARTMonitorPanel(DevicePanel):
             with Horizontal(classes="uart-config"):
                 yield Static("Baud:")
                 yield Select(
-                    [("9600", "9600"), ("19200", "19200"), ("38400", "38400"),
-                     ("57600", "57600"), ("115200", "115200"), ("230400", "230400"),
-                     ("460800", "460800"), ("921600", "921600")],
+                    _BAUD_OPTIONS,
                     value="115200",
                     id="uart-baud",
                     classes="uart-select"
                 )
                 yield Static("Format:")
                 yield Select(
-                    [("8N1", "8N1"), ("8E1", "8E1"), ("8O1", "8O1"),
-                     ("7E1", "7E1"), ("7O1", "7O1")],
+                    _FORMAT_OPTIONS,
                     value="8N1",
                     id="uart-format",
                     classes="uart-select"
@@ -206,7 +219,7 @@ class UARTMonitorPanel(DevicePanel):
         while self.connected and self._serial:
             try:
                 # Read available data
-                data = await asyncio.get_event_loop().run_in_executor(
+                data = await asyncio.get_running_loop().run_in_executor(
                     None,
                     lambda: self._serial.read(self._serial.in_waiting or 1)
                 )
@@ -386,23 +399,6 @@ class UARTMonitorPanel(DevicePanel):
         except Exception:
             pass
 
-    def get_command_suggestions(self, partial: str) -> List[CommandSuggestion]:
-        """Get suggestions"""
-        suggestions = [
-            CommandSuggestion("help", "Show available commands"),
-            CommandSuggestion("filter add", "Add a regex filter", "filter"),
-            CommandSuggestion("filter remove", "Remove a filter", "filter"),
-            CommandSuggestion("filter list", "List active filters", "filter"),
-            CommandSuggestion("clear", "Clear output"),
-            CommandSuggestion("send", "Send data to UART"),
-        ]
-
-        if partial:
-            partial_lower = partial.lower()
-            suggestions = [s for s in suggestions if s.command.lower().startswith(partial_lower)]
-
-        return suggestions
-
     def _show_help(self) -> None:
         """Display help"""
         help_text = """
@@ -0,0 +1,269 @@
+"""Tests for SUMP sample unpacking and logic capture containers."""
+
+import io
+from dataclasses import FrozenInstanceError
+
+import numpy as np
+import pytest
+
+from hwh.backends.sump import SUMPClient, SUMPConfig, find_edge, pack_samples, unpack_samples
+from hwh.logic_kernels import HAS_NUMBA, find_edge_compiled, unpack8, waveform_glyphs
+from hwh.tui.panels.logic_analyzer import LogicAnalyzerWidget, LogicCapture, _demo_samples
+from hwh.tui.panels.protocol_decoders import ProtocolType, decode_protocol
+
+
+class TestUnpackSamples:
+    """Test conversion of raw SUMP bytes into channel rows."""
+
+    def test_shape_and_dtype(self):
+        """Test that 8-channel data unpacks to a (channels, samples) uint8 array."""
+        samples = unpack_samples(bytes([0x00, 0xFF, 0x01]), channels=8)
+        assert samples.shape == (8, 3)
+        assert samples.dtype == np.uint8
+
+    def test_reverse_order_and_bit_mapping(self):
+        """Test that newest-first SUMP data comes back in capture order, LSB = CH0."""
+        # Sent newest first: 0x02, then 0x01
+        samples = unpack_samples(bytes([0x02, 0x01]), channels=8)
+        assert samples[0].tolist() == [1, 0]
+        assert samples[1].tolist() == [0, 1]
+        assert samples[2:].sum() == 0
+
+    def test_empty_data(self):
+        """Test that no data yields an empty array."""
+        samples = unpack_samples(b"", channels=8)
+        assert samples.shape == (8, 0)
+
+
+class TestPackSamples:
+    """Test conversion of raw SUMP bytes into packed samples."""
+
+    def test_8_channels_reversed(self):
+        """Test that 8-channel data stays one byte per sample, in capture order."""
+        samples = pack_samples(bytes([0x03, 0x02, 0x01]), channels=8)
+        assert samples.dtype == np.uint8
+        assert samples.tolist() == [0x01, 0x02, 0x03]
+
+    def test_16_channels(self):
+        """Test that 16-channel data is read as little-endian words."""
+        samples = pack_samples(bytes([0x34, 0x12, 0x01, 0x00]), channels=16)
+        assert samples.dtype == np.uint16
+        assert samples.tolist() == [0x0001, 0x1234]
+
+
+class TestParseCapture:
+    """Test SUMPClient capture parsing."""
+
+    def test_trigger_position(self):
+        """Test that the first sample matching the trigger pattern is found."""
+        client = SUMPClient(serial_port=None)
+        client._config = SUMPConfig(trigger_mask=0x04, trigger_value=0x04)
+        # Capture order 0x00, 0x00, 0x04, 0x04 (sent newest first)
+        capture = client._parse_capture(bytes([0x04, 0x04, 0x00, 0x00]))
+        assert capture.trigger_position == 2
+        assert capture.samples.tolist() == [0x00, 0x00, 0x04, 0x04]
+
+    def test_trigger_prefers_edge(self):
+        """Test that a line already at the trigger level is skipped to its edge."""
+        client = SUMPClient(serial_port=None)
+        client._config = SUMPConfig(trigger_mask=0x02, trigger_value=0x02)
+        samples = np.array([0x02, 0x00, 0x00, 0x02, 0x02], dtype=np.uint8)
+        assert client.find_trigger(samples) == 3
+
+    def test_capture_is_frozen(self):
+        """Test that parsed captures cannot be modified."""
+        client = SUMPClient(serial_port=None)
+        capture = client._parse_capture(bytes([0x01, 0x00]))
+        with pytest.raises(FrozenInstanceError):
+            capture.trigger_position = 1
+
+
+class TestFindEdge:
+    """Test SWAR edge search over packed samples."""
+
+    def test_matches_bytewise_scan(self):
+        """Test edges across word boundaries, padding and both directions."""
+        rng = np.random.default_rng(1)
+        for n in (0, 1, 7, 8, 9, 31, 100):
+            samples = rng.integers(0, 256, size=n, dtype=np.uint8)
+            for channel in range(8):
+                bit = (samples >> channel) & 1
+                rise = np.flatnonzero(~bit[:-1] & bit[1:] & 1) + 1
+                fall = np.flatnonzero(bit[:-1] & ~bit[1:] & 1) + 1
+                assert find_edge(samples, 1 << channel) == (rise[0] if rise.size else -1)
+                assert find_edge(samples, 1 << channel, rising=False) == (fall[0] if fall.size else -1)
+
+    def test_reversed_view(self):
+        """Test that non-contiguous input (reversed SUMP buffers) works."""
+        samples = np.array([0x01, 0x01, 0x00, 0x00], dtype=np.uint8)[::-1]
+        assert find_edge(samples, 0x01) == 2
+
+
+class TestLogicKernels:
+    """Test per-channel unpacking and glyph rendering."""
+
+    def test_unpack8_rows(self):
+        """Test that row c holds bit c of each packed sample."""
+        buf = np.array([0x01, 0x80, 0xFF, 0x00], dtype=np.uint8)
+        rows = unpack8(buf)
+        assert rows.shape == (8, 4)
+        assert rows[0].tolist() == [1, 0, 1, 0]
+        assert rows[7].tolist() == [0, 1, 1, 0]
+
+    def test_waveform_glyphs(self):
+        """Test level and transition glyphs, first sample as a level."""
+        bits = np.array([1, 1, 0, 0, 1], dtype=np.uint8)
+        assert waveform_glyphs(bits, ("L", "R", "F", "H")) == "HHFLR"
+
+    @pytest.mark.skipif(not HAS_NUMBA, reason="numba not installed")
+    def test_compiled_edge_matches_swar(self):
+        """Test that the compiled edge scan agrees with the mask/direction rules."""
+        samples = np.array([0x00, 0x03, 0x01, 0x00, 0x02], dtype=np.uint8)
+        assert find_edge_compiled(samples, 0x01) == 1
+        assert find_edge_compiled(samples, 0x02, rising=False) == 2
+        assert find_edge_compiled(samples, 0x04) == -1
+        assert find_edge_compiled(samples[:1], 0x01) == -1
+
+
+class TestLogicCapture:
+    """Test LogicCapture sample accessors."""
+
+    def test_sample_count_from_array(self):
+        """Test sample_count with ndarray samples."""
+        capture = LogicCapture(samples=np.zeros(42, dtype=np.uint8))
+        assert capture.sample_count == 42
+
+    def test_channel_extraction(self):
+        """Test that channel() returns one bit per sample."""
+        capture = LogicCapture(samples=np.array([0x01, 0x02, 0x03], dtype=np.uint8))
+        assert capture.channel(0).tolist() == [1, 0, 1]
+        assert capture.channel(1).tolist() == [0, 1, 1]
+
+    def test_lists_are_converted(self):
+        """Test that per-channel lists are packed into a uint8 array."""
+        capture = LogicCapture(samples=[[0, 1, 1], [1, 0, 0]])
+        assert capture.samples.dtype == np.uint8
+        assert capture.samples.tolist() == [0x02, 0x01, 0x01]
+
+    def test_bytes_are_viewed(self):
+        """Test that packed bytes and per-channel bytearrays are accepted."""
+        packed = LogicCapture(samples=bytes([0x01, 0x02, 0x03]))
+        assert packed.samples.dtype == np.uint8
+        assert packed.channel(1).tolist() == [0, 1, 1]
+
+        rows = LogicCapture(samples=[bytearray([0, 1, 1]), bytearray([1, 0, 0])])
+        assert rows.samples.tolist() == [0x02, 0x01, 0x01]
+
+    def test_sample_count_empty(self):
+        """Test sample_count with no samples."""
+        assert LogicCapture().sample_count == 0
+
+    def test_frozen(self):
+        """Test that captures are immutable and hashable by identity."""
+        capture = LogicCapture(samples=np.zeros(4, dtype=np.uint8))
+        with pytest.raises(FrozenInstanceError):
+            capture.trigger_position = 1
+        assert hash(capture) == hash(capture)
+
+    def test_demo_samples_packed(self):
+        """Test that demo data is generated directly as packed bytes."""
+        samples = _demo_samples(8, 500)
+        assert samples.dtype == np.uint8
+        assert samples.shape == (500,)
+
+
+class TestSetCapture:
+    """Test LogicAnalyzerWidget capture updates."""
+
+    def test_identical_capture_skips_redraw(self):
+        """Test that re-setting the same data does not redraw."""
+        widget = LogicAnalyzerWidget()
+        redraws = []
+        widget._update_display = lambda: redraws.append(1)
+
+        widget.set_capture(LogicCapture(samples=np.array([1, 2, 3], dtype=np.uint8)))
+        widget.set_capture(LogicCapture(samples=np.array([1, 2, 3], dtype=np.uint8)))
+        assert len(redraws) == 1
+
+        widget.set_capture(LogicCapture(samples=np.array([1, 2, 4], dtype=np.uint8)))
+        assert len(redraws) == 2
+
+
+class _FakeSerial:
+    """Minimal serial stand-in that replays a fixed byte stream."""
+
+    def __init__(self, data: bytes):
+        self._stream = io.BytesIO(data)
+        self.timeout = 1.0
+
+    def reset_input_buffer(self):
+        pass
+
+    def write(self, data):
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def read(self, size):
+        return self._stream.read(size)
+
+    def readinto(self, buffer):
+        return self._stream.readinto(buffer)
+
+
+class TestCaptureInto:
+    """Test reading capture data into a caller-provided buffer."""
+
+    def test_fills_buffer_in_wire_order(self):
+        """Test that chunks land in place and byte counts are reported."""
+        client = SUMPClient(_FakeSerial(bytes([4, 3, 2, 1])), read_chunk_size=3)
+        client._config = SUMPConfig(sample_count=4)
+        buffer = np.zeros(4, dtype=np.uint8)
+
+        counts = list(client.capture_into(buffer, timeout=1.0))
+
+        assert counts == [3, 4]
+        assert buffer[::-1].tolist() == [1, 2, 3, 4]
+
+    def test_capture_parses_samples(self):
+        """Test that capture() returns samples in capture order."""
+        client = SUMPClient(_FakeSerial(bytes([4, 3, 2, 1])), read_chunk_size=3)
+        client._config = SUMPConfig(sample_count=4)
+        capture = client.capture(timeout=1.0)
+        assert capture.samples.tolist() == [1, 2, 3, 4]
+
+
+class TestCommandBatching:
+    """Test that SUMP commands are coalesced into single writes."""
+
+    def test_configure_single_write(self):
+        """Test that configure() sends its whole command sequence at once."""
+        writes = []
+        serial_port = _FakeSerial(b"")
+        serial_port.write = lambda data: writes.append(data) or len(data)
+        client = SUMPClient(serial_port)
+
+        client.configure(SUMPConfig(trigger_mask=0x01, trigger_value=0x01))
+
+        assert len(writes) == 1
+        # Divider, count, flags, trigger mask/value/config: 6 long commands
+        assert len(writes[0]) == 6 * 5
+
+
+class TestPackedDecode:
+    """Test protocol decoding straight from packed samples."""
+
+    def test_packed_matches_channel_lists(self):
+        """Test that packed and per-channel inputs decode identically."""
+        # UART 'A' (0x41) on CH5 at 8 samples per bit, idle high
+        bits = [1] * 8 + [0] + [(0x41 >> i) & 1 for i in range(8)] + [1] * 3
+        rx = np.repeat(np.array(bits, dtype=np.uint8), 8)
+        packed = rx << 5
+
+        kwargs = dict(sample_rate=8 * 115200, protocol=ProtocolType.UART, baud_rate=115200)
+        from_packed = decode_protocol(packed, **kwargs)
+        from_lists = decode_protocol([((packed >> ch) & 1).tolist() for ch in range(8)], **kwargs)
+
+        assert [f.byte.value for f in from_packed.uart_frames] == [0x41]
+        assert from_packed.annotations == from_lists.annotations